@@ -6,10 +6,19 @@ with lifecycle hooks, and per-block result aggregation.
 
 import numpy as np
 from typing import Callable, Any, List, Dict, Optional, overload
-from psychopy import core, logging
+from psychopy import logging
 from typing import Union, List, Dict, Literal
 import re
 import random
+from .sim.context import get_context, get_session_clock
+from .sim.plan import ActionPlan
+from .sim.rng import RngStreams, active_rng_streams, rng_streams
+from .utils.checkpoint import CheckpointState, CheckpointWriter
+from .utils.idle import IdleScheduler, IdleTask, idle_scheduler
+from .utils.jitter import JitterSchedule, plan_jitter, planned_jitter
+from .utils.results import ResultStore
+from .utils.sequencing import SequenceConstraints, generate_sequence
+from .utils.trials import reset_trial_counter
 
 
 class BlockUnit:
@@ -36,10 +45,14 @@ class BlockUnit:
         Seed used for randomisation.
     conditions : list of Any or None
         Ordered list of condition labels for each trial.
-    results : list of dict
-        Accumulated trial results after :meth:`run_trial`.
+    results : ResultStore
+        Accumulated trial results after :meth:`run_trial`, stored column-wise;
+        rows behave like dicts.
     meta : dict
         Additional block metadata such as start time and duration.
+    checkpoint : CheckpointWriter or None
+        Writer that persists each trial as it completes (see
+        :meth:`set_checkpoint`).
     """
 
     def __init__(
@@ -82,8 +95,11 @@ class BlockUnit:
 
         self.conditions: Optional[np.ndarray] = None
 
-        self.results: List[Dict[str, Any]] = []
+        self.results: ResultStore = ResultStore()
         self.meta: Dict[str, Any] = {}
+        self.checkpoint: Optional[CheckpointWriter] = None
+        self.jitter: Optional[JitterSchedule] = None
+        self._resume_at = 0
 
         self._on_start: List[Callable[['BlockUnit'], None]] = []
         self._on_end: List[Callable[['BlockUnit'], None]] = []
@@ -96,6 +112,7 @@ class BlockUnit:
         weights: Optional[List[float]] = None,
         order: Literal['random', 'sequential'] = 'random',
         seed: Optional[int] = None,
+        constraints: Optional[Union[SequenceConstraints, Dict[str, Any]]] = None,
         **kwargs
     ) -> "BlockUnit":
         """
@@ -121,6 +138,11 @@ class BlockUnit:
         seed : int, optional
             Overrides `self.seed` for this generation call, without mutating
             the block's stored seed.
+        constraints : SequenceConstraints or dict, optional
+            Order constraints for the random order (maximum run length, no
+            repeats, minimum spacing, transition counterbalancing); see
+            :func:`~psyflow.utils.sequencing.generate_sequence`. The
+            generation report is stored in ``self.meta['sequence']``.
         **kwargs : dict
             Extra keyword arguments passed to `func` when used.
 
@@ -165,7 +187,16 @@ class BlockUnit:
                     counts[labels.index(lbl)] += 1
 
             # build the sequence
-            if order == 'sequential':
+            if constraints is not None:
+                if order == 'sequential':
+                    raise ValueError("constraints require order='random'.")
+                result, report = generate_sequence(labels, counts, constraints, rng=RngStreams(use_seed))
+                self.meta['sequence'] = report.to_dict()
+                logging.data(
+                    f"[BlockUnit] Constrained sequence via {report.method}: "
+                    f"{report.attempts} attempt(s), {report.elapsed_s * 1000:.1f} ms"
+                )
+            elif order == 'sequential':
                 seq = []
                 cnts = counts.copy()
                 while sum(cnts) > 0:
@@ -204,6 +235,172 @@ class BlockUnit:
         self.conditions = condition_list
         return self
 
+    def set_checkpoint(self, writer: Optional[CheckpointWriter]) -> "BlockUnit":
+        """
+        Persist the condition schedule and every trial result to ``writer``.
+
+        Parameters
+        ----------
+        writer : CheckpointWriter or None
+            Append-only checkpoint writer; ``None`` disables checkpointing.
+
+        Returns
+        -------
+        BlockUnit
+            The same instance for method chaining.
+        """
+        self.checkpoint = writer
+        return self
+
+    def resume_from(self, state: Optional[CheckpointState]) -> "BlockUnit":
+        """
+        Restore this block from a checkpoint loaded with :func:`load_checkpoint`.
+
+        Saved results are reloaded, the saved condition schedule replaces the
+        current one, the session trial counter continues after the last saved
+        ``trial_id``, and :meth:`run_trial` starts at the first unfinished
+        trial. Blocks absent from the checkpoint are left unchanged.
+
+        Parameters
+        ----------
+        state : CheckpointState or None
+            Checkpoint contents; ``None`` (a fresh session) is a no-op.
+
+        Returns
+        -------
+        BlockUnit
+            The same instance for method chaining.
+        """
+        if state is None:
+            return self
+        if state.last_trial_id is not None:
+            reset_trial_counter(state.last_trial_id)
+        saved = state.blocks.get(self.block_id)
+        if saved is None:
+            return self
+        if saved.conditions is not None:
+            self.conditions = list(saved.conditions)
+        self.results = ResultStore(saved.results)
+        self._resume_at = len(saved.results)
+        logging.data(
+            f"[BlockUnit] Resuming '{self.block_id}' at trial {self._resume_at} "
+            f"({len(saved.remaining_conditions)} remaining)"
+        )
+        return self
+
+    def plan_jitter(
+        self,
+        specs: Dict[str, Any],
+        *,
+        frame_time: Optional[float] = None,
+    ) -> "BlockUnit":
+        """
+        Pre-sample the jittered stage durations of every trial in the block.
+
+        Durations are drawn from the block's random streams (so they follow
+        the block seed) and stored in ``self.jitter``. While a trial runs,
+        StimUnit stages whose label appears in ``specs`` and whose duration is
+        a ``(min, max)`` range use the planned value for that trial.
+
+        Parameters
+        ----------
+        specs : dict
+            Stage label to :class:`~psyflow.utils.jitter.JitterSpec`, a spec
+            mapping (``{"dist": "exponential", "low": 2, "mean": 1.5, "high": 8}``)
+            or a ``(min, max)`` pair.
+        frame_time : float, optional
+            Frame period used to round durations to whole frames. Defaults to
+            the window's ``monitorFramePeriod`` if it has one.
+
+        Returns
+        -------
+        BlockUnit
+            The same instance for method chaining.
+        """
+        if self.conditions is None:
+            raise RuntimeError(
+                f"BlockUnit '{self.block_id}' has no conditions. "
+                "Call generate_conditions() before plan_jitter()."
+            )
+        if frame_time is None:
+            period = getattr(self.win, "monitorFramePeriod", None)
+            frame_time = float(period) if isinstance(period, (int, float)) and period > 0 else None
+        self.jitter = plan_jitter(
+            specs,
+            conditions=list(self.conditions),
+            frame_time=frame_time,
+            rng=self._rng_streams(),
+        )
+        logging.data(f"[BlockUnit] Planned jitter for {self.jitter.stages} in '{self.block_id}'")
+        return self
+
+    def _rng_streams(self) -> RngStreams:
+        # Under the session's streams when there are any (sim/qa), otherwise
+        # rooted at the block seed.
+        session_streams = active_rng_streams(fallback=False)
+        if session_streams is not None:
+            return session_streams.child("block", self.block_id)
+        return RngStreams(self.seed)
+
+    def plan_responses(self, observe: Callable[[Any, int], Any]) -> "BlockUnit":
+        """
+        Precompute the simulated responses of the whole block in one batch.
+
+        In qa/sim mode with a responder that implements ``act_batch``, the
+        observations of every remaining trial are collected and passed to it
+        in a single call. ``capture_response`` then consumes the planned
+        actions (validated by the responder adapter as usual) instead of
+        calling ``act`` per window. Otherwise this is a no-op.
+
+        Parameters
+        ----------
+        observe : Callable
+            ``observe(condition, trial_index)`` returning the
+            :class:`~psyflow.sim.Observation` of the trial's response window,
+            a list of them (one per window), or ``None``. Fields only known at
+            run time, such as onset stamps or ``trial_id``, may be left unset.
+
+        Returns
+        -------
+        BlockUnit
+            The same instance for method chaining.
+        """
+        ctx = get_context()
+        responder = getattr(ctx, "responder", None) if ctx is not None else None
+        if ctx is None or ctx.mode not in ("qa", "sim") or not callable(getattr(responder, "act_batch", None)):
+            return self
+        if self.conditions is None:
+            raise RuntimeError(
+                f"BlockUnit '{self.block_id}' has no conditions. "
+                "Call generate_conditions() before plan_responses()."
+            )
+
+        observations = []
+        for i, cond in enumerate(self.conditions):
+            if i < self._resume_at:
+                continue
+            out = observe(cond, i)
+            for obs in (out if isinstance(out, (list, tuple)) else [out]):
+                if obs is None:
+                    continue
+                if obs.mode is None:
+                    obs.mode = ctx.mode
+                if obs.block_id is None:
+                    obs.block_id = self.block_id
+                observations.append(obs)
+
+        if ctx.action_plan is None:
+            ctx.action_plan = ActionPlan()
+        try:
+            n = ctx.action_plan.submit(observations, responder)
+        except Exception as e:
+            if str(getattr(ctx.config, "sim_policy", "warn")) == "strict":
+                raise
+            logging.warning(f"[BlockUnit] act_batch failed for '{self.block_id}', falling back to act(): {e}")
+            return self
+        logging.data(f"[BlockUnit] Planned {n} responses for '{self.block_id}'")
+        return self
+
     @overload
     def on_start(self, func: None = None) -> Callable[[Callable[['BlockUnit'], None]], 'BlockUnit']:
         ...
@@ -254,7 +451,14 @@ class BlockUnit:
         self._on_end.append(func)
         return self
 
-    def run_trial(self, func: Callable, **kwargs) -> "BlockUnit":
+    def run_trial(
+        self,
+        func: Callable,
+        *,
+        prefetch: Optional[Callable] = None,
+        prefetch_budget: Optional[float] = None,
+        **kwargs,
+    ) -> "BlockUnit":
         """
         Run all trials using a specified trial function.
 
@@ -262,8 +466,20 @@ class BlockUnit:
         ----------
         func : Callable
             Function to run each trial. Must accept ``(win, kb, settings, condition, **kwargs)``.
+        prefetch : Callable, optional
+            Preparation for the *next* trial, called as
+            ``prefetch(win, kb, settings, next_condition, **kwargs)``. It runs
+            in the idle time of display stages that opt in with
+            ``show(..., idle_work=True)`` (typically the ITI) and its return
+            value is passed to ``func`` as ``prefetched=``. A generator
+            function is resumed once per slice, so ``yield`` between steps to
+            stay within the frame budget. Work left over when the next trial
+            starts is finished first. The first trial's preparation runs
+            before it starts.
+        prefetch_budget : float, optional
+            Seconds of prefetch work per frame (default: half a frame).
         **kwargs : dict
-            Additional keyword arguments forwarded to ``func``.
+            Additional keyword arguments forwarded to ``func`` (and ``prefetch``).
         """
         if self.conditions is None:
             raise RuntimeError(
@@ -271,14 +487,43 @@ class BlockUnit:
                 "Call generate_conditions() before run_trial()."
             )
 
-        self.meta['block_start_time'] = core.getAbsTime()
+        self.meta['block_start_time'] = get_session_clock().getAbsTime()
         self.logging_block_info()
 
         for hook in self._on_start:
             hook(self)
 
+        checkpoint = self.checkpoint
+        if checkpoint is not None:
+            checkpoint.block_start(
+                self.block_id, block_idx=self.block_idx, seed=self.seed, conditions=self.conditions
+            )
+
+        scheduler = IdleScheduler(prefetch_budget) if prefetch is not None else None
+        prefetched: Dict[int, IdleTask] = {}
+
+        block_streams = self._rng_streams()
+
+        def _prefetch(index: int) -> None:
+            if scheduler is not None and index < len(self.conditions):
+                # The task keeps the context it is submitted in: its own trial's jitter.
+                with rng_streams(block_streams), planned_jitter(self.jitter, index):
+                    prefetched[index] = scheduler.submit(
+                        prefetch, self.win, self.kb, self.settings, self.conditions[index], **kwargs
+                    )
+
+        _prefetch(self._resume_at)
         for i, cond in enumerate(self.conditions):
-            result = func(self.win, self.kb, self.settings, cond, **kwargs)
+            if i < self._resume_at:
+                continue
+            with rng_streams(block_streams), planned_jitter(self.jitter, i):
+                if scheduler is None:
+                    result = func(self.win, self.kb, self.settings, cond, **kwargs)
+                else:
+                    prepared = prefetched.pop(i).result()
+                    _prefetch(i + 1)
+                    with idle_scheduler(scheduler):
+                        result = func(self.win, self.kb, self.settings, cond, prefetched=prepared, **kwargs)
             if not isinstance(result, dict):
                 func_name = getattr(func, "__name__", None)
                 if func_name is None and hasattr(func, "func"):
@@ -295,13 +540,26 @@ class BlockUnit:
                 "condition": cond
             })
             self.results.append(result)
+            if checkpoint is not None:
+                checkpoint.trial(self.block_id, i, result)
 
         for hook in self._on_end:
             hook(self)
 
-        self.meta['block_end_time'] = core.getAbsTime()
+        self.meta['block_end_time'] = get_session_clock().getAbsTime()
         self.meta['duration'] = self.meta['block_end_time'] - self.meta['block_start_time']
+        if checkpoint is not None:
+            checkpoint.block_end(self.block_id, n_trials=len(self.results), duration=self.meta['duration'])
         logging.data(f"[BlockUnit] Finished '{self.block_id}' in {self.meta['duration']:.2f}s")
+
+        # Block boundaries are where buffered qa/sim event logs reach disk.
+        ctx = get_context()
+        if ctx is not None:
+            plan = getattr(ctx, "action_plan", None)
+            if plan is not None:
+                # Unused planned actions must not leak into the next block.
+                plan.discard(self.block_id)
+            ctx.flush()
         return self
 
     def summarize(self, summary_func: Optional[Callable[['BlockUnit'], Dict[str, Any]]] = None) -> Dict[str, Any]:
@@ -337,14 +595,15 @@ class BlockUnit:
         self.meta["summary"] = summary
         return summary
 
-    def to_dict(self, target: Optional[List[Dict[str, Any]]] = None) -> "BlockUnit":
+    def to_dict(self, target: Optional[Union[ResultStore, List[Dict[str, Any]]]] = None) -> "BlockUnit":
         """
         Append trial results to a target list, or return self for chaining.
 
         Parameters
         ----------
-        target : list of dict, optional
-            A list to append trial results to.
+        target : ResultStore or list of dict, optional
+            Where to append trial results. A :class:`ResultStore` is extended
+            column-wise; a list receives one plain dict per trial.
 
         Returns
         -------
@@ -352,17 +611,20 @@ class BlockUnit:
             The BlockUnit itself for chaining.
         """
         if target is not None:
-            target.extend(self.results)
+            if isinstance(target, ResultStore) or not isinstance(self.results, ResultStore):
+                target.extend(self.results)
+            else:
+                target.extend(self.results.to_records())
         return self
     
-    def get_all_data(self) -> List[Dict[str, Any]]:
+    def get_all_data(self) -> ResultStore:
         """
         Return trial results without modifying anything.
 
         Returns
         -------
-        list of dict
-            Trial result dictionaries.
+        ResultStore
+            Trial results; iterating yields dict-like rows.
         """
         return self.results
     
@@ -5,18 +5,23 @@ preview, text formatting, and text-to-speech conversion via edge-tts.
 """
 
 from psychopy.visual import TextStim, Circle, Rect, Polygon, ImageStim, ShapeStim, TextBox2, MovieStim
-from psychopy import event, core
+from psychopy import event, core, logging
 
 # set this if sounddevice is not working
 # from psychopy import prefs 
 # prefs.hardware['audioLib'] = ['pyo', 'pygame']
-import asyncio
-import edge_tts
 from psychopy.sound import Sound
+from collections import OrderedDict
+from functools import partial
 from typing import Callable, Dict, Any, Type, Optional
 import yaml
 import inspect
 import os
+import time
+
+from .utils.assets import AssetCache, decode_image, decode_sound, preload_assets
+from .utils.lru import LRUCache
+from .utils.tts import TTSBackend, TTSRequest, synthesize_batch
 
 # Mapping string names in YAML to actual PsychoPy classes
 STIM_CLASSES: Dict[str, Type] = {
@@ -31,6 +36,67 @@ STIM_CLASSES: Dict[str, Type] = {
     "sound": Sound,
 }
 
+# Fallback size estimate for stimuli whose buffers can't be inspected.
+_DEFAULT_STIM_BYTES = 64 * 1024
+# Retired (evicted, not yet released) bytes allowed without a memory budget.
+_DEFAULT_RETIRED_BYTES = 64 * 1024 * 1024
+
+
+def _estimate_nbytes(stim: Any) -> int:
+    """Rough resident size of a stimulus' texture or audio buffer in bytes."""
+    try:
+        for attr in ("sndArr", "_sndArr"):
+            nbytes = getattr(getattr(stim, attr, None), "nbytes", None)
+            if nbytes:
+                return int(nbytes)
+        image = getattr(stim, "image", None)
+        shape = getattr(image, "shape", None)
+        if shape is not None and len(shape) >= 2:
+            return int(shape[0]) * int(shape[1]) * 4
+        for attr in ("_origSize", "boundingBox"):
+            size = getattr(stim, attr, None)
+            if size is not None and len(size) == 2:
+                return max(1, int(abs(size[0]))) * max(1, int(abs(size[1]))) * 4
+    except Exception:
+        pass
+    return _DEFAULT_STIM_BYTES
+
+
+def _gl_finish() -> None:
+    """Wait for queued GL work so warm-up timings include the GPU side."""
+    try:
+        from pyglet import gl
+        gl.glFinish()
+    except Exception:
+        pass
+
+
+def _prime_sound(stim: Any) -> None:
+    """Open the audio stream of a Sound by playing it muted for an instant."""
+    volume = getattr(stim, "volume", None)
+    set_volume = getattr(stim, "setVolume", None)
+    if callable(set_volume):
+        set_volume(0.0)
+    try:
+        stim.play()
+        stim.stop()
+    finally:
+        if callable(set_volume) and volume is not None:
+            set_volume(volume)
+
+
+def _release_stim(stim: Any) -> None:
+    """Explicitly free the GL textures / audio streams of a dropped stimulus."""
+    try:
+        if hasattr(stim, "play") and callable(getattr(stim, "stop", None)):
+            stim.stop()
+        for method in ("unload", "clearTextures"):
+            fn = getattr(stim, method, None)
+            if callable(fn):
+                fn()
+    except Exception:
+        pass
+
 
 class StimBank:
     """
@@ -42,7 +108,15 @@ class StimBank:
     - Centralized retrieval, lazy instantiation, and batch preview
     """
 
-    def __init__(self, win, config: Optional[dict] = None):
+    def __init__(
+        self,
+        win,
+        config: Optional[dict] = None,
+        asset_cache: Any = None,
+        format_cache_size: int = 64,
+        format_cache_bytes: Optional[int] = 64 * 1024 * 1024,
+        memory_budget: Optional[int] = None,
+    ):
         """
         Initialize the stimulus bank with a PsychoPy Window.
 
@@ -52,10 +126,51 @@ class StimBank:
             The window object used to instantiate visual stimuli.
         config : dict, optional
             Dictionary of stimuli to load at initialization.
+        asset_cache : AssetCache or str or Path, optional
+            Persistent cache of decoded image/audio files. A path creates an
+            :class:`~psyflow.utils.assets.AssetCache` in that directory.
+        format_cache_size : int
+            Number of formatted text stimuli :meth:`get_and_format` keeps for
+            reuse; 0 disables memoization.
+        format_cache_bytes : int, optional
+            Estimated texture memory the formatted-text cache may hold.
+        memory_budget : int, optional
+            Estimated bytes of textures and audio buffers that instantiated
+            stimuli may hold. When exceeded, the least recently used unpinned
+            stimuli are evicted and rebuilt on the next :meth:`get`. ``None``
+            (default) keeps everything. An evicted stimulus keeps its
+            resources for a while so objects the running trial already holds
+            stay usable: it is released on the next :meth:`get` of its name,
+            on :meth:`release_retired` (called after every block by the task
+            template), or once retired stimuli exceed the budget themselves,
+            oldest first. Keep the budget above one trial's working set.
         """
         self.win = win
+        if isinstance(asset_cache, (str, os.PathLike)):
+            asset_cache = AssetCache(asset_cache)
+        self.asset_cache: Optional[AssetCache] = asset_cache
         self._registry: Dict[str, Callable[[Any], Any]] = {}
-        self._instantiated: Dict[str, Any] = {}
+        self.memory_budget = memory_budget
+        self._instantiated = LRUCache(
+            max_bytes=memory_budget,
+            size_of=_estimate_nbytes if memory_budget is not None else None,
+            on_evict=self._retire,
+        )
+        # Evicted or replaced stimuli awaiting release, oldest first:
+        # id(stim) -> (name, stim, nbytes).
+        self._retired: "OrderedDict[int, tuple[str, Any, int]]" = OrderedDict()
+        self._retired_bytes = 0
+        self._retired_cap = memory_budget if memory_budget is not None else _DEFAULT_RETIRED_BYTES
+        # Source specs of dict/YAML-defined stimuli (used to find decodable files).
+        self._specs: Dict[str, dict] = {}
+        self.load_timings: Dict[str, Dict[str, Any]] = {}
+        self.warmup_report: Dict[str, Dict[str, Any]] = {}
+        # Speech synthesizer for convert_to_voice/add_voice (None = edge-tts).
+        self.tts_backend: Optional[TTSBackend] = None
+        self.format_cache: Optional[LRUCache] = (
+            LRUCache(format_cache_size, format_cache_bytes, size_of=_estimate_nbytes)
+            if format_cache_size > 0 else None
+        )
         if config:
             self.add_from_dict(config)
 
@@ -75,22 +190,199 @@ class StimBank:
         """
         def decorator(func: Callable[[Any], Any]):
             self._registry[name] = func
+            self._specs.pop(name, None)
             return func
         return decorator
 
-    def preload_all(self) -> "StimBank":
+    def preload_all(
+        self,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+        progress: Optional[Callable[[int, int, str], None]] = None,
+    ) -> "StimBank":
         """Instantiate all registered stimuli.
 
+        Parameters
+        ----------
+        parallel : bool
+            Decode image and audio files of dict/YAML-defined ``image`` and
+            ``sound`` stimuli in a thread pool; only building the stimulus
+            (texture upload, audio buffer setup) stays on the main thread.
+            Requires Pillow / soundfile for the respective type and falls back
+            to the serial path per stimulus otherwise.
+        max_workers : int, optional
+            Size of the decode pool.
+        progress : callable, optional
+            Called as ``progress(done, total, name)`` after each stimulus.
+
         Returns
         -------
         StimBank
-            The object itself for method chaining.
-        """
-        for name, factory in self._registry.items():
-            if name not in self._instantiated:
-                self._instantiated[name] = factory(self.win)
+            The object itself for method chaining. Per-stimulus timings are
+            stored in :attr:`load_timings`.
+        """
+        pending = [name for name in self._registry if name not in self._instantiated]
+        builders = {name: partial(self._registry[name], self.win) for name in pending}
+        decoders = {}
+        if parallel:
+            for name in pending:
+                job = self._decode_job(name)
+                if job is not None:
+                    decoders[name] = job
+
+        t0 = time.perf_counter()
+        loaded, timings = preload_assets(builders, decoders, max_workers=max_workers, progress=progress)
+        for name, stim in loaded.items():
+            self._instantiated.put(name, stim)
+        self.load_timings.update(timings)
+        if self.asset_cache is not None:
+            self.asset_cache.save()
+        if loaded:
+            slowest = max(timings, key=lambda n: timings[n]["build_s"] + (timings[n]["decode_s"] or 0.0))
+            logging.data(
+                f"[StimBank] Preloaded {len(loaded)} stimuli in {time.perf_counter() - t0:.2f}s "
+                f"({sum(t['decoded'] for t in timings.values())} decoded off-thread, slowest '{slowest}')"
+            )
         return self
 
+    def warm_up(
+        self,
+        names: Optional[list[str]] = None,
+        audio: bool = True,
+        show: Optional[list] = None,
+        progress: Optional[Callable[[int, int, str], None]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Do the lazy first-draw work of stimuli before any timed trial.
+
+        Each visual stimulus is drawn once into the back buffer (texture
+        upload, shader compilation, glyph rasterization) and the buffer is
+        cleared without flipping, so nothing reaches the screen. Each sound
+        is played muted and stopped to open its audio stream. Movies are
+        skipped.
+
+        Parameters
+        ----------
+        names : list of str, optional
+            Stimuli to warm up; defaults to all instantiated stimuli (call
+            :meth:`preload_all` first).
+        audio : bool
+            Also prime Sound stimuli.
+        show : list, optional
+            Stimuli drawn and flipped before warming up, e.g. the instruction
+            text, so participants see a stable screen meanwhile.
+        progress : callable, optional
+            Called as ``progress(done, total, name)`` after each stimulus,
+            skipped ones included.
+
+        Returns
+        -------
+        dict
+            ``name -> {"kind", "cost_s", "error"}`` of the warmed-up stimuli; also stored in
+            :attr:`warmup_report`.
+        """
+        if show:
+            for stim in show:
+                stim.draw()
+            self.win.flip()
+
+        targets = list(names) if names is not None else list(self._instantiated)
+        report: Dict[str, Dict[str, Any]] = {}
+        t_start = time.perf_counter()
+        for i, name in enumerate(targets):
+            stim = self.get(name)
+            is_sound = hasattr(stim, "play") and callable(stim.play)
+            skip = (
+                isinstance(stim, MovieStim)
+                or (is_sound and not audio)
+                or not (is_sound or callable(getattr(stim, "draw", None)))
+            )
+            if not skip:
+                error = None
+                t0 = time.perf_counter()
+                try:
+                    if is_sound:
+                        _prime_sound(stim)
+                    else:
+                        stim.draw()
+                        _gl_finish()
+                except Exception as e:
+                    error = f"{type(e).__name__}: {e}"
+                report[name] = {
+                    "kind": "audio" if is_sound else "visual",
+                    "cost_s": time.perf_counter() - t0,
+                    "error": error,
+                }
+            if progress is not None:
+                progress(i + 1, len(targets), name)
+
+        # Discard everything drawn above; the visible frame is untouched.
+        clear = getattr(self.win, "clearBuffer", None)
+        if callable(clear):
+            clear()
+        self.warmup_report.update(report)
+        if report:
+            slowest = max(report, key=lambda n: report[n]["cost_s"])
+            n_err = sum(1 for r in report.values() if r["error"])
+            logging.data(
+                f"[StimBank] Warmed up {len(report)} stimuli in {time.perf_counter() - t_start:.3f}s "
+                f"(slowest '{slowest}' {report[slowest]['cost_s'] * 1000:.1f} ms, {n_err} errors)"
+            )
+        return report
+
+    def _retire(self, name: str, stim: Any) -> None:
+        # Not released yet: the running trial may still draw or play it.
+        nbytes = _estimate_nbytes(stim)
+        self._retired[id(stim)] = (name, stim, nbytes)
+        self._retired_bytes += nbytes
+        while self._retired_bytes > self._retired_cap and len(self._retired) > 1:
+            _, (_, old, old_bytes) = self._retired.popitem(last=False)
+            self._retired_bytes -= old_bytes
+            _release_stim(old)
+
+    def _release_retired_named(self, name: str) -> None:
+        for key in [k for k, (n, _, _) in self._retired.items() if n == name]:
+            _, old, nbytes = self._retired.pop(key)
+            self._retired_bytes -= nbytes
+            _release_stim(old)
+
+    def _decode_job(self, name: str) -> Optional[Callable[[], Optional[dict]]]:
+        """Off-thread decode step for a file-backed stimulus, if it has one."""
+        spec = self._specs.get(name)
+        if not spec:
+            return None
+        stim_type = spec.get("type")
+        cache = self.asset_cache
+        if stim_type == "image":
+            path = spec.get("image")
+            if isinstance(path, str) and os.path.isfile(path):
+                return partial(cache.image if cache is not None else decode_image, path)
+        elif stim_type == "sound":
+            path = spec.get("file")
+            if isinstance(path, str) and os.path.isfile(path):
+                return partial(cache.sound if cache is not None else decode_sound, path, spec.get("sampleRate"))
+        return None
+
+    def _cached_decode(self, cls: type, kwargs: dict) -> Optional[dict]:
+        """Decoded-data overrides for an image/sound file from :attr:`asset_cache`."""
+        cache = self.asset_cache
+        if cache is None:
+            return None
+        try:
+            if issubclass(cls, ImageStim):
+                path = kwargs.get("image")
+                if isinstance(path, str) and os.path.isfile(path):
+                    return cache.image(path)
+            elif cls.__name__.lower().startswith("sound"):
+                path = kwargs.get("file")
+                if isinstance(path, str) and os.path.isfile(path):
+                    return cache.sound(path, kwargs.get("sampleRate"))
+        except Exception:
+            # A broken cache must never stop a stimulus from loading the normal way.
+            return None
+        finally:
+            cache.save()
+        return None
+
     def get(self, name: str):
         """
         Get a stimulus by name, instantiating it if needed.
@@ -110,20 +402,83 @@ class StimBank:
         KeyError
             If the stimulus is not registered.
         """
-        if name not in self._instantiated:
+        if self._retired:
+            # The caller moves on to the current instance; free the old ones.
+            self._release_retired_named(name)
+        stim = self._instantiated.get(name)
+        if stim is None:
             if name not in self._registry:
                 raise KeyError(f"Stimulus '{name}' not defined.")
-            self._instantiated[name] = self._registry[name](self.win)
-        return self._instantiated[name]
+            stim = self._registry[name](self.win)
+            self._instantiated.put(name, stim)
+        return stim
+
+    def pin(self, *names: str) -> "StimBank":
+        """
+        Keep stimuli resident regardless of :attr:`memory_budget`.
+
+        Parameters
+        ----------
+        *names : str
+            Stimulus names (e.g. fixation, feedback); they may be pinned
+            before they are first instantiated.
+
+        Returns
+        -------
+        StimBank
+            The object itself for method chaining.
+        """
+        for name in names:
+            self._instantiated.pin(name)
+        return self
+
+    def unpin(self, *names: str) -> "StimBank":
+        """Allow previously pinned stimuli to be evicted again."""
+        for name in names:
+            self._instantiated.unpin(name)
+        return self
+
+    def release_retired(self) -> int:
+        """
+        Free the resources of all evicted stimuli now.
+
+        Call between trials when nothing drawn earlier is reused; otherwise
+        each evicted stimulus is released on the next :meth:`get` of its name.
+
+        Returns
+        -------
+        int
+            Number of stimuli released.
+        """
+        retired = [stim for _, stim, _ in self._retired.values()]
+        self._retired.clear()
+        self._retired_bytes = 0
+        for stim in retired:
+            _release_stim(stim)
+        return len(retired)
+
+    def memory_stats(self) -> Dict[str, Any]:
+        """Estimated resident bytes, entry count, hits/misses and evictions."""
+        return {
+            "budget": self.memory_budget,
+            "retired": len(self._retired),
+            "retired_bytes": self._retired_bytes,
+            **self._instantiated.stats(),
+        }
 
     def get_and_format(self, name: str, **format_kwargs):
         """
-        Return a fresh TextStim or TextBox2 with formatted text.
+        Return a TextStim or TextBox2 with formatted text.
 
         This method now formats text and rebuilds the stimulus from its registered
         definition, so layout-relevant properties (e.g., pos/height/wrapWidth)
         are preserved from the template definition.
 
+        Results are memoized in :attr:`format_cache` by stimulus name,
+        formatted text and registered definition, so a repeated prompt returns
+        the already laid-out stimulus instead of building a new one. Treat the
+        returned object as shared; use :meth:`rebuild` for a private copy.
+
         Parameters
         ----------
         name : str
@@ -134,7 +489,7 @@ class StimBank:
         Returns
         -------
            TextStim or TextBox2
-            A new formatted visual text stimulus.
+            The formatted visual text stimulus.
         Raises
         ------
         TypeError
@@ -154,10 +509,20 @@ class StimBank:
             missing = e.args[0]
             raise KeyError(f"Missing format key '{missing}' for stimulus '{name}'.") from e
 
+        cache = self.format_cache
+        key = (name, formatted_text, self._registry[name])
+        if cache is not None:
+            stim = cache.get(key)
+            if stim is not None:
+                return stim
+
         try:
-            return self.rebuild(name, update_cache=False, text=formatted_text)
+            stim = self.rebuild(name, update_cache=False, text=formatted_text)
         except Exception as e:
             raise ValueError(f"[StimBank] Failed to rebuild formatted stimulus '{name}': {e}") from e
+        if cache is not None:
+            cache.put(key, stim)
+        return stim
     
 
     def rebuild(self, name: str, update_cache: bool = False, **overrides):
@@ -184,7 +549,9 @@ class StimBank:
         new_stim = self._registry[name](self.win, **overrides)
 
         if update_cache:
-            self._instantiated[name] = new_stim
+            # Retire the replaced stimulus so its textures are freed, not left to GC.
+            self._instantiated.discard(name)
+            self._instantiated.put(name, new_stim)
 
         return new_stim
 
@@ -396,22 +763,40 @@ class StimBank:
         -------
         Callable
             A factory function that accepts (win, **overrides)
+
+        Notes
+        -----
+        With an :attr:`asset_cache`, image and sound files are taken from the
+        cache (decoded arrays) before the PsychoPy constructor runs, unless
+        the caller already passes ``image=``/``file=``.
         """
         def _factory(win, **override_kwargs):
             try:
                 merged = dict(base_kwargs)
                 merged.update(override_kwargs)
 
-                # Special case for sound: pass file/filename as positional value
-                if cls.__name__.lower().startswith("sound"):
-                    file_value = merged.pop("file")  # remove 'file' from kwargs
-                    return cls(file_value, **merged) 
+                if "image" not in override_kwargs and "file" not in override_kwargs:
+                    decoded = self._cached_decode(cls, merged)
+                    if decoded:
+                        try:
+                            return self._construct(cls, win, {**merged, **decoded})
+                        except Exception:
+                            pass
 
-                return cls(win, **merged)
+                return self._construct(cls, win, merged)
             except Exception as e:
                 raise ValueError(f"[StimBank] Failed to build '{name}': {e}")
         return _factory
 
+    @staticmethod
+    def _construct(cls: type, win, kwargs: dict):
+        kwargs = dict(kwargs)
+        # Special case for sound: pass file/filename as positional value
+        if cls.__name__.lower().startswith("sound"):
+            file_value = kwargs.pop("file")  # remove 'file' from kwargs
+            return cls(file_value, **kwargs)
+        return cls(win, **kwargs)
+
     def add_from_dict(self, named_specs: Optional[dict] = None, **kwargs) -> "StimBank":
         """
         Add stimuli from a dictionary or keyword-based specifications.
@@ -436,6 +821,7 @@ class StimBank:
 
             kwargs = {k: v for k, v in spec.items() if k != "type"}
             self._registry[name] = self.make_factory(stim_class, kwargs, name)
+            self._specs[name] = dict(spec)
         return self
 
     def validate_dict(self, config: dict, strict: bool = False) -> None:
@@ -487,16 +873,21 @@ class StimBank:
             if not unknown_args and not missing_args:
                 print(f"[OK] [{name}] OK")
 
-
-
     def convert_to_voice(self,
                          keys: list[str] | str,
                          overwrite: bool = False,
-                         voice: str = "zh-CN-YunyangNeural") -> "StimBank":
+                         voice: str = "zh-CN-YunyangNeural",
+                         rate: str = "+0%",
+                         backend: Optional[TTSBackend] = None,
+                         max_concurrency: int = 4) -> "StimBank":
         """
         Convert specified TextStim/TextBox2 stimuli to speech (MP3) and register them
         as new Sound stimuli in this StimBank.
 
+        All keys are synthesized concurrently. Audio files are named after a
+        hash of (text, voice, rate), so an edited text gets a fresh recording
+        while unchanged texts reuse the existing file.
+
         Parameters
         ----------
         keys : list[str]
@@ -506,14 +897,17 @@ class StimBank:
         voice : str
             Name of the TTS voice to use (default 'zh-CN-YunyangNeural').
             edge-tts --list-voices
+        rate : str
+            Speaking rate adjustment, e.g. '+10%' (default '+0%').
+        backend : TTSBackend, optional
+            Synthesizer to use instead of :attr:`tts_backend` / edge-tts.
+        max_concurrency : int
+            Maximum number of syntheses in flight.
         """
         if isinstance(keys, str):
             keys = [keys]
-        assets_dir = "assets"
-        # create the assets folder only if it doesn't already exist
-        if not os.path.isdir(assets_dir):
-            os.mkdir(assets_dir)
 
+        requests = []
         for key in keys:
             # try to retrieve the registered stimulus
             try:
@@ -527,36 +921,9 @@ class StimBank:
             if not isinstance(text, str):
                 print(f"[Warning] '{key}' has no text property. Skipping.")
                 continue
+            requests.append(TTSRequest(key=f"{key}_voice", text=text, voice=voice, rate=rate))
 
-            # determine output MP3 path
-            mp3_filename = f"{key}_voice.mp3"
-            mp3_path = os.path.join(assets_dir, mp3_filename)
-
-            if os.path.isfile(mp3_path) and not overwrite:
-                print(f"[Info] '{mp3_filename}' exists and overwrite=False. Skipping generation.")
-            else:
-                print(f"[Info] Generating TTS for '{key}' -> '{mp3_filename}'...")
-
-                async def _generate():
-                    await edge_tts.Communicate(text=text, voice=voice).save(mp3_path)
-
-                try:
-                    # run the async TTS generation
-                    asyncio.run(_generate())
-                except Exception as e:
-                    print(f"[Error] Failed to generate speech for '{key}': {e}")
-                    print("Possible reasons:")
-                    print(" - No internet connection or unstable network")
-                    print(" - HTTPS proxies not supported by edge-tts")
-                    print(" - Incorrect or unsupported voice name")
-                    print(" - edge-tts not installed or version mismatch")
-                    continue
-
-            # register the new MP3 as a Sound stimulus
-            self._registry[f"{key}_voice"] = lambda win, p=mp3_path: Sound(p)
-            # clear any cached instance so get() picks up the new Sound
-            self._instantiated.pop(f"{key}_voice", None)
-            print(f"[Success] Registered new stimulus '{key}_voice'")
+        self._synthesize_and_register(requests, overwrite, backend, max_concurrency)
         return self
 
 
@@ -564,15 +931,18 @@ class StimBank:
                   stim_label: str,
                   text: str,
                   overwrite: bool = False,
-                  voice: str = "zh-CN-XiaoxiaoNeural") -> "StimBank":
+                  voice: str = "zh-CN-XiaoxiaoNeural",
+                  rate: str = "+0%",
+                  backend: Optional[TTSBackend] = None) -> "StimBank":
         """
         Convert arbitrary text to speech (MP3) and register it as a new Sound stimulus.
 
         Parameters
         ----------
         stim_label : str
-            The name under which to register the new voice stimulus, 
-            and the base filename for the MP3 (e.g. 'welcome_voice' -> 'assets/welcome_voice.mp3').
+            The name under which to register the new voice stimulus; also the
+            readable prefix of the MP3 file name
+            (e.g. 'welcome_voice' -> 'assets/welcome_voice-<hash>.mp3').
         text : str
             The text to synthesize.
         overwrite : bool
@@ -580,41 +950,49 @@ class StimBank:
         voice : str
             The TTS voice to use (default "zh-CN-XiaoxiaoNeural").
             edge-tts --list-voices
+        rate : str
+            Speaking rate adjustment, e.g. '+10%' (default '+0%').
+        backend : TTSBackend, optional
+            Synthesizer to use instead of :attr:`tts_backend` / edge-tts.
         """
-        # 1. Ensure the assets directory exists
-        assets_dir = "assets"
-        if not os.path.isdir(assets_dir):
-            os.mkdir(assets_dir)
-
-        # 2. Build the full path for the MP3
-        mp3_filename = f"{stim_label}.mp3"
-        mp3_path = os.path.join(assets_dir, mp3_filename)
-
-        # 3. Synthesize if needed
-        if os.path.isfile(mp3_path) and not overwrite:
-            print(f"[Info] '{mp3_filename}' already exists (overwrite=False). Skipping synthesis.")
-        else:
-            print(f"[Info] Generating TTS for '{stim_label}' -> '{mp3_filename}'...")
-
-            async def _generate():
-                await edge_tts.Communicate(text=text, voice=voice).save(mp3_path)
-
-            try:
-                asyncio.run(_generate())
-            except Exception as e:
-                print(f"[Error] Failed to generate speech for '{stim_label}': {e}")
-                print("Possible reasons:")
-                print(" - No internet connection or unstable network")
-                print(" - HTTPS proxies not supported by edge-tts")
-                print(" - Incorrect or unsupported voice name")
-                print(" - edge-tts not installed or version mismatch")
-                return
-
-        # 4. Register the new MP3 as a Sound stimulus
-        self._registry[stim_label] = lambda win, p=mp3_path: Sound(p)
-        # 5. Clear any cached instance so future get() returns the new Sound
-        self._instantiated.pop(stim_label, None)
-
-        print(f"[Success] Registered new voice stimulus '{stim_label}'")
-
+        request = TTSRequest(key=stim_label, text=text, voice=voice, rate=rate)
+        self._synthesize_and_register([request], overwrite, backend, 1)
         return self
+
+    def _synthesize_and_register(
+        self,
+        requests: list,
+        overwrite: bool,
+        backend: Optional[TTSBackend],
+        max_concurrency: int,
+    ) -> None:
+        if not requests:
+            return
+        print(f"[Info] Generating TTS for {len(requests)} stimuli...")
+        results = synthesize_batch(
+            requests,
+            backend=backend or self.tts_backend,
+            out_dir="assets",
+            overwrite=overwrite,
+            max_concurrency=max_concurrency,
+        )
+        failed = False
+        for label, res in results.items():
+            if not res.ok:
+                failed = True
+                print(f"[Error] Failed to generate speech for '{label}': {res.error}")
+                continue
+            if res.cached:
+                print(f"[Info] '{res.path}' exists and overwrite=False. Skipping generation.")
+            # register the new MP3 as a Sound stimulus
+            self._registry[label] = lambda win, p=res.path: Sound(p)
+            self._specs.pop(label, None)
+            # clear any cached instance so get() picks up the new Sound
+            self._instantiated.discard(label)
+            print(f"[Success] Registered new stimulus '{label}'")
+        if failed:
+            print("Possible reasons:")
+            print(" - No internet connection or unstable network")
+            print(" - HTTPS proxies not supported by edge-tts")
+            print(" - Incorrect or unsupported voice name")
+            print(" - edge-tts not installed or version mismatch")
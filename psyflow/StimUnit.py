@@ -5,15 +5,20 @@ timing control, and lifecycle hooks.  Adapts automatically to simulation
 mode via :class:`~psyflow.sim.adapter.ResponderAdapter`.
 """
 
-from psychopy import core, visual, logging, sound
+from psychopy import visual, logging, sound
 from psychopy.hardware.keyboard import Keyboard
 from typing import Callable, Optional, List, Dict, Any, Sequence, TypeAlias, Union
 import importlib
-import random
-from .sim.context import get_context
+import math
+import weakref
+from .sim.context import get_context, get_session_clock
+from .utils.idle import run_idle
+from .utils.jitter import planned_duration
+from .utils.lru import LRUCache
 from .io.events import TriggerEvent
 from .sim.adapter import ResponderAdapter, ResponderActionError
 from .sim.contracts import Feedback, Observation
+from .sim.rng import active_rng_streams
 from psychopy.sound._base import _SoundBase
 
 
@@ -41,6 +46,56 @@ AUDIO_STIM_TYPES = _resolve_audio_stim_types()
 SUPPORTED_STIM_TYPES = (visual.BaseVisualStim,) + AUDIO_STIM_TYPES
 SupportedStim: TypeAlias = Union[visual.BaseVisualStim, _SoundBase]
 
+
+def _can_skip_frames(ctx: Any, win: Any) -> bool:
+    """Whether response windows may be resolved without flipping each frame.
+
+    Needs ``event_driven`` in the runtime config and a window that can
+    advance its clock by skipped flips (``HeadlessWindow``); on a real window
+    the skipped frames would leave the recorded close stamp ahead of the
+    actual display.
+    """
+    return bool(getattr(getattr(ctx, "config", None), "event_driven", False)) and callable(
+        getattr(win, "advance_frames", None)
+    )
+
+
+def _responder_adapter(ctx: Any) -> ResponderAdapter:
+    """Responder adapter configured from the active runtime context."""
+    config = getattr(ctx, "config", None)
+    return ResponderAdapter(
+        policy=str(getattr(config, "sim_policy", "warn") or "warn"),
+        default_rt_s=float(getattr(config, "default_rt_s", 0.2) or 0.2),
+        clamp_rt=bool(getattr(config, "clamp_rt", False)),
+        logger=getattr(ctx, "sim_logger", None) if ctx is not None else None,
+        session=getattr(ctx, "session", None) if ctx is not None else None,
+    )
+
+# Pre-rendered static displays for show(composite=True), per window.
+_COMPOSITES: "weakref.WeakKeyDictionary[Any, LRUCache]" = weakref.WeakKeyDictionary()
+_COMPOSITE_CACHE_SIZE = 32
+_FINGERPRINT_ATTRS = (
+    "text", "pos", "size", "ori", "opacity", "color", "fillColor", "lineColor", "image", "height", "units",
+)
+
+
+def _attr_key(value: Any) -> Any:
+    tobytes = getattr(value, "tobytes", None)
+    if callable(tobytes):
+        return (getattr(value, "shape", None), tobytes())
+    if isinstance(value, list):
+        return tuple(_attr_key(v) for v in value)
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
+
+
+def _stim_fingerprint(stim: Any) -> tuple:
+    """Identity plus the drawing-relevant attributes of a stimulus."""
+    return (id(stim),) + tuple(_attr_key(getattr(stim, a, None)) for a in _FINGERPRINT_ATTRS)
+
 class StimUnit:
     """
     StimUnit(unit_label,win, kb,  trigger=None)
@@ -65,6 +120,10 @@ class StimUnit:
         Identifier for the trial (used for logging/debugging).
     runtime : TriggerRuntime, optional
         External trigger runtime for event-aligned trigger emission.
+    frame_recorder : FrameTimingRecorder, optional
+        If given, every flip timestamp of each stage is recorded and the
+        summary fields ``n_flips``, ``n_dropped``, ``max_ifi`` and ``ifi_sd``
+        are written to :attr:`state` when the stage ends.
     frame_time : float
         Duration of a single frame in seconds (default: 1/60 for 60Hz).
     """
@@ -75,17 +134,123 @@ class StimUnit:
         win: visual.Window,
         kb: Optional[Keyboard] = None,
         runtime: Any = None,
+        frame_recorder: Any = None,
     ):
         self.win = win
         self.label = unit_label
         self.runtime = runtime
+        self.frame_recorder = frame_recorder
+        self._frame_stage_open = False
         self.stimuli: List[visual.BaseVisualStim] = []
         self.state: Dict[str, Any] = {}
-        self.clock = core.Clock()
+        # Stage timing and *_global stamps share the session clock with triggers
+        # and event logs (a virtual clock in headless qa/sim runs).
+        self._session_clock = get_session_clock()
+        self.clock = self._session_clock.make_timer()
         self.kb = kb or Keyboard()
         self._hooks: Dict[str, List] = {"start": [], "response": [], "timeout": [], "end": []}
         self.frame_time = self.win.monitorFramePeriod
 
+    def _abs_time(self) -> float:
+        """Absolute (epoch-seconds) timestamp from the session clock."""
+        return self._session_clock.getAbsTime()
+
+    def _flip(self) -> float:
+        """Flip the window, recording the timestamp if a frame recorder is set."""
+        t_flip = self.win.flip()
+        if self.frame_recorder is not None:
+            if not self._frame_stage_open:
+                self.frame_recorder.begin(self.label, self.frame_time)
+                self._frame_stage_open = True
+            if t_flip is not None:
+                self.frame_recorder.record(t_flip)
+        return t_flip
+
+    def _end_stage(self) -> None:
+        """Per-stage bookkeeping deferred until the last flip has happened.
+
+        Stores the frame recorder summary in :attr:`state` and lets a
+        low-latency trigger runtime build its audit records.
+        """
+        self._end_frame_stage()
+        flush_audit = getattr(self.runtime, "flush_audit", None)
+        if flush_audit is not None:
+            flush_audit()
+
+    def _end_frame_stage(self) -> None:
+        """Store the frame recorder summary of the current stage in :attr:`state`."""
+        if self.frame_recorder is not None and self._frame_stage_open:
+            self._frame_stage_open = False
+            self.set_state(**self.frame_recorder.end())
+
+    def _composite(self, stims: List[Any]) -> Optional[Any]:
+        """Cached ``BufferImageStim`` of ``stims`` (``None`` if unavailable).
+
+        The composite is reused across units on the same window as long as
+        the stimuli are the same objects with unchanged drawing attributes.
+        Building one renders through the window's back buffer and clears it,
+        so anything drawn before a cache miss is lost from the next flip.
+        """
+        key = tuple(_stim_fingerprint(s) for s in stims)
+        try:
+            cache = _COMPOSITES.get(self.win)
+            if cache is None:
+                cache = _COMPOSITES[self.win] = LRUCache(_COMPOSITE_CACHE_SIZE)
+        except TypeError:
+            return None
+        hit = cache.get(key)
+        if hit is not None:
+            return hit[1]
+        try:
+            composite = visual.BufferImageStim(self.win, stim=stims)
+        except Exception as e:
+            logging.warning(f"[StimUnit] Composite rendering unavailable for '{self.label}': {e}")
+            return None
+        # Capture drew into the back buffer; don't let it leak into the onset frame.
+        clear = getattr(self.win, "clearBuffer", None)
+        if callable(clear):
+            clear()
+        # Holding the stimuli keeps their ids (part of the key) from being reused.
+        cache.put(key, (tuple(stims), composite))
+        return composite
+
+    def _resolve_duration(self, duration: float | list | tuple | None, *, from_sounds: bool = False) -> float:
+        """Nominal stage duration in seconds.
+
+        ``(min, max)`` is sampled uniformly and ``(d,)`` means ``d``. With
+        ``from_sounds``, ``None`` selects the longest sound stimulus (or 0.0).
+        A range uses the block's planned value for this stage if there is one
+        (``BlockUnit.plan_jitter``); otherwise it is drawn from the active RNG
+        streams, keyed by trial and stage label, so a seeded session
+        reproduces its durations.
+        """
+        if duration is None and from_sounds:
+            t_val = 0.0
+            for stim in self.stimuli:
+                if hasattr(stim, "getDuration") and callable(stim.getDuration):
+                    try:
+                        t_val = max(t_val, stim.getDuration())
+                    except Exception:
+                        continue
+        elif isinstance(duration, (list, tuple)):
+            planned = planned_duration(self.label) if len(duration) == 2 else None
+            if planned is not None:
+                t_val = planned
+            elif len(duration) == 2:
+                rng = active_rng_streams().next(
+                    "duration", self.get_state("trial_id", self.get_state("trial_index", None)), self.label
+                )
+                t_val = rng.uniform(*duration)
+            elif len(duration) == 1:
+                t_val = duration[0]
+            else:
+                raise ValueError(f"Duration list/tuple must have 1 or 2 elements, got {len(duration)}")
+        elif isinstance(duration, (int, float)):
+            t_val = duration
+        else:
+            raise TypeError(f"Invalid duration type: {type(duration)}")
+        return float(t_val)
+
     def _qa_scale_duration(self, nominal_s: float) -> tuple[float, int, bool]:
         """Return (used_seconds, n_frames, scaled_flag) for QA mode.
 
@@ -299,12 +464,12 @@ class StimUnit:
         if onset_trigger is None:
             self.set_state(
                 onset_time=self.clock.getTime(),
-                onset_time_global=core.getAbsTime(),
+                onset_time_global=self._abs_time(),
             )
         else:
             self.set_state(
                 onset_time=self.clock.getTime(),
-                onset_time_global=core.getAbsTime(),
+                onset_time_global=self._abs_time(),
                 onset_trigger=onset_trigger,
             )
 
@@ -317,7 +482,7 @@ class StimUnit:
         close_time = self.clock.getTime()
         onset_time_global = self.get_state("onset_time_global", None)
         close_time_global = (
-            onset_time_global + close_time if onset_time_global is not None else core.getAbsTime()
+            onset_time_global + close_time if onset_time_global is not None else self._abs_time()
         )
         if offset_trigger is None:
             self.set_state(
@@ -459,7 +624,7 @@ class StimUnit:
                 f"got {post_response_display!r}"
             )
 
-        self.set_state(global_time=core.getAbsTime())
+        self.set_state(global_time=self._abs_time())
 
         for hook in self._hooks["start"]:
             hook(self)
@@ -473,7 +638,7 @@ class StimUnit:
         self.win.callOnFlip(self._reset_keyboard_clock)
         self.win.callOnFlip(self.clock.reset)
         self.win.callOnFlip(self._stamp_onset)
-        flip_time = self.win.flip()
+        flip_time = self._flip()
         self.set_state(flip_time=flip_time)
         responded = False
 
@@ -518,7 +683,7 @@ class StimUnit:
             if frame_i == n_frames - 2:
                 # Stamp stage close on the final flip of the response window.
                 self.win.callOnFlip(self._stamp_close)
-            self.win.flip()
+            self._flip()
 
             # Drain key events every frame to avoid spillover into later stages.
             keys = self.kb.getKeys(keyList=all_keys, waitRelease=False) if all_keys else []
@@ -536,7 +701,7 @@ class StimUnit:
                                 close_time_global = (
                                     onset_time_global + key_rt
                                     if onset_time_global is not None
-                                    else core.getAbsTime()
+                                    else self._abs_time()
                                 )
                                 self.set_state(
                                     close_time=key_rt,
@@ -554,7 +719,7 @@ class StimUnit:
                     timeout_time_global = (
                         onset_time_global + elapsed
                         if onset_time_global is not None
-                        else core.getAbsTime()
+                        else self._abs_time()
                     )
                     self.set_state(
                         timeout_triggered=True,
@@ -578,7 +743,7 @@ class StimUnit:
             close_time_global = (
                 onset_time_global + close_time
                 if onset_time_global is not None
-                else core.getAbsTime()
+                else self._abs_time()
             )
             self.set_state(
                 close_time=close_time,
@@ -587,6 +752,7 @@ class StimUnit:
         for hook in self._hooks["end"]:
             hook(self)
 
+        self._end_stage()
         self.log_unit()
         return self
 
@@ -595,7 +761,9 @@ class StimUnit:
         self,
         duration: float | list | tuple | None = None,
         onset_trigger: int = None,
-        offset_trigger: int = None
+        offset_trigger: int = None,
+        composite: bool = False,
+        idle_work: bool = False
     ) -> "StimUnit":
         """
         Display the stimulus for a specified duration, using frame-based timing
@@ -615,6 +783,17 @@ class StimUnit:
             Trigger code to send at stimulus onset.
         offset_trigger : int
             Trigger code to send at stimulus offset.
+        composite : bool
+            Render all visual stimuli once into a single cached texture
+            (``BufferImageStim``) and draw only that texture per frame. For
+            static displays with many elements; the composite is rebuilt if a
+            stimulus' position, size, color, text, etc. changes. Building it
+            clears the back buffer, so add every element of the display to
+            the unit rather than drawing extras before ``show()``.
+        idle_work : bool
+            Use the spare time after each flip (except the last) to run work
+            queued on the active :class:`~psyflow.utils.idle.IdleScheduler`,
+            e.g. preparing the next trial during an ITI.
 
         Returns
         -------
@@ -629,42 +808,23 @@ class StimUnit:
         | duration=1.0 + sound is 2.5 seconds      | Screen ends at 1.0s, sound may be cut off early     |
         | duration=None + sound is 2.5 seconds     | Screen and sound will both last full 2.5s           |
         """
-        local_rng = random.Random()
-
-        # auto-select duration from sound stimuli if not provided
-        if duration is None:
-            t_val = 0.0
-            for stim in self.stimuli:
-                if hasattr(stim, "getDuration") and callable(stim.getDuration):
-                    try:
-                        t_val = max(t_val, stim.getDuration())
-                    except Exception:
-                        continue
-        elif isinstance(duration, (list, tuple)):
-            if len(duration) == 2:
-                t_val = local_rng.uniform(*duration)
-            elif len(duration) == 1:
-                t_val = duration[0]
-            else:
-                raise ValueError(f"Duration list/tuple must have 1 or 2 elements, got {len(duration)}")
-        elif isinstance(duration, (int, float)):
-            t_val = duration
-        else:
-            raise TypeError(f"Invalid duration type: {type(duration)}")
-
-        nominal = float(t_val)
+        nominal = self._resolve_duration(duration, from_sounds=True)
         used, n_frames, scaled = self._qa_scale_duration(nominal)
         if scaled:
             self.set_state(duration_nominal=nominal, duration_scaled=used)
         self.set_state(duration=used)
 
+        sound_stims = [s for s in self.stimuli if hasattr(s, "play") and callable(s.play)]
+        visual_stims = [s for s in self.stimuli if s not in sound_stims and hasattr(s, "draw") and callable(s.draw)]
+        if composite and len(visual_stims) > 1:
+            cached = self._composite(visual_stims)
+            if cached is not None:
+                visual_stims = [cached]
+            self.set_state(composite=cached is not None)
+
         # --- Initial Flip (trigger locked to onset) ---
-        sound_stims = []
-        for stim in self.stimuli:
-            if hasattr(stim, "play") and callable(stim.play):
-                sound_stims.append(stim)
-            else:
-                stim.draw()
+        for stim in visual_stims:
+            stim.draw()
 
         # Schedule flip callbacks in an order that keeps timing stamps accurate
         # even if trigger/audio callbacks are slow.
@@ -692,14 +852,15 @@ class StimUnit:
                 meta={"kind": "offset"},
             )
 
-        flip_time = self.win.flip()
+        flip_time = self._flip()
         self.set_state(flip_time=flip_time)
 
         # --- Frame-based visual presentation ---
-        visual_stims = [s for s in self.stimuli if hasattr(s, "draw") and callable(s.draw)]
         offset_flip_time = flip_time if n_frames == 1 else None
         if n_frames > 1:
             for frame_i in range(n_frames - 1):
+                if idle_work:
+                    run_idle(self.frame_time)
                 for stim in visual_stims:
                     stim.draw()
                 if frame_i == n_frames - 2:
@@ -712,14 +873,191 @@ class StimUnit:
                         name=f"{self.label}_offset",
                         meta={"kind": "offset"},
                     )
-                offset_flip_time = self.win.flip()
+                offset_flip_time = self._flip()
 
         if offset_flip_time is not None:
             self.set_state(offset_flip_time=offset_flip_time)
 
+        self._end_stage()
         self.log_unit()
         return self
 
+    def _record_response(
+        self,
+        key: str,
+        rt: float,
+        correct_keys: list[str],
+        response_trigger: int | dict[str, int] | None,
+    ) -> float:
+        """Store response fields, emit the response trigger and return the global stamp."""
+        onset_time_global = self.get_state("onset_time_global", None)
+        response_time_global = (
+            onset_time_global + rt
+            if onset_time_global is not None
+            else self._abs_time()
+        )
+        self.set_state(
+            hit=key in correct_keys,
+            correct_keys=correct_keys,
+            response=key,
+            key_press=True,
+            rt=rt,
+            response_time=rt,
+            response_time_global=response_time_global,
+        )
+        code = (response_trigger.get(key, None)
+            if isinstance(response_trigger, dict)
+            else response_trigger)
+        self._emit_trigger(
+            code,
+            when="now",
+            wait=True,
+            name=f"{self.label}_response",
+            meta={"kind": "response", "key": key},
+        )
+        self.set_state(response_trigger=code)
+        return response_time_global
+
+    def _responder_action(
+        self,
+        responder: Any,
+        ctx: Any,
+        keys: Sequence[str],
+        window_s: float,
+        adapter: Optional[ResponderAdapter] = None,
+    ) -> tuple[Optional[str], Optional[float]]:
+        """Ask the sim/QA responder for this stage's ``(key, rt_s)``.
+
+        Uses the action planned for this window by ``act_batch`` if there is
+        one, otherwise calls ``act``. Must be called after the onset flip so
+        the observation carries the onset stamps. ``(None, None)`` means no
+        response.
+        """
+        obs = Observation(
+            mode=getattr(ctx, "mode", "qa") if ctx is not None else "qa",
+            trial_id=self.get_state("trial_id", self.get_state("trial_index", None)),
+            block_id=self.get_state("block_id", None),
+            phase=self.label,
+            deadline_s=window_s,
+            response_window_open=True,
+            response_window_s=window_s,
+            valid_keys=list(keys),
+            t_phase_onset=self.get_state("onset_time", None),
+            t_phase_onset_global=self.get_state("onset_time_global", None),
+            stim_id=self.get_state("stim_id", None),
+            stim_features=self.get_state("stim_features", None),
+            condition_id=self.get_state("condition_id", None),
+            task_factors=self.get_state("task_factors", None) or {},
+        )
+        if adapter is None:
+            adapter = _responder_adapter(ctx)
+        plan = getattr(ctx, "action_plan", None)
+        planned, action = plan.take(obs) if plan is not None else (False, None)
+        try:
+            if planned:
+                handled = adapter.handle_action(obs, action)
+            else:
+                handled = adapter.handle_response(obs, responder)
+        except ResponderActionError:
+            # Strict mode intentionally raises; other modes degrade to timeout.
+            raise
+        except Exception:
+            return None, None
+        if handled is None:
+            return None, None
+        return handled.used_action.key, handled.used_action.rt_s
+
+    def _record_timeout(self, correct_keys: list[str], timeout_trigger: int | None) -> None:
+        """Store no-response fields and emit the timeout trigger."""
+        self.set_state(
+            hit=False, 
+            correct_keys=correct_keys,
+            response=None, 
+            key_press=False,
+            rt=None,
+            response_time=None,
+            response_time_global=None,
+            timeout_trigger=timeout_trigger
+        )
+        self._emit_trigger(
+            timeout_trigger,
+            when="now",
+            wait=True,
+            name=f"{self.label}_timeout",
+            meta={"kind": "timeout"},
+        )
+
+    def _responder_feedback(self, responder: Any, responded: bool) -> None:
+        """Optional responder feedback hook for adaptive plugins."""
+        if not hasattr(responder, "on_feedback"):
+            return
+        try:
+            outcome = "timeout"
+            if responded:
+                outcome = "hit" if bool(self.get_state("hit", False)) else "error"
+            responder.on_feedback(
+                Feedback(
+                    trial_id=self.get_state("trial_id", self.get_state("trial_index", "unknown")),
+                    phase=self.label,
+                    outcome=outcome,
+                    reward=None,
+                    meta={
+                        "condition_id": self.get_state("condition_id", None),
+                        "task_factors": self.get_state("task_factors", None),
+                        "response": self.get_state("response", None),
+                        "rt_s": self.get_state("rt", None),
+                    },
+                )
+            )
+        except Exception:
+            pass
+
+    def _resolve_response_analytically(
+        self,
+        *,
+        n_frames: int,
+        sim_key: str | None,
+        sim_rt: float | None,
+        correct_keys: list[str],
+        response_trigger: int | dict[str, int] | None,
+        terminate_on_response: bool,
+    ) -> bool:
+        """Event-driven sim path for :meth:`capture_response`.
+
+        The frame loop registers a simulated response on the first post-onset
+        flip ``j`` (1-based) where ``j * frame_time >= sim_rt``. This computes
+        ``j`` directly, writes the same state keys the loop would and advances
+        the virtual clock by the flips skipped, so it requires a window with
+        ``advance_frames`` (see :func:`_can_skip_frames`). Returns whether a
+        response was registered.
+        """
+        n_loop = n_frames - 1
+        response_frame = None
+        if sim_key is not None and sim_rt is not None and n_loop > 0:
+            # Tolerate float error so an RT on an exact frame boundary lands on that frame.
+            j = max(1, math.ceil(float(sim_rt) / self.frame_time - 1e-9))
+            if j <= n_loop:
+                response_frame = j
+
+        advance = self.win.advance_frames
+
+        if response_frame is None:
+            if n_loop > 0:
+                advance(n_loop)
+                self._stamp_close()
+            return False
+
+        # The response (and its "now" trigger) happens on flip j, as in the loop.
+        rt = float(sim_rt)
+        advance(response_frame)
+        response_time_global = self._record_response(sim_key, rt, correct_keys, response_trigger)
+        if terminate_on_response:
+            self.set_state(close_time=rt, close_time_global=response_time_global)
+        else:
+            advance(n_loop - response_frame)
+            self._stamp_close()
+        return True
+
     def capture_response(
         self,
         keys: list[str],
@@ -755,22 +1093,17 @@ class StimUnit:
             If a dict: maps key names -> highlight stimuli.
         dynamic_highlight : bool
             If True, allow multiple key presses and update the highlight each time.
+
+        Notes
+        -----
+        With a responder active, ``event_driven`` enabled in the runtime
+        config (``sim.event_driven`` / ``qa.event_driven``) and a headless
+        window whose clock can skip frames, the per-frame loop is skipped: the response frame, close stamp, response trigger
+        and timeout outcome are computed from the action and the frame period.
+        State keys are the same as in the frame loop.
         """
         # decide total duration
-        local_rng = random.Random()
-        if isinstance(duration, (list, tuple)):
-            if len(duration) == 2:
-                t_val = local_rng.uniform(*duration)
-            elif len(duration) == 1:
-                t_val = duration[0]
-            else:
-                raise ValueError(f"Duration list/tuple must have 1 or 2 elements, got {len(duration)}")
-        elif isinstance(duration, (int, float)):
-            t_val = duration
-        else:
-            raise TypeError(f"Invalid duration type: {type(duration)}")
-
-        nominal = float(t_val)
+        nominal = self._resolve_duration(duration)
         used, n_frames, scaled = self._qa_scale_duration(nominal)
         if scaled:
             self.set_state(duration_nominal=nominal, duration_scaled=used)
@@ -801,7 +1134,7 @@ class StimUnit:
         if n_frames == 1:
             # Window rounds to a single frame: onset and close occur on the same flip.
             self.win.callOnFlip(self._stamp_close)
-        flip_time = self.win.flip()
+        flip_time = self._flip()
         self.set_state(flip_time=flip_time)
 
          # if no correct_keys provided, any key in `keys` is valid
@@ -821,43 +1154,21 @@ class StimUnit:
         sim_key = None
         sim_rt = None
         if responder is not None:
-            obs = Observation(
-                mode=getattr(ctx, "mode", "qa") if ctx is not None else "qa",
-                trial_id=self.get_state("trial_id", self.get_state("trial_index", None)),
-                block_id=self.get_state("block_id", None),
-                phase=self.label,
-                deadline_s=used,
-                response_window_open=True,
-                response_window_s=used,
-                valid_keys=list(keys),
-                t_phase_onset=self.get_state("onset_time", None),
-                t_phase_onset_global=self.get_state("onset_time_global", None),
-                stim_id=self.get_state("stim_id", None),
-                stim_features=self.get_state("stim_features", None),
-                condition_id=self.get_state("condition_id", None),
-                task_factors=self.get_state("task_factors", None) or {},
-            )
-            adapter = ResponderAdapter(
-                policy=str(getattr(getattr(ctx, "config", None), "sim_policy", "warn") or "warn"),
-                default_rt_s=float(getattr(getattr(ctx, "config", None), "default_rt_s", 0.2) or 0.2),
-                clamp_rt=bool(getattr(getattr(ctx, "config", None), "clamp_rt", False)),
-                logger=getattr(ctx, "sim_logger", None) if ctx is not None else None,
-                session=getattr(ctx, "session", None) if ctx is not None else None,
+            sim_key, sim_rt = self._responder_action(responder, ctx, keys, used)
+
+        event_driven = responder is not None and not dynamic_highlight and _can_skip_frames(ctx, self.win)
+        if event_driven:
+            responded = self._resolve_response_analytically(
+                n_frames=n_frames,
+                sim_key=sim_key,
+                sim_rt=sim_rt,
+                correct_keys=correct_keys,
+                response_trigger=response_trigger,
+                terminate_on_response=terminate_on_response,
             )
-            handled = None
-            try:
-                handled = adapter.handle_response(obs, responder)
-            except ResponderActionError:
-                # Strict mode intentionally raises; other modes degrade to timeout.
-                raise
-            except Exception:
-                handled = None
-            if handled is not None:
-                sim_key = handled.used_action.key
-                sim_rt = handled.used_action.rt_s
 
         visual_stims = [s for s in self.stimuli if hasattr(s, "draw") and callable(s.draw)]
-        for frame_i in range(n_frames - 1):
+        for frame_i in range(0 if event_driven else n_frames - 1):
             # draw or blank?
             if not (responded and terminate_on_response):
                 for stim in visual_stims:
@@ -873,7 +1184,7 @@ class StimUnit:
             # If we run the full window, stamp stage-close on the final flip.
             if frame_i == n_frames - 2:
                 self.win.callOnFlip(self._stamp_close)
-            self.win.flip()
+            self._flip()
 
             # only listen for keys if we haven't responded or if dynamic_highlight=True
             if not responded or dynamic_highlight:
@@ -884,32 +1195,7 @@ class StimUnit:
                         k = kp.name
                         chosen_key = k
                         rt = kp.rt
-                        onset_time_global = self.get_state("onset_time_global", None)
-                        response_time_global = (
-                            onset_time_global + rt
-                            if onset_time_global is not None
-                            else core.getAbsTime()
-                        )
-                        self.set_state(
-                            hit=k in correct_keys,
-                            correct_keys=correct_keys,
-                            response=k,
-                            key_press=True,
-                            rt=rt,
-                            response_time=rt,
-                            response_time_global=response_time_global,
-                        )
-                        code = (response_trigger.get(k, None)
-                            if isinstance(response_trigger, dict)
-                            else response_trigger)
-                        self._emit_trigger(
-                            code,
-                            when="now",
-                            wait=True,
-                            name=f"{self.label}_response",
-                            meta={"kind": "response", "key": k},
-                        )
-                        self.set_state(response_trigger=code)
+                        response_time_global = self._record_response(k, rt, correct_keys, response_trigger)
                         responded = True
 
                         # if we should stop immediately, break out
@@ -923,32 +1209,7 @@ class StimUnit:
                         k = sim_key
                         chosen_key = k
                         rt = sim_rt
-                        onset_time_global = self.get_state("onset_time_global", None)
-                        response_time_global = (
-                            onset_time_global + rt
-                            if onset_time_global is not None
-                            else core.getAbsTime()
-                        )
-                        self.set_state(
-                            hit=k in correct_keys,
-                            correct_keys=correct_keys,
-                            response=k,
-                            key_press=True,
-                            rt=rt,
-                            response_time=rt,
-                            response_time_global=response_time_global,
-                        )
-                        code = (response_trigger.get(k, None)
-                            if isinstance(response_trigger, dict)
-                            else response_trigger)
-                        self._emit_trigger(
-                            code,
-                            when="now",
-                            wait=True,
-                            name=f"{self.label}_response",
-                            meta={"kind": "response", "key": k},
-                        )
-                        self.set_state(response_trigger=code)
+                        response_time_global = self._record_response(k, rt, correct_keys, response_trigger)
                         responded = True
 
                         if terminate_on_response and not dynamic_highlight:
@@ -957,52 +1218,17 @@ class StimUnit:
 
 
         if not responded: 
-            self.set_state(
-                hit=False, 
-                correct_keys=correct_keys,
-                response=None, 
-                key_press=False,
-                rt=None,
-                response_time=None,
-                response_time_global=None,
-                timeout_trigger=timeout_trigger
-            )
-            self._emit_trigger(
-                timeout_trigger,
-                when="now",
-                wait=True,
-                name=f"{self.label}_timeout",
-                meta={"kind": "timeout"},
-            )
+            self._record_timeout(correct_keys, timeout_trigger)
 
-        # Optional responder feedback hook for adaptive plugins.
-        if responder is not None and hasattr(responder, "on_feedback"):
-            try:
-                outcome = "timeout"
-                if responded:
-                    outcome = "hit" if bool(self.get_state("hit", False)) else "error"
-                responder.on_feedback(
-                    Feedback(
-                        trial_id=self.get_state("trial_id", self.get_state("trial_index", "unknown")),
-                        phase=self.label,
-                        outcome=outcome,
-                        reward=None,
-                        meta={
-                            "condition_id": self.get_state("condition_id", None),
-                            "task_factors": self.get_state("task_factors", None),
-                            "response": self.get_state("response", None),
-                            "rt_s": self.get_state("rt", None),
-                        },
-                    )
-                )
-            except Exception:
-                pass
+        if responder is not None:
+            self._responder_feedback(responder, responded)
 
         # Ensure close time exists (should be stamped on final flip for timeouts,
         # or set explicitly for terminate-on-response).
         if self.get_state("close_time", None) is None:
             self._stamp_close()
 
+        self._end_stage()
         self.log_unit()
         return self
     def wait_and_continue(
@@ -1060,7 +1286,7 @@ class StimUnit:
         self.win.callOnFlip(self._stamp_onset)
         for stim in sound_stims:
             self.win.callOnFlip(stim.play)
-        flip_time = self.win.flip()
+        flip_time = self._flip()
         self.set_state(flip_time=flip_time)
 
         ctx = get_context()
@@ -1088,13 +1314,7 @@ class StimUnit:
                 task_factors=self.get_state("task_factors", None) or {},
                 extras={"min_wait_s": float(min_wait or 0.0)},
             )
-            adapter = ResponderAdapter(
-                policy=str(getattr(getattr(ctx, "config", None), "sim_policy", "warn") or "warn"),
-                default_rt_s=float(getattr(getattr(ctx, "config", None), "default_rt_s", 0.2) or 0.2),
-                clamp_rt=bool(getattr(getattr(ctx, "config", None), "clamp_rt", False)),
-                logger=getattr(ctx, "sim_logger", None) if ctx is not None else None,
-                session=getattr(ctx, "session", None) if ctx is not None else None,
-            )
+            adapter = _responder_adapter(ctx)
             handled = None
             try:
                 handled = adapter.handle_response(obs, responder)
@@ -1112,7 +1332,7 @@ class StimUnit:
             for stim in self.stimuli:
                 if not (hasattr(stim, "play") and callable(stim.play)):
                     stim.draw()
-            self.win.flip()
+            self._flip()
 
             if responder is None:
                 keys_pressed = self.kb.getKeys(keyList=keys, waitRelease=False)
@@ -1129,7 +1349,7 @@ class StimUnit:
                     response_time_global = (
                         onset_time_global + rt
                         if onset_time_global is not None and rt is not None
-                        else core.getAbsTime()
+                        else self._abs_time()
                     )
                     self.set_state(
                         response=key,
@@ -1152,7 +1372,7 @@ class StimUnit:
                     response_time_global = (
                         onset_time_global + rt
                         if onset_time_global is not None and rt is not None
-                        else core.getAbsTime()
+                        else self._abs_time()
                     )
                     self.set_state(
                         response=key,
@@ -1167,6 +1387,7 @@ class StimUnit:
             "Experiment ended by key press." if terminate else f"Continuing after key '{key}'"
         )
         logging.data(f"[StimUnit] wait_and_continue: {msg}")
+        self._end_stage()
         self.log_unit()
 
         if responder is not None and hasattr(responder, "on_feedback"):
@@ -5,6 +5,7 @@ output paths.  Instantiate directly or via :meth:`TaskSettings.from_dict` with
 a YAML-loaded dictionary.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import List, Optional, Any, Dict
 from math import ceil
@@ -222,6 +223,8 @@ class TaskSettings:
         for key, val in settings_dict.items():
             if isinstance(val, set):
                 settings_dict[key] = list(val)
+            elif isinstance(val, Mapping) and not isinstance(val, dict):
+                settings_dict[key] = dict(val)
 
         with open(self.json_file, 'w', encoding='utf-8') as f:
             from json import dump
@@ -0,0 +1,378 @@
+"""Gap-free execution of the stages of one trial.
+
+Running a trial as a sequence of :class:`~psyflow.StimUnit` calls puts
+Python setup (building units and observations, formatting text, setting the
+trial context, constructing the responder adapter) between the last flip of
+one stage and the onset flip of the next. :class:`TrialTimeline` does that
+work up front in :meth:`~TrialTimeline.prepare` and then runs all stages in
+one frame loop, drawing the first frame of stage N+1 in the same iteration
+that closes stage N.
+
+Every stage is backed by a StimUnit, so state keys (prefixed with the stage
+label), flip-locked onset/close stamps, triggers and sim/QA responder
+handling match :meth:`StimUnit.show` and :meth:`StimUnit.capture_response`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+from psychopy import visual
+from psychopy.hardware.keyboard import Keyboard
+
+from .StimUnit import StimUnit, _can_skip_frames, _responder_adapter
+from .sim.context import get_context
+from .sim.context_helpers import set_trial_context
+from .utils.idle import run_idle
+
+
+@dataclass
+class StageSpec:
+    """Declarative description of one trial stage.
+
+    A stage with ``keys`` is a response window (as in
+    :meth:`StimUnit.capture_response`); otherwise it is a timed display (as
+    in :meth:`StimUnit.show`).
+
+    Parameters
+    ----------
+    label : str
+        Stage name; also the prefix of its state keys.
+    stimuli : sequence
+        Visual and sound stimuli. Sounds start on the onset flip.
+    duration : float, (min, max), (d,) or None
+        Stage duration in seconds. ``None`` (displays only) uses the longest
+        sound. Sampled once, in :meth:`TrialTimeline.prepare`.
+    onset_trigger, offset_trigger : int, optional
+        Flip-locked trigger codes. ``offset_trigger`` applies to displays only.
+    keys : sequence of str, optional
+        Response keys; makes this a response stage.
+    correct_keys : sequence of str, optional
+        Keys counted as hits (default: ``keys``).
+    response_trigger : int or dict, optional
+        Trigger on response, optionally per key.
+    timeout_trigger : int, optional
+        Trigger when the window ends without a response.
+    terminate_on_response : bool
+        End the stage at the first response (default) instead of running
+        the full window.
+    context : Mapping, optional
+        Keyword arguments for :func:`~psyflow.set_trial_context`. ``phase``,
+        ``deadline_s`` and ``valid_keys`` default to the stage's label,
+        duration and keys.
+    when : callable, optional
+        ``when(state) -> bool`` evaluated at the stage boundary with the
+        merged state of the stages run so far; the stage is skipped if it
+        returns False. Use it to pick between prepared alternatives (e.g.
+        hit/miss feedback) without building anything mid-trial.
+    composite : bool
+        Pre-render the visual stimuli into one texture (see
+        :meth:`StimUnit.show`).
+    idle_work : bool
+        Run queued idle work (e.g. next-trial prefetch) between the flips of
+        this stage, as with ``StimUnit.show(..., idle_work=True)``.
+    """
+
+    label: str
+    stimuli: Sequence[Any] = ()
+    duration: float | list | tuple | None = 0.0
+    onset_trigger: Optional[int] = None
+    offset_trigger: Optional[int] = None
+    keys: Optional[Sequence[str]] = None
+    correct_keys: Optional[Sequence[str]] = None
+    response_trigger: int | Dict[str, int] | None = None
+    timeout_trigger: Optional[int] = None
+    terminate_on_response: bool = True
+    context: Optional[Mapping[str, Any]] = None
+    when: Optional[Callable[[Dict[str, Any]], bool]] = None
+    composite: bool = False
+    idle_work: bool = False
+
+    @property
+    def is_response(self) -> bool:
+        return self.keys is not None
+
+
+@dataclass
+class _StagePlan:
+    spec: StageSpec
+    unit: StimUnit
+    n_frames: int
+    window_s: float
+    visual: List[Any]
+    sound: List[Any]
+    keys: List[str] = field(default_factory=list)
+    correct_keys: List[str] = field(default_factory=list)
+    responded: bool = False
+
+
+class TrialTimeline:
+    """Prepare and run the stages of one trial back-to-back.
+
+    Parameters
+    ----------
+    win : visual.Window
+        Window shared by all stages.
+    kb : Keyboard, optional
+        Keyboard shared by all stages.
+    runtime : TriggerRuntime, optional
+        Trigger runtime passed to every stage unit.
+    frame_recorder : FrameTimingRecorder, optional
+        Per-stage flip recording, as for :class:`StimUnit`.
+    stages : iterable of StageSpec, optional
+        Initial stages; more can be added with :meth:`add_stage`.
+
+    Examples
+    --------
+    >>> timeline = TrialTimeline(win, kb, runtime=runtime)
+    >>> timeline.add_stage("fixation", stimuli=[fix], duration=0.5, onset_trigger=10)
+    >>> timeline.add_stage("target", stimuli=[target], duration=1.0, keys=["f", "j"])
+    >>> timeline.run().to_dict(trial_data)
+    """
+
+    def __init__(
+        self,
+        win: visual.Window,
+        kb: Optional[Keyboard] = None,
+        runtime: Any = None,
+        frame_recorder: Any = None,
+        stages: Sequence[StageSpec] = (),
+    ):
+        self.win = win
+        self.kb = kb or Keyboard()
+        self.runtime = runtime
+        self.frame_recorder = frame_recorder
+        self.stages: List[StageSpec] = list(stages)
+        self.state: Dict[str, Any] = {}
+        self._plans: Optional[List[_StagePlan]] = None
+        self._ran: List[_StagePlan] = []
+
+    def add_stage(self, spec: StageSpec | str, **kwargs: Any) -> "TrialTimeline":
+        """Append a stage, given as a :class:`StageSpec` or its keyword arguments."""
+        if isinstance(spec, str):
+            spec = StageSpec(label=spec, **kwargs)
+        elif kwargs:
+            raise TypeError("add_stage() takes either a StageSpec or a label with keyword arguments")
+        self.stages.append(spec)
+        self._plans = None
+        return self
+
+    def prepare(self) -> "TrialTimeline":
+        """Build every stage's unit, stimuli lists, frame count and context.
+
+        Called by :meth:`run` if needed; call it explicitly to move the work
+        to a convenient point (e.g. before the previous trial's ITI ends).
+        """
+        plans = []
+        for spec in self.stages:
+            unit = StimUnit(
+                spec.label,
+                self.win,
+                kb=self.kb,
+                runtime=self.runtime,
+                frame_recorder=self.frame_recorder,
+            )
+            if spec.stimuli:
+                unit.add_stim(list(spec.stimuli))
+            nominal = unit._resolve_duration(spec.duration, from_sounds=not spec.is_response)
+            used, n_frames, scaled = unit._qa_scale_duration(nominal)
+            if scaled:
+                unit.set_state(duration_nominal=nominal, duration_scaled=used)
+            unit.set_state(duration=used)
+
+            keys = [str(k) for k in spec.keys] if spec.keys is not None else []
+            if spec.context is not None:
+                context = {"phase": spec.label, "deadline_s": nominal, "valid_keys": keys, **spec.context}
+                set_trial_context(unit, **context)
+
+            sound = [s for s in unit.stimuli if hasattr(s, "play") and callable(s.play)]
+            visual_stims = [s for s in unit.stimuli if s not in sound and hasattr(s, "draw") and callable(s.draw)]
+            if spec.composite and len(visual_stims) > 1:
+                cached = unit._composite(visual_stims)
+                if cached is not None:
+                    visual_stims = [cached]
+                unit.set_state(composite=cached is not None)
+
+            if spec.correct_keys is None:
+                correct_keys = list(keys)
+            elif isinstance(spec.correct_keys, str):
+                correct_keys = [spec.correct_keys]
+            else:
+                correct_keys = list(spec.correct_keys)
+            plans.append(_StagePlan(spec, unit, n_frames, used, visual_stims, sound, keys, correct_keys))
+        self._plans = plans
+        return self
+
+    # -- execution ----------------------------------------------------------
+    def _next(self, index: int) -> Optional[int]:
+        for j in range(index + 1, len(self._plans)):
+            when = self._plans[j].spec.when
+            if when is None or when(self.state):
+                return j
+        return None
+
+    def _schedule_close(self, plan: _StagePlan) -> None:
+        unit = plan.unit
+        if plan.spec.is_response:
+            self.win.callOnFlip(unit._stamp_close)
+            return
+        offset_trigger = plan.spec.offset_trigger
+        self.win.callOnFlip(unit._stamp_close, offset_trigger)
+        unit._emit_trigger(
+            offset_trigger,
+            when="flip",
+            wait=False,
+            name=f"{unit.label}_offset",
+            meta={"kind": "offset"},
+        )
+
+    def _begin(self, plan: _StagePlan) -> None:
+        """Draw the onset frame of ``plan`` and schedule its onset callbacks."""
+        unit = plan.unit
+        for stim in plan.visual:
+            stim.draw()
+        if plan.spec.is_response:
+            self.win.callOnFlip(self.kb.clearEvents)
+            self.win.callOnFlip(unit._reset_keyboard_clock)
+        self.win.callOnFlip(unit.clock.reset)
+        self.win.callOnFlip(unit._stamp_onset, plan.spec.onset_trigger)
+        unit._emit_trigger(
+            plan.spec.onset_trigger,
+            when="flip",
+            wait=False,
+            name=f"{unit.label}_onset",
+            meta={"kind": "onset"},
+        )
+        for stim in plan.sound:
+            self.win.callOnFlip(stim.play)
+        if plan.n_frames == 1:
+            self._schedule_close(plan)
+
+    def _finish(self, plan: _StagePlan, responder: Any) -> None:
+        """Cheap end-of-stage bookkeeping, run before the next onset frame is drawn."""
+        unit = plan.unit
+        if plan.spec.is_response:
+            if not plan.responded:
+                unit._record_timeout(plan.correct_keys, plan.spec.timeout_trigger)
+            if responder is not None:
+                unit._responder_feedback(responder, plan.responded)
+        if unit.get_state("close_time", None) is None:
+            unit._stamp_close()
+        unit._end_frame_stage()
+        self.state.update(unit.state)
+        self._ran.append(plan)
+
+    def run(self) -> "TrialTimeline":
+        """Run all (selected) stages in a single frame loop.
+
+        Logging of the stage states and the trigger runtime's audit flush
+        are deferred until the last stage has ended.
+        """
+        if self._plans is None:
+            self.prepare()
+        self.state = {}
+        self._ran = []
+
+        ctx = get_context()
+        responder = None
+        if ctx is not None and ctx.mode in ("qa", "sim") and getattr(ctx, "responder", None) is not None:
+            responder = ctx.responder
+        adapter = _responder_adapter(ctx) if responder is not None else None
+        event_driven = responder is not None and _can_skip_frames(ctx, self.win)
+
+        index = self._next(-1)
+        if index is None:
+            return self
+        plan = self._plans[index]
+        self._begin(plan)
+        frame = 0
+        sim_key = sim_rt = None
+
+        while True:
+            unit = plan.unit
+            spec = plan.spec
+            t_flip = unit._flip()
+            frame += 1
+            done = frame >= plan.n_frames
+
+            if frame == 1:
+                unit.set_state(flip_time=t_flip)
+                if spec.is_response and responder is not None:
+                    sim_key, sim_rt = unit._responder_action(
+                        responder, ctx, plan.keys, plan.window_s, adapter=adapter
+                    )
+                    if event_driven:
+                        plan.responded = unit._resolve_response_analytically(
+                            n_frames=plan.n_frames,
+                            sim_key=sim_key,
+                            sim_rt=sim_rt,
+                            correct_keys=plan.correct_keys,
+                            response_trigger=spec.response_trigger,
+                            terminate_on_response=spec.terminate_on_response,
+                        )
+                        done = True
+            elif spec.is_response and not plan.responded:
+                key = rt = None
+                if responder is None:
+                    keypress = self.kb.getKeys(keyList=plan.keys, waitRelease=False)
+                    if keypress:
+                        key, rt = keypress[0].name, keypress[0].rt
+                elif sim_key is not None and sim_rt is not None and unit.clock.getTime() >= sim_rt:
+                    key, rt = sim_key, sim_rt
+                if key is not None:
+                    response_time_global = unit._record_response(
+                        key, rt, plan.correct_keys, spec.response_trigger
+                    )
+                    plan.responded = True
+                    if spec.terminate_on_response:
+                        unit.set_state(close_time=rt, close_time_global=response_time_global)
+                        done = True
+
+            if not done:
+                if spec.idle_work:
+                    run_idle(unit.frame_time)
+                for stim in plan.visual:
+                    stim.draw()
+                if frame == plan.n_frames - 1:
+                    self._schedule_close(plan)
+                continue
+
+            if not spec.is_response and t_flip is not None:
+                unit.set_state(offset_flip_time=t_flip)
+            self._finish(plan, responder)
+            index = self._next(index)
+            if index is None:
+                break
+            plan = self._plans[index]
+            self._begin(plan)
+            frame = 0
+            sim_key = sim_rt = None
+
+        flush_audit = getattr(self.runtime, "flush_audit", None)
+        if flush_audit is not None:
+            flush_audit()
+        for ran in self._ran:
+            ran.unit.log_unit()
+        return self
+
+    # -- results ------------------------------------------------------------
+    def stage(self, label: str) -> StimUnit:
+        """The unit of the stage ``label`` that ran (or the first prepared one)."""
+        for plan in reversed(self._ran):
+            if plan.spec.label == label:
+                return plan.unit
+        for plan in self._plans or ():
+            if plan.spec.label == label:
+                return plan.unit
+        raise KeyError(label)
+
+    def get_state(self, key: str, default: Any = None) -> Any:
+        """Look up ``key`` (already prefixed, e.g. ``"target_rt"``) in the merged state."""
+        return self.state.get(key, default)
+
+    def to_dict(self, target: Optional[dict] = None) -> "TrialTimeline":
+        """Update ``target`` with the state of every stage that ran."""
+        if target is not None:
+            target.update(self.state)
+        return self
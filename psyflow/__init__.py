@@ -20,11 +20,15 @@ _LAZY_ATTRS: dict[str, tuple[str, str]] = {
     "StimUnit": ("psyflow.StimUnit", "StimUnit"),
     "SubInfo": ("psyflow.SubInfo", "SubInfo"),
     "TaskSettings": ("psyflow.TaskSettings", "TaskSettings"),
+    "StageSpec": ("psyflow.TrialTimeline", "StageSpec"),
+    "TrialTimeline": ("psyflow.TrialTimeline", "TrialTimeline"),
     # Trigger runtime/driver (recommended)
     "TriggerRuntime": ("psyflow.io.runtime", "TriggerRuntime"),
     "TriggerEvent": ("psyflow.io.events", "TriggerEvent"),
+    "TriggerTable": ("psyflow.io.table", "TriggerTable"),
     "MockDriver": ("psyflow.io.drivers.mock", "MockDriver"),
     "SerialDriver": ("psyflow.io.drivers.serial", "SerialDriver"),
+    "AsyncSerialDriver": ("psyflow.io.drivers.serial", "AsyncSerialDriver"),
     "FanoutDriver": ("psyflow.io.drivers.fanout", "FanoutDriver"),
     "CallableDriver": ("psyflow.io.drivers.callable", "CallableDriver"),
     # CLI entry
@@ -38,12 +42,30 @@ _LAZY_ATTRS: dict[str, tuple[str, str]] = {
     "initialize_triggers": ("psyflow.io", "initialize_triggers"),
     "initialize_exp": ("psyflow.utils", "initialize_exp"),
     "list_supported_voices": ("psyflow.utils", "list_supported_voices"),
+    "FrameTimingRecorder": ("psyflow.utils", "FrameTimingRecorder"),
+    "IdleScheduler": ("psyflow.utils", "IdleScheduler"),
+    "JitterSchedule": ("psyflow.utils", "JitterSchedule"),
+    "JitterSpec": ("psyflow.utils", "JitterSpec"),
+    "plan_jitter": ("psyflow.utils", "plan_jitter"),
+    "ResultStore": ("psyflow.utils", "ResultStore"),
+    "SequenceConstraints": ("psyflow.utils", "SequenceConstraints"),
+    "check_sequence": ("psyflow.utils", "check_sequence"),
+    "generate_sequence": ("psyflow.utils", "generate_sequence"),
+    "CheckpointWriter": ("psyflow.utils", "CheckpointWriter"),
+    "AssetCache": ("psyflow.utils", "AssetCache"),
+    "load_checkpoint": ("psyflow.utils", "load_checkpoint"),
+    "EdgeTTSBackend": ("psyflow.utils", "EdgeTTSBackend"),
+    "TTSRequest": ("psyflow.utils", "TTSRequest"),
+    "synthesize_batch": ("psyflow.utils", "synthesize_batch"),
     # Task runtime option parsing helpers
     "TaskRunOptions": ("psyflow.task_options", "TaskRunOptions"),
     "build_task_arg_parser": ("psyflow.task_options", "build_task_arg_parser"),
     "parse_task_run_options": ("psyflow.task_options", "parse_task_run_options"),
     "resolve_config_path": ("psyflow.task_options", "resolve_config_path"),
     "resolve_mode": ("psyflow.task_options", "resolve_mode"),
+    # Session clock
+    "SessionClock": ("psyflow.clock", "SessionClock"),
+    "get_session_clock": ("psyflow.sim", "get_session_clock"),
     # Sim/QA runtime context helpers
     "RuntimeContext": ("psyflow.sim", "RuntimeContext"),
     "context_from_config": ("psyflow.sim", "context_from_config"),
@@ -65,7 +87,10 @@ if TYPE_CHECKING:
     from .StimUnit import StimUnit as StimUnit
     from .SubInfo import SubInfo as SubInfo
     from .TaskSettings import TaskSettings as TaskSettings
+    from .TrialTimeline import StageSpec as StageSpec
+    from .TrialTimeline import TrialTimeline as TrialTimeline
     from .cli import main as cli_main
+    from .clock import SessionClock as SessionClock
     from .io import initialize_triggers as initialize_triggers
     from .task_options import (
         TaskRunOptions as TaskRunOptions,
@@ -77,10 +102,26 @@ if TYPE_CHECKING:
     from .sim import (
         RuntimeContext as RuntimeContext,
         context_from_config as context_from_config,
+        get_session_clock as get_session_clock,
         runtime_context as runtime_context,
         set_trial_context as set_trial_context,
     )
     from .utils import (
+        FrameTimingRecorder as FrameTimingRecorder,
+        IdleScheduler as IdleScheduler,
+        JitterSchedule as JitterSchedule,
+        JitterSpec as JitterSpec,
+        plan_jitter as plan_jitter,
+        ResultStore as ResultStore,
+        SequenceConstraints as SequenceConstraints,
+        check_sequence as check_sequence,
+        generate_sequence as generate_sequence,
+        CheckpointWriter as CheckpointWriter,
+        AssetCache as AssetCache,
+        EdgeTTSBackend as EdgeTTSBackend,
+        TTSRequest as TTSRequest,
+        synthesize_batch as synthesize_batch,
+        load_checkpoint as load_checkpoint,
         count_down as count_down,
         initialize_exp as initialize_exp,
         list_supported_voices as list_supported_voices,
@@ -0,0 +1,82 @@
+"""Session clock shared by StimUnit, TriggerRuntime and the event loggers.
+
+All timestamps of a session are taken from one monotonic
+``time.perf_counter_ns`` counter. A single wall-clock anchor, recorded when the
+clock is created, maps them onto absolute time, so stage onsets, trigger
+send times and log records can be compared without clock-domain errors.
+
+The active clock lives on the runtime context
+(:func:`psyflow.sim.context.get_session_clock`); outside a context a
+process-wide default clock is used.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+
+class SessionClock:
+    """Monotonic nanosecond clock with one wall-clock anchor.
+
+    ``now_ns()`` is integer nanoseconds since the clock was created and is the
+    cheap stamp to store on hot paths; ``getAbsTime()`` and :meth:`to_wall`
+    convert to epoch seconds when a record is built.
+    """
+
+    def __init__(self, *, wall_anchor: Optional[float] = None):
+        self._t0_ns = time.perf_counter_ns()
+        self.wall_anchor = float(time.time() if wall_anchor is None else wall_anchor)
+
+    def now_ns(self) -> int:
+        return time.perf_counter_ns() - self._t0_ns
+
+    def now(self) -> float:
+        return self.now_ns() / 1e9
+
+    # PsychoPy ``core.Clock`` / ``core.getAbsTime`` compatible names.
+    def getTime(self) -> float:
+        return self.now()
+
+    def getAbsTime(self) -> float:
+        return self.wall_anchor + self.now()
+
+    def to_wall(self, t_ns: int) -> float:
+        """Epoch seconds for a :meth:`now_ns` stamp."""
+        return self.wall_anchor + t_ns / 1e9
+
+    def to_utc_iso(self, t_ns: int) -> str:
+        """ISO-8601 UTC string for a :meth:`now_ns` stamp."""
+        return datetime.fromtimestamp(self.to_wall(t_ns), timezone.utc).isoformat()
+
+    def make_timer(self) -> "ClockTimer":
+        return ClockTimer(self)
+
+
+class ClockTimer:
+    """Resettable relative timer on a :class:`SessionClock` (``core.Clock`` API)."""
+
+    def __init__(self, clock: SessionClock):
+        self._clock = clock
+        self._t0 = clock.now()
+
+    def getTime(self) -> float:
+        return self._clock.now() - self._t0
+
+    def reset(self, newT: float = 0.0) -> None:
+        self._t0 = self._clock.now() + float(newT)
+
+    def addTime(self, t: float) -> None:
+        self._t0 -= float(t)
+
+
+_DEFAULT_CLOCK: Optional[SessionClock] = None
+
+
+def default_clock() -> SessionClock:
+    """Process-wide clock used when no runtime context is active."""
+    global _DEFAULT_CLOCK
+    if _DEFAULT_CLOCK is None:
+        _DEFAULT_CLOCK = SessionClock()
+    return _DEFAULT_CLOCK
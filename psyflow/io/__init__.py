@@ -8,21 +8,26 @@ This module is designed so that:
 
 from .events import TriggerEvent
 from .runtime import TriggerRuntime, make_jsonl_logger
+from .sink import JsonlEventSink
+from .table import TriggerTable
 from .trigger import initialize_triggers
 from .drivers.base import TriggerDriver
 from .drivers.callable import CallableDriver
 from .drivers.mock import MockDriver
-from .drivers.serial import SerialDriver
+from .drivers.serial import AsyncSerialDriver, SerialDriver
 from .drivers.fanout import FanoutDriver
 
 __all__ = [
+    "AsyncSerialDriver",
     "CallableDriver",
     "FanoutDriver",
+    "JsonlEventSink",
     "MockDriver",
     "SerialDriver",
     "TriggerDriver",
     "TriggerEvent",
     "TriggerRuntime",
+    "TriggerTable",
     "initialize_triggers",
     "make_jsonl_logger",
 ]
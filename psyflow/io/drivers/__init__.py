@@ -2,9 +2,10 @@ from .base import TriggerDriver
 from .callable import CallableDriver
 from .fanout import FanoutDriver
 from .mock import MockDriver
-from .serial import SerialDriver
+from .serial import AsyncSerialDriver, SerialDriver
 
 __all__ = [
+    "AsyncSerialDriver",
     "CallableDriver",
     "FanoutDriver",
     "MockDriver",
@@ -1,37 +1,192 @@
 from __future__ import annotations
 
-from typing import Iterable
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Iterable, Optional
 
 from ..events import TriggerEvent
 
+_STOP = object()
+
+
+def _summary(values: Iterable[float]) -> dict[str, Any]:
+    vals = sorted(values)
+    if not vals:
+        return {"n": 0, "mean": None, "max": None, "p95": None}
+    return {
+        "n": len(vals),
+        "mean": sum(vals) / len(vals),
+        "max": vals[-1],
+        "p95": vals[min(len(vals) - 1, int(round(0.95 * (len(vals) - 1))))],
+    }
+
+
+class _Dispatch:
+    """One event being delivered to every driver of a fanout."""
+
+    __slots__ = ("event", "wait", "t0", "t_start", "t_done", "remaining", "lock")
+
+    def __init__(self, event: TriggerEvent, wait: bool, n: int):
+        self.event = event
+        self.wait = wait
+        self.t0 = time.perf_counter()
+        self.t_start: list[Optional[float]] = [None] * n
+        self.t_done: list[Optional[float]] = [None] * n
+        self.remaining = n
+        self.lock = threading.Lock()
+
 
 class FanoutDriver:
-    """Broadcast trigger sends to multiple drivers."""
+    """Broadcast trigger sends to multiple drivers.
+
+    By default drivers are called one after another on the caller's thread.
+    With ``parallel=True`` each driver gets its own worker thread and
+    :meth:`send` only enqueues, so a slow driver no longer delays the others.
+
+    In both modes, per-event inter-driver skew (spread of the moments each
+    driver started its send), per-driver latency (dispatch to send returned)
+    and per-driver error counts are kept; see :meth:`stats`.
+    """
 
-    def __init__(self, drivers: Iterable[object], *, name: str = "fanout"):
+    def __init__(
+        self,
+        drivers: Iterable[object],
+        *,
+        name: str = "fanout",
+        parallel: bool = False,
+        history: int = 4096,
+    ):
         self.name = name
         self._drivers = list(drivers)
+        self.parallel = bool(parallel)
+        self.driver_names = self._unique_names(self._drivers)
+        maxlen = max(1, int(history))
+        self.skews: deque[float] = deque(maxlen=maxlen)
+        self.latencies: dict[str, deque[float]] = {n: deque(maxlen=maxlen) for n in self.driver_names}
+        self.errors: dict[str, int] = {n: 0 for n in self.driver_names}
+        self.last_errors: dict[str, Optional[str]] = {n: None for n in self.driver_names}
+        self._stats_lock = threading.Lock()
+        self._queues: list["queue.SimpleQueue[Any]"] = []
+        self._threads: list[threading.Thread] = []
+
+    @staticmethod
+    def _unique_names(drivers: list[object]) -> list[str]:
+        names: list[str] = []
+        for i, d in enumerate(drivers):
+            base = str(getattr(d, "name", None) or type(d).__name__)
+            names.append(base if base not in names else f"{base}#{i}")
+        return names
 
     def open(self) -> None:
-        for d in self._drivers:
+        for i, d in enumerate(self._drivers):
             try:
                 if hasattr(d, "open"):
                     d.open()
-            except Exception:
-                continue
+            except Exception as e:
+                self._record_error(i, e)
+        if self.parallel and not self._threads:
+            self._start_workers()
 
     def close(self) -> None:
-        for d in self._drivers:
+        self._stop_workers()
+        for i, d in enumerate(self._drivers):
             try:
                 if hasattr(d, "close"):
                     d.close()
-            except Exception:
-                continue
+            except Exception as e:
+                self._record_error(i, e)
 
     def send(self, event: TriggerEvent, *, wait: bool = True) -> None:
-        for d in self._drivers:
-            try:
-                d.send(event, wait=wait)
-            except Exception:
-                continue
+        dispatch = _Dispatch(event, wait, len(self._drivers))
+        if self.parallel:
+            if not self._threads:
+                self._start_workers()
+            for q in self._queues:
+                q.put(dispatch)
+            return
+        for i in range(len(self._drivers)):
+            self._deliver(i, dispatch)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every worker has processed the events queued so far."""
+        if not self._threads:
+            return True
+        marks = [threading.Event() for _ in self._queues]
+        for q, mark in zip(self._queues, marks):
+            q.put(mark)
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        for mark in marks:
+            remaining = None if deadline is None else max(0.0, deadline - time.perf_counter())
+            if not mark.wait(remaining):
+                return False
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        """Skew/latency summaries (seconds) and error counts."""
+        with self._stats_lock:
+            return {
+                "skew": _summary(self.skews),
+                "latency": {n: _summary(v) for n, v in self.latencies.items()},
+                "errors": dict(self.errors),
+                "last_errors": dict(self.last_errors),
+            }
+
+    # -- internals ----------------------------------------------------------
+    def _deliver(self, i: int, dispatch: _Dispatch) -> None:
+        t_start = time.perf_counter()
+        try:
+            self._drivers[i].send(dispatch.event, wait=dispatch.wait)
+        except Exception as e:
+            # One failing device must not stop the others; count it instead.
+            self._record_error(i, e)
+        t_done = time.perf_counter()
+        with dispatch.lock:
+            dispatch.t_start[i] = t_start
+            dispatch.t_done[i] = t_done
+            dispatch.remaining -= 1
+            complete = dispatch.remaining == 0
+        if complete:
+            self._record_dispatch(dispatch)
 
+    def _record_dispatch(self, dispatch: _Dispatch) -> None:
+        starts = [t for t in dispatch.t_start if t is not None]
+        with self._stats_lock:
+            if len(starts) > 1:
+                self.skews.append(max(starts) - min(starts))
+            for name, t_done in zip(self.driver_names, dispatch.t_done):
+                if t_done is not None:
+                    self.latencies[name].append(t_done - dispatch.t0)
+
+    def _record_error(self, i: int, exc: BaseException) -> None:
+        name = self.driver_names[i]
+        with self._stats_lock:
+            self.errors[name] += 1
+            self.last_errors[name] = repr(exc)
+
+    def _start_workers(self) -> None:
+        for i, name in enumerate(self.driver_names):
+            q: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+            t = threading.Thread(target=self._worker, args=(i, q), name=f"psyflow-fanout:{name}", daemon=True)
+            self._queues.append(q)
+            self._threads.append(t)
+            t.start()
+
+    def _stop_workers(self) -> None:
+        for q in self._queues:
+            q.put(_STOP)
+        for t in self._threads:
+            t.join()
+        self._queues = []
+        self._threads = []
+
+    def _worker(self, i: int, q: "queue.SimpleQueue[Any]") -> None:
+        while True:
+            item = q.get()
+            if item is _STOP:
+                return
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+            self._deliver(i, item)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import time
 from dataclasses import dataclass
 from typing import Any, Optional
 
@@ -31,8 +30,10 @@ class MockDriver:
         return
 
     def send(self, event: TriggerEvent, *, wait: bool = True) -> None:
+        from psyflow.sim.context import get_session_clock
+
         # "wait" is ignored for mock.
-        self.records.append(MockRecord(t_sent=time.time(), event=event))
+        self.records.append(MockRecord(t_sent=get_session_clock().getAbsTime(), event=event))
         if self.print_codes and event.code is not None:
             print(f"[MockTrigger] Sent code: {event.code}")
 
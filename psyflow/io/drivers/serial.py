@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import heapq
+import queue
+import threading
+import time
+from collections import deque
 from typing import Any, Callable, Optional
 
 from ..events import TriggerEvent
 
+_STOP = object()
+
 
 def _default_encode(event: TriggerEvent) -> Optional[bytes]:
     if event.payload is not None:
@@ -53,3 +60,158 @@ class SerialDriver:
             return
         self._ser.write(payload)
 
+
+
+class AsyncSerialDriver(SerialDriver):
+    """Serial driver that writes from a dedicated thread.
+
+    ``send`` encodes the event on the caller's thread (so invalid codes still
+    raise where they are emitted) and only enqueues the bytes; the writer
+    thread performs ``serial.write``. Pulses are honoured with a timer: the
+    reset code is written ``pulse_width_ms`` after the onset write instead of
+    sleeping on the render thread.
+
+    Every write records its enqueue-to-write latency; see :attr:`latencies`
+    and :meth:`latency_stats`.
+    """
+
+    def __init__(
+        self,
+        serial_obj: Any,
+        *,
+        name: str = "serial_async",
+        encode_fn: Callable[[TriggerEvent], Optional[bytes]] = _default_encode,
+        default_reset_code: int = 0,
+        latency_history: int = 4096,
+    ):
+        super().__init__(serial_obj, name=name, encode_fn=encode_fn)
+        self.default_reset_code = int(default_reset_code)
+        self.latencies: deque[tuple[Optional[str], Optional[int], float]] = deque(maxlen=max(1, int(latency_history)))
+        self.n_written = 0
+        self.n_errors = 0
+        self.last_error: Optional[str] = None
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+
+    # -- lifecycle ------------------------------------------------------------
+    def open(self) -> None:
+        super().open()
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name=f"psyflow-{self.name}", daemon=True)
+            self._thread.start()
+
+    def close(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._thread = None
+        super().close()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until queued writes (and pending timed resets) are done."""
+        if self._thread is None or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    # -- driver API ---------------------------------------------------------
+    def send(self, event: TriggerEvent, *, wait: bool = True) -> None:
+        payload = self._encode(event)
+        if payload is None:
+            return
+        self._enqueue(payload, event.name, event.code, delay_s=0.0)
+
+    def send_pulse(self, event: TriggerEvent, *, wait: bool = True) -> None:
+        payload = self._encode(event)
+        if payload is None:
+            return
+        t_enqueue = time.perf_counter()
+        self._enqueue(payload, event.name, event.code, delay_s=0.0, t_enqueue=t_enqueue)
+        reset_code = self.default_reset_code if event.reset_code is None else int(event.reset_code)
+        reset_payload = self._encode(TriggerEvent(name=event.name, code=reset_code))
+        if reset_payload is not None:
+            delay_s = max(0.0, float(event.pulse_width_ms or 0) / 1000.0)
+            self._enqueue(reset_payload, event.name, reset_code, delay_s=delay_s, t_enqueue=t_enqueue)
+
+    def reset(self, code: int) -> None:
+        payload = self._encode(TriggerEvent(code=int(code)))
+        if payload is not None:
+            self._enqueue(payload, None, int(code), delay_s=0.0)
+
+    def latency_stats(self) -> dict[str, Any]:
+        """Summary of enqueue-to-write latency (seconds) over :attr:`latencies`.
+
+        For timed resets the latency is measured from the scheduled due time.
+        """
+        values = sorted(lat for _, _, lat in self.latencies)
+        if not values:
+            return {"n": 0, "mean": None, "max": None, "p95": None, "errors": self.n_errors}
+        p95 = values[min(len(values) - 1, int(round(0.95 * (len(values) - 1))))]
+        return {
+            "n": len(values),
+            "mean": sum(values) / len(values),
+            "max": values[-1],
+            "p95": p95,
+            "errors": self.n_errors,
+        }
+
+    # -- writer thread --------------------------------------------------------
+    def _enqueue(
+        self,
+        payload: bytes,
+        name: Optional[str],
+        code: Optional[int],
+        *,
+        delay_s: float,
+        t_enqueue: Optional[float] = None,
+    ) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self.open()
+        t0 = time.perf_counter() if t_enqueue is None else t_enqueue
+        self._queue.put((t0 + delay_s, payload, name, code))
+
+    def _write(self, due: float, payload: bytes, name: Optional[str], code: Optional[int]) -> None:
+        try:
+            self._ser.write(payload)
+            self.n_written += 1
+        except Exception as e:
+            self.n_errors += 1
+            self.last_error = repr(e)
+            return
+        self.latencies.append((name, code, time.perf_counter() - due))
+
+    def _run(self) -> None:
+        timed: list[tuple[float, int, bytes, Optional[str], Optional[int]]] = []
+        waiters: list[threading.Event] = []
+        seq = 0
+        stopping = False
+        while True:
+            # Fire resets that are due, in schedule order.
+            now = time.perf_counter()
+            while timed and timed[0][0] <= now:
+                due, _, payload, name, code = heapq.heappop(timed)
+                self._write(due, payload, name, code)
+                now = time.perf_counter()
+            if not timed:
+                for ev in waiters:
+                    ev.set()
+                waiters.clear()
+                if stopping:
+                    return
+            timeout = (timed[0][0] - now) if timed else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                continue
+            if item is _STOP:
+                stopping = True
+            elif isinstance(item, threading.Event):
+                waiters.append(item)
+            else:
+                due, payload, name, code = item
+                if due <= time.perf_counter() and not timed:
+                    self._write(due, payload, name, code)
+                else:
+                    seq += 1
+                    heapq.heappush(timed, (due, seq, payload, name, code))
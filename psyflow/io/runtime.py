@@ -1,27 +1,43 @@
 from __future__ import annotations
 
-import json
 import os
-import time
 from pathlib import Path
-from typing import Any, Callable, Optional, Literal
+from typing import Any, Callable, Mapping, Optional, Literal
 
+from ..clock import SessionClock
 from .events import TriggerEvent
+from .sink import JsonlEventSink
 
 
-def make_jsonl_logger(path: str | Path) -> Callable[[dict[str, Any]], None]:
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
+def make_jsonl_logger(path: str | Path, **sink_kwargs: Any) -> JsonlEventSink:
+    """Return a JSONL event sink for ``path`` (see :class:`JsonlEventSink`).
 
-    def _log(ev: dict[str, Any]) -> None:
-        with path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(ev, ensure_ascii=True) + "\n")
+    Defaults to inline writes so each event is readable as soon as the call
+    returns; pass ``background=True`` to move file I/O to a writer thread.
+    """
+    sink_kwargs.setdefault("background", False)
+    return JsonlEventSink(path, **sink_kwargs)
 
-    return _log
+
+_AUDIT_PLANNED = 0
+_AUDIT_EXECUTED = 1
 
 
 class TriggerRuntime:
-    """Owns timing semantics + audit logging; delegates I/O to a driver."""
+    """Owns timing semantics + audit logging; delegates I/O to a driver.
+
+    All stamps come from the session clock (see :mod:`psyflow.clock`):
+    records carry epoch-second fields (``t_planned``, ``t_sent``) plus the
+    integer ``*_ns`` stamps and ``latency_ns`` from the same counter.
+
+    With ``low_latency=True`` the emit/execute path only stores
+    ``(emit_id, code, clock.now_ns())`` in a preallocated audit buffer
+    (doubled in place if a stage fills it; see ``audit_overflows``). The
+    ``trigger_planned`` / ``trigger_executed`` records are built and logged
+    later by :meth:`flush_audit` (StimUnit calls it at stage end, and
+    :meth:`close` drains whatever is left). Records carry the same fields as
+    in the default mode.
+    """
 
     def __init__(
         self,
@@ -30,26 +46,55 @@ class TriggerRuntime:
         name: str | None = None,
         event_logger: Optional[Callable[[dict[str, Any]], None]] = None,
         strict: bool = False,
+        low_latency: bool = False,
+        audit_capacity: int = 4096,
+        table: Optional[Mapping[str, Optional[int]]] = None,
+        clock: Optional[SessionClock] = None,
     ):
         self.driver = driver
         self.name = name or getattr(driver, "name", driver.__class__.__name__)
         if event_logger is None:
             path = os.getenv("PSYFLOW_TRIGGER_LOG_PATH")
-            event_logger = make_jsonl_logger(path) if path else None
+            event_logger = make_jsonl_logger(path, background=True) if path else None
+            self._owns_logger = event_logger is not None
+        else:
+            self._owns_logger = False
         self.event_logger = event_logger
         self.strict = bool(strict)
+        self.table = table
+        self.clock = clock
         self._emit_seq = 0
 
+        self.low_latency = bool(low_latency)
+        self.audit_overflows = 0
+        capacity = max(1, int(audit_capacity))
+        self._audit_capacity = capacity
+        self._audit_kind: list[int] = [0] * capacity
+        self._audit_id: list[int] = [0] * capacity
+        self._audit_t: list[int] = [0] * capacity
+        self._audit_err: list[Optional[str]] = [None] * capacity
+        self._audit_n = 0
+        # emit_id -> (event, when, t_planned_ns, clock) until the execute record is flushed.
+        self._audit_pending: dict[int, tuple[TriggerEvent, str, int, SessionClock]] = {}
+
     def open(self) -> None:
         if hasattr(self.driver, "open"):
             self.driver.open()
 
     def close(self) -> None:
+        self.flush_audit()
         if hasattr(self.driver, "close"):
             self.driver.close()
+        if self._owns_logger and hasattr(self.event_logger, "close"):
+            self.event_logger.close()
 
-    def send(self, code: int | None, wait: bool = True) -> None:
-        """Send a simple integer trigger code immediately."""
+    def send(self, code: int | str | None, wait: bool = True) -> None:
+        """Send a trigger code immediately.
+
+        ``code`` may also be an event name, resolved through :attr:`table`.
+        """
+        if isinstance(code, str) and self.table is not None:
+            code = self.table.get(code)
         if code is None:
             return
         try:
@@ -58,6 +103,13 @@ class TriggerRuntime:
             return
         self.emit(TriggerEvent(code=code_i), when="now", wait=wait)
 
+    def _session_clock(self) -> SessionClock:
+        if self.clock is not None:
+            return self.clock
+        from psyflow.sim.context import get_session_clock
+
+        return get_session_clock()
+
     def _next_id(self) -> int:
         self._emit_seq += 1
         return self._emit_seq
@@ -161,13 +213,30 @@ class TriggerRuntime:
             )
 
         emit_id = self._next_id()
-        t_planned = time.time()
+        if self.low_latency:
+            clock = self._session_clock()
+            t_planned_ns = clock.now_ns()
+            self._audit_pending[emit_id] = (event, when, t_planned_ns, clock)
+            self._audit_put(_AUDIT_PLANNED, emit_id, t_planned_ns, None)
+            if when == "now":
+                self._execute_fast(event, emit_id, wait)
+                return
+            if when == "flip":
+                if win is None or not hasattr(win, "callOnFlip"):
+                    raise ValueError("when='flip' requires a PsychoPy-like window with callOnFlip().")
+                win.callOnFlip(self._execute_fast, event, emit_id, wait)
+                return
+            raise ValueError(f"Unsupported when={when!r}")
+
+        clock = self._session_clock()
+        t_planned_ns = clock.now_ns()
         planned = {
             "type": "trigger_planned",
             "emit_id": emit_id,
             "when": when,
             "on_flip": when == "flip",
-            "t_planned": t_planned,
+            "t_planned": clock.to_wall(t_planned_ns),
+            "t_planned_ns": t_planned_ns,
             "driver": self.name,
             "event_name": event.name,
             "code": event.code,
@@ -179,19 +248,21 @@ class TriggerRuntime:
         self._log(planned)
 
         if when == "now":
-            self._execute(event, emit_id=emit_id, t_planned=t_planned, when=when, wait=wait)
+            self._execute(event, emit_id=emit_id, t_planned_ns=t_planned_ns, when=when, wait=wait)
             return
 
         if when == "flip":
             if win is None or not hasattr(win, "callOnFlip"):
                 raise ValueError("when='flip' requires a PsychoPy-like window with callOnFlip().")
-            win.callOnFlip(self._execute, event, emit_id, t_planned, when, wait)
+            win.callOnFlip(self._execute, event, emit_id, t_planned_ns, when, wait)
             return
 
         raise ValueError(f"Unsupported when={when!r}")
 
-    def _execute(self, event: TriggerEvent, emit_id: int, t_planned: float, when: str, wait: bool) -> None:
-        t_sent = time.time()
+    def _execute(self, event: TriggerEvent, emit_id: int, t_planned_ns: int, when: str, wait: bool) -> None:
+        clock = self._session_clock()
+        t_sent_ns = clock.now_ns()
+        t_sent = clock.to_wall(t_sent_ns)
         t_flip = t_sent if when == "flip" else None
         err = None
         try:
@@ -213,9 +284,12 @@ class TriggerRuntime:
                     "emit_id": emit_id,
                     "when": when,
                     "on_flip": when == "flip",
-                    "t_planned": t_planned,
+                    "t_planned": clock.to_wall(t_planned_ns),
                     "t_flip": t_flip,
                     "t_sent": t_sent,
+                    "t_planned_ns": t_planned_ns,
+                    "t_sent_ns": t_sent_ns,
+                    "latency_ns": t_sent_ns - t_planned_ns,
                     "driver": self.name,
                     "event_name": event.name,
                     "code": event.code,
@@ -226,3 +300,85 @@ class TriggerRuntime:
                     "error": err,
                 }
             )
+
+    # -- low-latency audit path ---------------------------------------------
+    def _execute_fast(self, event: TriggerEvent, emit_id: int, wait: bool) -> None:
+        t_sent_ns = self._session_clock().now_ns()
+        err = None
+        try:
+            if event.pulse_width_ms is not None and hasattr(self.driver, "send_pulse"):
+                self.driver.send_pulse(event, wait=wait)
+            else:
+                self.driver.send(event, wait=wait)
+
+            if event.reset_code is not None and event.pulse_width_ms is None and hasattr(self.driver, "reset"):
+                self.driver.reset(event.reset_code)
+        except Exception as e:
+            err = repr(e)
+            if self._effective_strict():
+                raise
+        finally:
+            self._audit_put(_AUDIT_EXECUTED, emit_id, t_sent_ns, err)
+
+    def _audit_put(self, kind: int, emit_id: int, t_ns: int, err: Optional[str]) -> None:
+        i = self._audit_n
+        if i == self._audit_capacity:
+            # Buffer sized too small for a stage: grow it in place (amortized
+            # O(1)); records are still only built by the stage-end flush.
+            self.audit_overflows += 1
+            grow = self._audit_capacity
+            self._audit_kind.extend([0] * grow)
+            self._audit_id.extend([0] * grow)
+            self._audit_t.extend([0] * grow)
+            self._audit_err.extend([None] * grow)
+            self._audit_capacity += grow
+        self._audit_kind[i] = kind
+        self._audit_id[i] = emit_id
+        self._audit_t[i] = t_ns
+        self._audit_err[i] = err
+        self._audit_n = i + 1
+
+    def flush_audit(self) -> int:
+        """Build and log the audit records captured in low-latency mode.
+
+        Returns the number of records logged. Safe to call in the default
+        mode (no-op) and between flips; never call it from a flip callback.
+        """
+        n = self._audit_n
+        self._audit_n = 0
+        for i in range(n):
+            emit_id = self._audit_id[i]
+            pending = self._audit_pending.get(emit_id)
+            if pending is None:
+                continue
+            event, when, t_planned_ns, clock = pending
+            rec = {
+                "type": "trigger_planned",
+                "emit_id": emit_id,
+                "when": when,
+                "on_flip": when == "flip",
+                "t_planned": clock.to_wall(t_planned_ns),
+                "t_planned_ns": t_planned_ns,
+                "driver": self.name,
+                "event_name": event.name,
+                "code": event.code,
+                "payload_len": (len(event.payload) if isinstance(event.payload, (bytes, str)) else None),
+                "pulse_width_ms": event.pulse_width_ms,
+                "reset_code": event.reset_code,
+                "meta": dict(event.meta) if isinstance(event.meta, dict) else None,
+            }
+            if self._audit_kind[i] == _AUDIT_EXECUTED:
+                del self._audit_pending[emit_id]
+                t_sent_ns = self._audit_t[i]
+                t_sent = clock.to_wall(t_sent_ns)
+                rec.update(
+                    type="trigger_executed",
+                    t_flip=t_sent if when == "flip" else None,
+                    t_sent=t_sent,
+                    t_sent_ns=t_sent_ns,
+                    latency_ns=t_sent_ns - t_planned_ns,
+                    error=self._audit_err[i],
+                )
+                self._audit_err[i] = None
+            self._log(rec)
+        return n
@@ -0,0 +1,249 @@
+"""Buffered JSONL event sink shared by psyflow's event loggers.
+
+Loggers used to open, append and close the target file for every event, which
+puts file-system work (and antivirus scans on lab machines) on the frame
+critical path. :class:`JsonlEventSink` keeps one handle open and, in
+background mode, hands records to a writer thread through an in-memory queue
+so callers only pay for a shallow dict copy.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import queue
+import threading
+import weakref
+from pathlib import Path
+from typing import Any, Callable, Literal, Optional, TextIO
+
+from ..clock import SessionClock
+
+
+FlushPolicy = Literal["close", "block", "every_n"]
+
+_STOP = object()
+_OPEN_SINKS: "weakref.WeakSet[JsonlEventSink]" = weakref.WeakSet()
+
+
+class _FlushRequest:
+    __slots__ = ("done",)
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+class JsonlEventSink:
+    """Append-only JSONL writer with an optional background thread.
+
+    Parameters
+    ----------
+    path : str or Path
+        Target file (parent directories are created).
+    transform : callable, optional
+        ``transform(record, t_ns, clock) -> record`` applied before
+        serialization. ``t_ns`` is the session-clock stamp taken when the
+        event was logged, so enrichment can run off the caller's thread
+        without losing timing.
+    background : bool
+        If True, records are queued and written by a daemon thread. If False,
+        they are written inline (still through one persistent handle).
+    flush_policy : {"close", "block", "every_n"}
+        When buffered lines are pushed to the OS: only on :meth:`flush` /
+        :meth:`close`, additionally on :meth:`block_end`, or every
+        ``flush_every`` events.
+    flush_every : int
+        Event count between flushes for ``flush_policy="every_n"``.
+    fsync : bool
+        Also ``os.fsync`` the file whenever it is flushed.
+    clock : SessionClock, optional
+        Clock used for the enqueue stamp (defaults to the active session clock).
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        transform: Optional[Callable[[dict[str, Any], int, SessionClock], dict[str, Any]]] = None,
+        background: bool = True,
+        flush_policy: FlushPolicy = "block",
+        flush_every: int = 256,
+        fsync: bool = False,
+        clock: Optional[SessionClock] = None,
+    ):
+        if flush_policy not in ("close", "block", "every_n"):
+            raise ValueError(f"Unsupported flush_policy={flush_policy!r}")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.transform = transform
+        self.background = bool(background)
+        self.flush_policy: FlushPolicy = flush_policy
+        self.flush_every = max(1, int(flush_every))
+        self.fsync = bool(fsync)
+        if clock is None:
+            from psyflow.sim.context import get_session_clock
+
+            clock = get_session_clock()
+        self.clock = clock
+        self.n_written = 0
+        self.n_dropped = 0
+        self._since_flush = 0
+        self._closed = False
+        self._lock = threading.Lock()
+        # Opened on first write so idle sinks don't leave empty files behind.
+        self._fh: Optional[TextIO] = None
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        if self.background:
+            self._thread = threading.Thread(
+                target=self._run, name=f"psyflow-sink:{self.path.name}", daemon=True
+            )
+            self._thread.start()
+        _OPEN_SINKS.add(self)
+
+    # -- public API -------------------------------------------------------
+    def __call__(self, event: dict[str, Any]) -> None:
+        if self._closed:
+            self.n_dropped += 1
+            return
+        item = (dict(event), self.clock.now_ns())
+        if self.background:
+            self._queue.put(item)
+        else:
+            with self._lock:
+                if self._closed:
+                    self.n_dropped += 1
+                    return
+                self._write_batch([item])
+
+    def flush(self) -> None:
+        """Block until every queued record is written and flushed."""
+        if self._closed:
+            return
+        if self.background and self._thread is not None and self._thread.is_alive():
+            req = _FlushRequest()
+            self._queue.put(req)
+            req.done.wait()
+            return
+        with self._lock:
+            self._flush_file()
+
+    def block_end(self) -> None:
+        """Hook called at the end of a block; flushes under ``flush_policy="block"``."""
+        if self.flush_policy == "block":
+            self.flush()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        # Closed first: records logged from other threads from here on are
+        # counted as dropped rather than queued behind _STOP.
+        self._closed = True
+        if self.background and self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+        with self._lock:
+            try:
+                # Records that passed the closed check just before it was set.
+                self._write_batch(self._drain_queue())
+                self._flush_file()
+            finally:
+                if self._fh is not None:
+                    self._fh.close()
+                    self._fh = None
+        _OPEN_SINKS.discard(self)
+
+    def __enter__(self) -> "JsonlEventSink":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    # -- internals ----------------------------------------------------------
+    def _serialize(self, rec: dict[str, Any], t_ns: int) -> str:
+        if self.transform is not None:
+            rec = self.transform(rec, t_ns, self.clock)
+        return json.dumps(rec, ensure_ascii=True) + "\n"
+
+    def _write_batch(self, items: list[tuple[dict[str, Any], int]]) -> None:
+        lines = []
+        for rec, t_ns in items:
+            try:
+                lines.append(self._serialize(rec, t_ns))
+            except Exception:
+                # Event logging must never break the runtime.
+                self.n_dropped += 1
+        if lines:
+            if self._fh is None:
+                self._fh = self.path.open("a", encoding="utf-8")
+            self._fh.write("".join(lines))
+            self.n_written += len(lines)
+            self._since_flush += len(lines)
+        if self.flush_policy == "every_n" and self._since_flush >= self.flush_every:
+            self._flush_file()
+        elif lines and not self.background and self.flush_policy != "close":
+            # Inline sinks keep the file readable after every call.
+            self._fh.flush()
+
+    def _flush_file(self) -> None:
+        if self._fh is None:
+            return
+        self._fh.flush()
+        if self.fsync:
+            try:
+                os.fsync(self._fh.fileno())
+            except OSError:
+                pass
+        self._since_flush = 0
+
+    def _drain_queue(self) -> list[tuple[dict[str, Any], int]]:
+        items = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return items
+            if isinstance(item, _FlushRequest):
+                item.done.set()
+            elif item is not _STOP:
+                items.append(item)
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            batch: list[tuple[dict[str, Any], int]] = []
+            flush_reqs: list[_FlushRequest] = []
+            item = self._queue.get()
+            while True:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, _FlushRequest):
+                    flush_reqs.append(item)
+                else:
+                    batch.append(item)
+                if stop or len(batch) >= 1024:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            with self._lock:
+                try:
+                    if batch:
+                        self._write_batch(batch)
+                    if flush_reqs:
+                        self._flush_file()
+                except Exception:
+                    self.n_dropped += len(batch)
+            for req in flush_reqs:
+                req.done.set()
+
+
+@atexit.register
+def _close_open_sinks() -> None:
+    for sink in list(_OPEN_SINKS):
+        try:
+            sink.close()
+        except Exception:
+            pass
@@ -0,0 +1,125 @@
+"""Precompiled trigger code table.
+
+The trigger map from ``load_config`` is validated once at startup and frozen
+into a :class:`TriggerTable`. Encoding a code then becomes a tuple index into
+payloads that were built in advance, instead of re-checking the range and
+allocating ``bytes([*prefix, code])`` on every event.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Iterable, Iterator, Optional
+
+from .events import TriggerEvent
+
+
+def _as_byte(value: Any, what: str) -> int:
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError(f"{what} must be an int, got {type(value).__name__}")
+    if value < 0 or value > 255:
+        raise ValueError(f"{what} must be in [0,255], got {value}")
+    return value
+
+
+class TriggerTable(Mapping):
+    """Immutable ``event name -> code`` map with pre-encoded serial payloads.
+
+    Behaves like the plain trigger dict it replaces (``table.get("iti_onset")``
+    returns the code or ``None``), and additionally exposes the wire bytes.
+
+    Parameters
+    ----------
+    mapping : Mapping[str, int | None]
+        Trigger map (``triggers.map`` in config). ``None`` values mean "no
+        trigger configured" and are kept as such.
+    prefix : Iterable[int]
+        Bytes written before each code on serial devices.
+
+    Raises
+    ------
+    ValueError
+        If a code or prefix byte is not an int in [0, 255], or if two events
+        share a code.
+    """
+
+    __slots__ = ("_codes", "_names_by_code", "_payloads", "prefix")
+
+    def __init__(self, mapping: Mapping[str, Any] | None = None, *, prefix: Iterable[int] = ()):
+        codes: dict[str, Optional[int]] = {}
+        names_by_code: dict[int, str] = {}
+        for name, value in (mapping or {}).items():
+            name = str(name)
+            if value is None:
+                codes[name] = None
+                continue
+            code = _as_byte(value, f"trigger code for {name!r}")
+            if code in names_by_code:
+                raise ValueError(
+                    f"Duplicate trigger code {code} for {names_by_code[code]!r} and {name!r}"
+                )
+            names_by_code[code] = name
+            codes[name] = code
+        prefix_t = tuple(_as_byte(b, "trigger prefix byte") for b in prefix)
+
+        self._codes = MappingProxyType(codes)
+        self._names_by_code = MappingProxyType(names_by_code)
+        # One payload per possible code so reset/ad-hoc codes are also free to send.
+        self._payloads = tuple(bytes((*prefix_t, c)) for c in range(256))
+        self.prefix = prefix_t
+
+    @classmethod
+    def from_config(cls, cfg: Mapping[str, Any] | None) -> "TriggerTable":
+        """Build from the dict returned by :func:`psyflow.utils.load_config`."""
+        cfg = cfg or {}
+        driver_cfg = cfg.get("trigger_driver_config", {}) or {}
+        prefix_raw = driver_cfg.get("prefix", [1, 225, 1, 0])
+        return cls(cfg.get("trigger_config", {}) or {}, prefix=prefix_raw or ())
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if hasattr(self, "prefix"):
+            raise AttributeError("TriggerTable is immutable")
+        object.__setattr__(self, name, value)
+
+    # -- Mapping protocol -----------------------------------------------------
+    def __getitem__(self, name: str) -> Optional[int]:
+        return self._codes[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._codes)
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __repr__(self) -> str:
+        return f"TriggerTable({dict(self._codes)!r}, prefix={list(self.prefix)!r})"
+
+    # -- lookups ------------------------------------------------------------
+    def name_for(self, code: int) -> Optional[str]:
+        """Event name registered for ``code`` (``None`` if unmapped)."""
+        return self._names_by_code.get(code)
+
+    def payload(self, code: int) -> bytes:
+        """Pre-encoded serial payload (prefix + code) for ``code``."""
+        if code < 0 or code > 255:
+            raise ValueError(f"Trigger code must be in [0,255], got {code}")
+        return self._payloads[code]
+
+    def payload_for(self, name: str) -> Optional[bytes]:
+        """Pre-encoded payload for event ``name`` (``None`` if no code)."""
+        code = self._codes.get(name)
+        return None if code is None else self._payloads[code]
+
+    def encode(self, event: TriggerEvent) -> Optional[bytes]:
+        """Driver ``encode_fn``: explicit payloads pass through, codes are looked up."""
+        payload = event.payload
+        if payload is not None:
+            if isinstance(payload, bytes):
+                return payload
+            if isinstance(payload, str):
+                return payload.encode("utf-8")
+        code = event.code
+        if code is None:
+            return None
+        return self.payload(int(code))
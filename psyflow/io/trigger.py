@@ -9,13 +9,21 @@ def initialize_triggers(
     trigger_func: Optional[Callable[[Any], None]] = None,
     mock: Optional[bool] = None,
 ):
-    """Initialize and open a TriggerRuntime from loaded config."""
+    """Initialize and open a TriggerRuntime from loaded config.
+
+    The trigger map is compiled into a :class:`~psyflow.io.table.TriggerTable`
+    (available as ``runtime.table``); invalid or duplicate codes raise
+    ``ValueError`` here rather than mid-session.
+    """
     from .drivers.callable import CallableDriver
     from .drivers.mock import MockDriver
-    from .drivers.serial import SerialDriver
+    from .drivers.serial import AsyncSerialDriver, SerialDriver
     from .runtime import TriggerRuntime
+    from .table import TriggerTable
 
     cfg = cfg or {}
+    # Validate the trigger map once and pre-encode every payload.
+    table = TriggerTable.from_config(cfg)
     driver_cfg = cfg.get("trigger_driver_config", {}) or {}
     policy_cfg = cfg.get("trigger_policy_config", {}) or {}
     timing_cfg = cfg.get("trigger_timing_config", {}) or {}
@@ -52,26 +60,24 @@ def initialize_triggers(
             url = str(driver_cfg.get("url", "loop://")).strip() or "loop://"
             ser = serial.serial_for_url(url, baudrate=baudrate, timeout=timeout)
 
-        prefix_raw = driver_cfg.get("prefix", [1, 225, 1, 0])
-        prefix = [int(x) for x in prefix_raw] if prefix_raw is not None else []
-
-        def _encode(event):
-            if event.payload is not None:
-                if isinstance(event.payload, bytes):
-                    return event.payload
-                if isinstance(event.payload, str):
-                    return event.payload.encode("utf-8")
-            if event.code is None:
-                return None
-            code = int(event.code)
-            if code < 0 or code > 255:
-                raise ValueError(f"Trigger code must be in [0,255], got {code}")
-            return bytes([*prefix, code]) if prefix else bytes([code])
-
-        driver = SerialDriver(ser, encode_fn=_encode)
+        if bool(driver_cfg.get("async_write", False)):
+            # Writes (and pulse resets) happen on a writer thread, off the flip path.
+            driver = AsyncSerialDriver(
+                ser,
+                encode_fn=table.encode,
+                default_reset_code=int(driver_cfg.get("reset_code", 0)),
+            )
+        else:
+            driver = SerialDriver(ser, encode_fn=table.encode)
     else:
         raise ValueError(f"Unsupported triggers.driver.type: {driver_type}")
 
-    runtime = TriggerRuntime(driver, strict=strict)
+    runtime = TriggerRuntime(
+        driver,
+        strict=strict,
+        low_latency=bool(policy_cfg.get("low_latency", False)),
+        audit_capacity=int(policy_cfg.get("audit_capacity", 4096)),
+        table=table,
+    )
     runtime.open()
     return runtime
@@ -10,6 +10,7 @@ from .adapter import (
 )
 from .contracts import (
     Action,
+    BatchResponderProtocol,
     Feedback,
     NullResponder,
     Observation,
@@ -17,35 +18,54 @@ from .contracts import (
     ScriptedResponder,
     SessionInfo,
 )
+from .batch import SimSessionPlan, plan_sim_sessions, run_sim_sessions
 from .context import (
     RuntimeConfig,
     RuntimeContext,
     context_from_config,
     get_context,
+    get_session_clock,
     log_event,
     log_sim_event,
     runtime_context,
 )
 from .context_helpers import set_trial_context
+from .headless import HeadlessKeyboard, HeadlessWindow, VirtualClock
 from .loader import load_responder
 from .logging import iter_sim_events, make_sim_jsonl_logger
-from .rng import make_rng, make_trial_seed
+from .plan import ActionPlan
+from .rng import (
+    RngStreams,
+    active_rng_streams,
+    make_rng,
+    make_trial_seed,
+    rng_streams,
+)
 
 __all__ = [
     "Action",
+    "ActionPlan",
+    "BatchResponderProtocol",
     "Feedback",
     "HandledResponse",
+    "HeadlessKeyboard",
+    "HeadlessWindow",
     "NullResponder",
     "Observation",
     "ResponderActionError",
     "ResponderAdapter",
     "ResponderProtocol",
+    "RngStreams",
     "RuntimeConfig",
     "RuntimeContext",
     "ScriptedResponder",
     "SessionInfo",
+    "SimSessionPlan",
+    "VirtualClock",
+    "active_rng_streams",
     "context_from_config",
     "get_context",
+    "get_session_clock",
     "log_event",
     "log_sim_event",
     "load_responder",
@@ -53,6 +73,9 @@ __all__ = [
     "make_rng",
     "make_sim_jsonl_logger",
     "make_trial_seed",
+    "plan_sim_sessions",
+    "rng_streams",
+    "run_sim_sessions",
     "runtime_context",
     "set_trial_context",
 ]
@@ -170,17 +170,33 @@ class ResponderAdapter:
 
     def handle_response(self, obs: Observation, responder: ResponderProtocol) -> HandledResponse:
         self._warn_if_missing_required_fields(obs)
-        raw = None
         try:
             try:
                 raw_obj = responder.act(obs)
             except TypeError:
                 # Backward compatibility: legacy responders that expect dict input.
                 raw_obj = responder.act(obs.to_dict())  # type: ignore[arg-type]
-            raw = _serialize_action(raw_obj)
-            action = _coerce_to_action(raw_obj)
         except ResponderActionError:
             raise
+        except Exception as e:
+            if self.policy == "strict":
+                self._error("ACT_EXCEPTION", f"Responder.act failed: {e}")
+            return self._reject(obs=obs, raw_action=None, code="ACT_EXCEPTION", message=f"Responder.act failed: {e}")
+        return self._validate(obs, raw_obj)
+
+    def handle_action(self, obs: Observation, action: Any) -> HandledResponse:
+        """Validate an action computed ahead of time (e.g. by ``act_batch``) for ``obs``.
+
+        Applies the same policy, checks and logging as :meth:`handle_response`.
+        """
+        self._warn_if_missing_required_fields(obs)
+        return self._validate(obs, action)
+
+    def _validate(self, obs: Observation, raw_obj: Any) -> HandledResponse:
+        raw = None
+        try:
+            raw = _serialize_action(raw_obj)
+            action = _coerce_to_action(raw_obj)
         except Exception as e:
             if self.policy == "strict":
                 self._error("ACT_EXCEPTION", f"Responder.act failed: {e}")
@@ -0,0 +1,161 @@
+"""Fan-out of many simulated sessions of one task.
+
+Parameter recovery needs hundreds or thousands of simulated participants.
+:func:`plan_sim_sessions` derives a seed, participant id and session id for
+each of them (session ids use the same naming as
+:func:`~psyflow.sim.context_from_config`) and writes a per-session copy of
+the task config whose ``sim`` section points all output into the session's
+own directory. :func:`run_sim_sessions` then runs the task's ``main.py`` for
+every plan, ``workers`` at a time, and :func:`write_manifest` records the
+produced files and exit codes.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Optional, Sequence
+
+from .context import _cfg_get, _default_session_id
+
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class SimSessionPlan:
+    """One simulated session and, once run, its outcome."""
+
+    index: int
+    participant_id: str
+    seed: int
+    session_id: str
+    output_dir: str
+    config_path: str
+    returncode: Optional[int] = None
+    duration_s: Optional[float] = None
+    stdout_path: Optional[str] = None
+    files: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0
+
+
+def plan_sim_sessions(
+    config: dict[str, Any],
+    *,
+    n_subjects: int,
+    seed_base: int = 0,
+    output_root: str | Path,
+) -> list[SimSessionPlan]:
+    """Create one isolated session directory and config per simulated subject.
+
+    Session ``i`` (0-based) gets seed ``seed_base + i`` and participant id
+    ``sim<i+1>`` zero-padded to the width of ``n_subjects`` (at least 3).
+    Everything else in ``config`` is kept as is.
+    """
+    if n_subjects < 1:
+        raise ValueError(f"n_subjects must be >= 1, got {n_subjects}")
+    root = Path(output_root).resolve()
+    task_name = str(_cfg_get(config, ("task", "task_name"), "unknown_task") or "unknown_task")
+    width = max(3, len(str(n_subjects)))
+
+    plans = []
+    for i in range(n_subjects):
+        seed = int(seed_base) + i
+        participant_id = f"sim{i + 1:0{width}d}"
+        session_id = _default_session_id("sim", participant_id, task_name, seed)
+        out_dir = root / session_id
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        cfg = copy.deepcopy(config)
+        sim_cfg = cfg.get("sim")
+        if not isinstance(sim_cfg, dict):
+            sim_cfg = cfg["sim"] = {}
+        sim_cfg.update(
+            seed=seed,
+            participant_id=participant_id,
+            session_id=session_id,
+            output_dir=str(out_dir),
+            log_path=str(out_dir / f"{session_id}_sim_events.jsonl"),
+        )
+        cfg_path = out_dir / "session_config.yaml"
+        _write_yaml(cfg_path, cfg)
+        plans.append(SimSessionPlan(
+            index=i,
+            participant_id=participant_id,
+            seed=seed,
+            session_id=session_id,
+            output_dir=str(out_dir),
+            config_path=str(cfg_path),
+        ))
+    return plans
+
+
+def _write_yaml(path: Path, data: dict[str, Any]) -> None:
+    import yaml
+
+    path.write_text(yaml.safe_dump(data, sort_keys=False, allow_unicode=True), encoding="utf-8")
+
+
+def run_sim_sessions(
+    plans: Sequence[SimSessionPlan],
+    *,
+    task_dir: str | Path,
+    main_py: str | Path,
+    python_exe: str,
+    workers: int = 1,
+    passthrough: Sequence[str] = (),
+    progress: Optional[Callable[[SimSessionPlan], None]] = None,
+) -> list[SimSessionPlan]:
+    """Run ``main.py sim --config <session config>`` for every plan.
+
+    Each session is its own interpreter process; at most ``workers`` run at
+    once. Output of each process goes to ``stdout.log`` in its session
+    directory. A failing session does not stop the others.
+    """
+
+    def _one(plan: SimSessionPlan) -> SimSessionPlan:
+        out_dir = Path(plan.output_dir)
+        log_path = out_dir / "stdout.log"
+        cmd = [str(python_exe), str(main_py), "sim", "--config", plan.config_path, *passthrough]
+        t0 = time.perf_counter()
+        with log_path.open("w", encoding="utf-8") as log:
+            try:
+                proc = subprocess.run(cmd, cwd=str(task_dir), stdout=log, stderr=subprocess.STDOUT)
+                plan.returncode = int(proc.returncode)
+            except OSError as exc:
+                log.write(f"failed to start session: {exc}\n")
+                plan.returncode = -1
+        plan.duration_s = time.perf_counter() - t0
+        plan.stdout_path = str(log_path)
+        plan.files = sorted(
+            str(p) for p in out_dir.rglob("*")
+            if p.is_file() and p.name not in ("session_config.yaml", "stdout.log")
+        )
+        if progress is not None:
+            progress(plan)
+        return plan
+
+    with ThreadPoolExecutor(max_workers=max(1, int(workers)), thread_name_prefix="psyflow-sim") as pool:
+        return list(pool.map(_one, plans))
+
+
+def write_manifest(path: str | Path, plans: Sequence[SimSessionPlan], **meta: Any) -> dict[str, Any]:
+    """Write the aggregated run manifest (JSON) and return it."""
+    manifest = {
+        "version": MANIFEST_VERSION,
+        **meta,
+        "n_sessions": len(plans),
+        "n_failed": sum(1 for p in plans if not p.ok),
+        "sessions": [asdict(p) for p in plans],
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(manifest, ensure_ascii=True, indent=2), encoding="utf-8")
+    return manifest
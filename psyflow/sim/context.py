@@ -2,17 +2,18 @@ from __future__ import annotations
 
 import contextlib
 import contextvars
-import json
 import re
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Optional
 
+from ..clock import SessionClock, default_clock
+from ..io.sink import JsonlEventSink
 from .contracts import SessionInfo
+from .headless import VirtualClock
 from .loader import load_responder
 from .logging import make_sim_jsonl_logger
-from .rng import make_rng
+from .rng import RngStreams, make_rng
 
 
 def _cfg_get(mapping: dict[str, Any] | None, path: tuple[str, ...], default: Any = None) -> Any:
@@ -53,6 +54,14 @@ def _slug(value: Any, *, default: str) -> str:
     return slug or default
 
 
+def _default_session_id(mode: str, participant_id: str, task_name: str, seed: int) -> str:
+    """Session id used when ``sim.session_id`` is not configured."""
+    if mode == "sim":
+        task_tag = _slug(task_name, default="task")
+        return f"sub-{participant_id}_task-{task_tag}_seed{seed}"
+    return f"{mode}-{participant_id}-seed{seed}"
+
+
 @dataclass(frozen=True)
 class RuntimeConfig:
     enable_scaling: bool = False
@@ -63,6 +72,12 @@ class RuntimeConfig:
     sim_policy: str = "warn"  # strict | warn | coerce
     default_rt_s: float = 0.2
     clamp_rt: bool = False
+    headless: bool = False
+    frame_rate: float = 60.0
+    event_driven: bool = False
+    log_flush: str = "block"  # block | every_n | close
+    log_flush_every: int = 256
+    log_fsync: bool = False
 
 
 @dataclass
@@ -77,6 +92,28 @@ class RuntimeContext:
     output_dir: Optional[Path] = None
     session: Optional[SessionInfo] = None
     rng: Any = None
+    rng_streams: Optional[RngStreams] = None
+    clock: SessionClock = field(default_factory=SessionClock)
+    # Actions precomputed by a batch responder (see BlockUnit.plan_responses).
+    action_plan: Any = None
+
+    def _sinks(self) -> list[Any]:
+        return [s for s in (self.event_logger, self.sim_logger) if s is not None]
+
+    def flush(self) -> None:
+        """Write out buffered events (called at block boundaries)."""
+        for sink in self._sinks():
+            if hasattr(sink, "block_end"):
+                sink.block_end()
+
+    def close(self) -> None:
+        """Flush and close event sinks; safe to call more than once."""
+        for sink in self._sinks():
+            if hasattr(sink, "close"):
+                try:
+                    sink.close()
+                except Exception:
+                    pass
 
 
 _CTX: contextvars.ContextVar[Optional[RuntimeContext]] = contextvars.ContextVar(
@@ -88,6 +125,13 @@ def get_context() -> Optional[RuntimeContext]:
     return _CTX.get()
 
 
+def get_session_clock() -> SessionClock:
+    """Clock of the active runtime context, or the process-wide default."""
+    ctx = _CTX.get()
+    clock = getattr(ctx, "clock", None) if ctx is not None else None
+    return clock if clock is not None else default_clock()
+
+
 def log_event(event: dict[str, Any]) -> None:
     ctx = get_context()
     if ctx is None or ctx.event_logger is None:
@@ -108,21 +152,16 @@ def log_sim_event(event: dict[str, Any]) -> None:
         return
 
 
-def _utc_now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
-
+def _event_record(ev: dict[str, Any], t_ns: int, clock: SessionClock) -> dict[str, Any]:
+    rec = dict(ev)
+    rec.setdefault("t_utc", clock.to_utc_iso(t_ns))
+    rec.setdefault("t_ns", t_ns)
+    return rec
 
-def make_jsonl_logger(path: Path) -> Callable[[dict[str, Any]], None]:
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
 
-    def _log(ev: dict[str, Any]) -> None:
-        rec = dict(ev)
-        rec.setdefault("t_utc", _utc_now_iso())
-        with path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(rec, ensure_ascii=True) + "\n")
-
-    return _log
+def make_jsonl_logger(path: Path, **sink_kwargs: Any) -> JsonlEventSink:
+    sink_kwargs.setdefault("background", False)
+    return JsonlEventSink(path, transform=_event_record, **sink_kwargs)
 
 
 @contextlib.contextmanager
@@ -137,6 +176,7 @@ def runtime_context(ctx: RuntimeContext):
                 responder.end_session()
         except Exception:
             pass
+        ctx.close()
         _CTX.reset(token)
 
 
@@ -176,6 +216,21 @@ def context_from_config(
     default_rt_s = float(_cfg_get(raw_cfg, ("sim", "default_rt_s"), 0.2))
     clamp_rt = _as_bool(_cfg_get(raw_cfg, ("sim", "clamp_rt"), False), False)
 
+    # Headless virtual-clock window backend (opt-in, qa/sim only).
+    runtime_section = "qa" if mode == "qa" else "sim"
+    headless = mode in ("qa", "sim") and _as_bool(_cfg_get(raw_cfg, (runtime_section, "headless"), False), False)
+    frame_rate = float(_cfg_get(raw_cfg, (runtime_section, "frame_rate"), 60.0) or 60.0)
+    if frame_rate <= 0:
+        raise ValueError(f"{runtime_section}.frame_rate must be > 0, got {frame_rate}")
+    # Resolve simulated response windows analytically instead of flipping per frame.
+    event_driven = _as_bool(_cfg_get(raw_cfg, (runtime_section, "event_driven"), False), False)
+    # Event logs are written by a background thread; these control when they hit disk.
+    log_flush = str(_cfg_get(raw_cfg, (runtime_section, "log_flush"), "block")).strip().lower()
+    if log_flush not in ("block", "every_n", "close"):
+        raise ValueError(f"{runtime_section}.log_flush must be one of block|every_n|close, got {log_flush!r}")
+    log_flush_every = int(_cfg_get(raw_cfg, (runtime_section, "log_flush_every"), 256))
+    log_fsync = _as_bool(_cfg_get(raw_cfg, (runtime_section, "log_fsync"), False), False)
+
     cfg = RuntimeConfig(
         enable_scaling=enable_scaling,
         timing_scale=timing_scale,
@@ -185,6 +240,12 @@ def context_from_config(
         sim_policy=sim_policy,
         default_rt_s=default_rt_s,
         clamp_rt=clamp_rt,
+        headless=headless,
+        frame_rate=frame_rate,
+        event_driven=event_driven,
+        log_flush=log_flush,
+        log_flush_every=log_flush_every,
+        log_fsync=log_fsync,
     )
 
     task_name = str(
@@ -194,11 +255,7 @@ def context_from_config(
     task_version = _cfg_get(raw_cfg, ("task", "task_version"), _cfg_get(config, ("task_config", "task_version"), None))
     seed = int(_cfg_get(raw_cfg, ("sim", "seed"), 0))
     participant_id = str(_cfg_get(raw_cfg, ("sim", "participant_id"), _cfg_get(raw_cfg, ("task", "participant_id"), "p000")) or "p000")
-    if mode == "sim":
-        task_tag = _slug(task_name, default="task")
-        default_session_id = f"sub-{participant_id}_task-{task_tag}_seed{seed}"
-    else:
-        default_session_id = f"{mode}-{participant_id}-seed{seed}"
+    default_session_id = _default_session_id(mode, participant_id, task_name, seed)
     session_id_cfg = _cfg_get(raw_cfg, ("sim", "session_id"), None)
     session_id = str(session_id_cfg).strip() if session_id_cfg is not None else default_session_id
     if not session_id:
@@ -218,7 +275,15 @@ def context_from_config(
 
     events_name = "qa_events.jsonl" if mode == "qa" else f"{session.session_id}_qa_events.jsonl"
     events_path = out / events_name
-    event_logger = make_jsonl_logger(events_path) if mode in ("qa", "sim") else None
+    clock = VirtualClock(1.0 / frame_rate) if headless else SessionClock()
+    sink_kwargs = dict(
+        background=True,
+        flush_policy=log_flush,
+        flush_every=log_flush_every,
+        fsync=log_fsync,
+        clock=clock,
+    )
+    event_logger = make_jsonl_logger(events_path, **sink_kwargs) if mode in ("qa", "sim") else None
 
     sim_log_name = "sim_events.jsonl" if mode == "qa" else f"{session.session_id}_sim_events.jsonl"
     sim_log_default = str(Path(output_dir) / sim_log_name)
@@ -228,7 +293,7 @@ def context_from_config(
     else:
         sim_log_path = str(sim_log_cfg)
     sim_log = (tdir / sim_log_path) if (tdir is not None and not Path(sim_log_path).is_absolute()) else Path(sim_log_path)
-    sim_logger = make_sim_jsonl_logger(sim_log) if mode in ("qa", "sim") else None
+    sim_logger = make_sim_jsonl_logger(sim_log, **sink_kwargs) if mode in ("qa", "sim") else None
 
     responder = None
     responder_meta: dict[str, Any] = {}
@@ -258,4 +323,6 @@ def context_from_config(
         output_dir=out,
         session=session,
         rng=rng,
+        rng_streams=RngStreams(seed),
+        clock=clock,
     )
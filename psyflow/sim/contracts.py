@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import asdict, dataclass, field
-from typing import Any, Literal, Optional, Protocol, runtime_checkable
+from typing import Any, Literal, Optional, Protocol, Sequence, runtime_checkable
 
 
 Mode = Literal["human", "qa", "sim"]
@@ -139,6 +139,21 @@ class ResponderProtocol(Protocol):
         ...
 
 
+@runtime_checkable
+class BatchResponderProtocol(Protocol):
+    """Optional extension: compute the actions of many observations at once.
+
+    Responders implementing ``act_batch`` (e.g. vectorized model samplers)
+    can be handed every response window of a block up front via
+    :meth:`BlockUnit.plan_responses`. ``act_batch`` must return one action
+    per observation, in order; ``act`` is still used for any window that was
+    not planned.
+    """
+
+    def act_batch(self, observations: Sequence[Observation]) -> Sequence[Action]:
+        ...
+
+
 class NullResponder:
     """Responder that never responds (always timeout)."""
 
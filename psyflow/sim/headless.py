@@ -0,0 +1,150 @@
+"""Headless virtual-clock window backend for qa/sim runs.
+
+Nothing in this module waits on the display: ``flip()`` advances a shared
+:class:`VirtualClock` by exactly one frame period and runs the callbacks
+registered via ``callOnFlip``. Every timestamp StimUnit records (stage clock,
+``*_global`` stamps, keyboard RTs) is read from that clock, so a simulated
+session runs at CPU speed while producing the onset/close fields a real
+frame-locked run would.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+
+from ..clock import SessionClock
+
+
+class VirtualClock(SessionClock):
+    """Session clock that only moves when told to.
+
+    ``now()`` is seconds since the clock was created; ``getAbsTime()`` maps it
+    onto the wall clock through a single anchor recorded at construction.
+    """
+
+    def __init__(self, frame_period: float = 1.0 / 60.0, *, wall_anchor: Optional[float] = None):
+        frame_period = float(frame_period)
+        if frame_period <= 0:
+            raise ValueError(f"frame_period must be > 0, got {frame_period}")
+        super().__init__(wall_anchor=wall_anchor)
+        self.frame_period = frame_period
+        self._n_frames = 0
+        self._offset = 0.0
+
+    @property
+    def n_frames(self) -> int:
+        return self._n_frames
+
+    def now(self) -> float:
+        # Derive time from the integer frame count so long sessions don't
+        # accumulate float drift from repeated additions.
+        return self._n_frames * self.frame_period + self._offset
+
+    def now_ns(self) -> int:
+        return round(self.now() * 1e9)
+
+    def advance_frames(self, n: int = 1) -> float:
+        n = int(n)
+        if n < 0:
+            raise ValueError(f"Cannot advance a virtual clock backwards (n={n})")
+        self._n_frames += n
+        return self.now()
+
+    def advance(self, seconds: float) -> float:
+        seconds = float(seconds)
+        if seconds < 0:
+            raise ValueError(f"Cannot advance a virtual clock backwards (seconds={seconds})")
+        self._offset += seconds
+        return self.now()
+
+
+class HeadlessWindow:
+    """Window stand-in whose ``flip()`` advances a virtual clock.
+
+    Parameters
+    ----------
+    clock : VirtualClock
+        Clock advanced by one ``clock.frame_period`` per flip.
+    inner : Any, optional
+        Real PsychoPy window used only to construct and draw stimuli. It is
+        never flipped. Unknown attributes are delegated to it so stimulus
+        classes that expect a PsychoPy window keep working.
+    """
+
+    def __init__(
+        self,
+        clock: VirtualClock,
+        *,
+        inner: Any = None,
+        size: tuple[int, int] | list[int] = (1024, 768),
+        units: str = "pix",
+        color: Any = "gray",
+    ):
+        self.clock = clock
+        self._inner = inner
+        self._flip_callbacks: list[tuple[Callable[..., Any], tuple, dict]] = []
+        self._closed = False
+        if inner is None:
+            self.size = list(size)
+            self.units = units
+            self.color = color
+            self.mouseVisible = False
+
+    @property
+    def monitorFramePeriod(self) -> float:
+        return self.clock.frame_period
+
+    def getActualFrameRate(self, *args: Any, **kwargs: Any) -> float:
+        return 1.0 / self.clock.frame_period
+
+    def callOnFlip(self, function: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        self._flip_callbacks.append((function, args, kwargs))
+
+    def flip(self, clearBuffer: bool = True) -> float:
+        t_flip = self.clock.advance_frames(1)
+        callbacks = self._flip_callbacks
+        self._flip_callbacks = []
+        for function, args, kwargs in callbacks:
+            function(*args, **kwargs)
+        if clearBuffer and self._inner is not None and hasattr(self._inner, "clearBuffer"):
+            try:
+                self._inner.clearBuffer()
+            except Exception:
+                pass
+        return t_flip
+
+    def advance_frames(self, n: int) -> float:
+        """Account for ``n`` flips that were skipped analytically."""
+        return self.clock.advance_frames(n)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._inner is not None and hasattr(self._inner, "close"):
+            try:
+                self._inner.close()
+            except Exception:
+                pass
+
+    def __getattr__(self, name: str) -> Any:
+        inner = self.__dict__.get("_inner")
+        if inner is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        return getattr(inner, name)
+
+
+class HeadlessKeyboard:
+    """Keyboard stand-in for headless runs; never reports physical keys."""
+
+    def __init__(self, clock: VirtualClock):
+        self.clock = clock.make_timer()
+
+    def clearEvents(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+    def getKeys(self, *args: Any, **kwargs: Any) -> list:
+        return []
+
+    def waitKeys(self, *args: Any, **kwargs: Any) -> list:
+        return []
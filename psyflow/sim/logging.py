@@ -1,15 +1,12 @@
 from __future__ import annotations
 
 import json
-import time
 from dataclasses import asdict, is_dataclass
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Iterator
+from typing import Any, Iterator
 
-
-def _utc_now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+from ..clock import SessionClock
+from ..io.sink import JsonlEventSink
 
 
 def _to_jsonable(value: Any) -> Any:
@@ -22,18 +19,22 @@ def _to_jsonable(value: Any) -> Any:
     return value
 
 
-def make_sim_jsonl_logger(path: str | Path) -> Callable[[dict[str, Any]], None]:
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
+def _sim_record(ev: dict[str, Any], t_ns: int, clock: SessionClock) -> dict[str, Any]:
+    rec = _to_jsonable(ev)
+    rec.setdefault("t", clock.to_wall(t_ns))
+    rec.setdefault("t_ns", t_ns)
+    rec.setdefault("t_utc", clock.to_utc_iso(t_ns))
+    return rec
+
 
-    def _log(ev: dict[str, Any]) -> None:
-        rec = _to_jsonable(dict(ev))
-        rec.setdefault("t", time.time())
-        rec.setdefault("t_utc", _utc_now_iso())
-        with path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(rec, ensure_ascii=True) + "\n")
+def make_sim_jsonl_logger(path: str | Path, **sink_kwargs: Any) -> JsonlEventSink:
+    """Return a sink that writes responder events with ``t``/``t_utc`` stamps.
 
-    return _log
+    Stamps are taken when the event is logged, even if serialization happens
+    later on the sink's writer thread (``background=True``).
+    """
+    sink_kwargs.setdefault("background", False)
+    return JsonlEventSink(path, transform=_sim_record, **sink_kwargs)
 
 
 def iter_sim_events(path: str | Path) -> Iterator[dict[str, Any]]:
@@ -0,0 +1,102 @@
+"""Actions planned ahead of time with ``act_batch``.
+
+:meth:`BlockUnit.plan_responses` builds the observations of all response
+windows of a block before it runs and passes them to the responder's
+``act_batch`` in one call. The resulting :class:`ActionPlan` lives on the
+runtime context; ``capture_response`` takes the planned action for each
+window and validates it through :meth:`ResponderAdapter.handle_action`,
+exactly as a live ``act`` result would be.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Iterable
+
+from .contracts import Observation
+
+_MATCH_FIELDS = ("trial_id", "block_id", "condition_id")
+
+
+def _matches(planned: Observation, live: Observation) -> bool:
+    for name in _MATCH_FIELDS:
+        value, live_value = getattr(planned, name), getattr(live, name)
+        if value is not None and live_value is not None and value != live_value:
+            return False
+    if planned.valid_keys and list(planned.valid_keys) != list(live.valid_keys or []):
+        return False
+    return True
+
+
+class ActionPlan:
+    """Queues of planned actions per phase, consumed in order.
+
+    A planned observation only needs the fields known before the trial runs
+    (``phase``, ``valid_keys``, ``deadline_s``, ``condition_id``...). When a
+    live window does not match the next planned one (its ``trial_id``,
+    ``block_id``, ``condition_id`` or ``valid_keys`` differ, where both are
+    known), the schedule is assumed to have diverged and the remaining plan
+    for that phase is dropped; those windows fall back to ``act``.
+    """
+
+    def __init__(self) -> None:
+        self._queues: dict[str, deque[tuple[Observation, Any]]] = {}
+        self.n_planned = 0
+        self.n_used = 0
+        self.n_discarded = 0
+
+    @property
+    def pending(self) -> int:
+        return sum(len(q) for q in self._queues.values())
+
+    def add(self, observations: Iterable[Observation], actions: Iterable[Any]) -> int:
+        """Queue ``actions`` for ``observations`` (same length, same order)."""
+        obs_list = list(observations)
+        act_list = list(actions)
+        if len(act_list) != len(obs_list):
+            raise ValueError(
+                f"act_batch returned {len(act_list)} actions for {len(obs_list)} observations"
+            )
+        for obs, action in zip(obs_list, act_list):
+            self._queues.setdefault(str(obs.phase), deque()).append((obs, action))
+        self.n_planned += len(obs_list)
+        return len(obs_list)
+
+    def submit(self, observations: Iterable[Observation], responder: Any) -> int:
+        """Plan ``observations`` with ``responder.act_batch``; returns the count."""
+        obs_list = list(observations)
+        if not obs_list:
+            return 0
+        return self.add(obs_list, responder.act_batch(obs_list))
+
+    def take(self, obs: Observation) -> tuple[bool, Any]:
+        """Pop the planned action for the live window ``obs``.
+
+        Returns ``(True, action)``, or ``(False, None)`` if nothing usable is
+        planned for it.
+        """
+        queue = self._queues.get(str(obs.phase))
+        if not queue:
+            return False, None
+        planned, action = queue[0]
+        if not _matches(planned, obs):
+            self.n_discarded += len(queue)
+            queue.clear()
+            return False, None
+        queue.popleft()
+        self.n_used += 1
+        return True, action
+
+    def discard(self, block_id: Any) -> int:
+        """Drop the unused actions planned for ``block_id``; returns the count."""
+        n = 0
+        for phase, queue in self._queues.items():
+            kept = deque(item for item in queue if item[0].block_id != block_id)
+            n += len(queue) - len(kept)
+            self._queues[phase] = kept
+        self.n_discarded += n
+        return n
+
+    def clear(self) -> None:
+        self.n_discarded += self.pending
+        self._queues.clear()
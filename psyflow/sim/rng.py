@@ -1,7 +1,29 @@
+"""Seeded random streams for sessions, blocks, trials and phases.
+
+:class:`RngStreams` addresses independent streams by a short path such as
+``(block_id, trial_id, phase)``. Each path is turned into a NumPy
+``SeedSequence`` spawn key directly, without hashing, and drives a
+counter-based ``Philox`` generator, so opening a stream is O(1) and draws can
+be vectorized (``streams.generator(...).uniform(lo, hi, size=n)``).
+
+The streams in use are resolved by :func:`active_rng_streams`: the innermost
+:func:`rng_streams` scope (``BlockUnit.run_trial`` opens one per block), then
+the runtime context's ``rng_streams`` (seeded from ``sim.seed``), then a
+process-wide fallback seeded from OS entropy.
+"""
+
 from __future__ import annotations
 
 import hashlib
 import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
+
+import numpy as np
+
+_ACTIVE: ContextVar[Optional["RngStreams"]] = ContextVar("psyflow_rng_streams", default=None)
+_FALLBACK: Optional["RngStreams"] = None
 
 
 def make_rng(seed: int) -> random.Random:
@@ -19,3 +41,90 @@ def stable_int_hash(*parts: object, mod: int = 2**32) -> int:
 def make_trial_seed(session_id: str, trial_id: int | str, phase: str, base_seed: int = 0) -> int:
     return stable_int_hash(session_id, trial_id, phase, base_seed)
 
+
+def _key_part(part: Any) -> int:
+    # Integers and strings map to disjoint (even/odd) non-negative words.
+    if isinstance(part, (int, np.integer)) and not isinstance(part, bool):
+        value = int(part)
+        return (value << 2) if value >= 0 else ((-value << 2) | 2)
+    data = str(part).encode("utf-8") + b"\x01"
+    return (int.from_bytes(data, "little") << 1) | 1
+
+
+class RngStreams:
+    """Tree of independent random streams rooted at one seed.
+
+    Parameters
+    ----------
+    seed : int, optional
+        Root seed. ``None`` draws one from OS entropy (see :attr:`seed`).
+    """
+
+    def __init__(self, seed: Optional[int] = None, *, _prefix: tuple[int, ...] = ()):
+        if seed is None:
+            seed = int(np.random.SeedSequence().entropy % 2**63)
+        self.seed = int(seed)
+        self._prefix = _prefix
+        self._counters: dict[tuple, int] = {}
+
+    def key(self, *path: Any) -> tuple[int, ...]:
+        """Spawn key of ``path`` below this node."""
+        return self._prefix + tuple(_key_part(p) for p in path)
+
+    def child(self, *path: Any) -> "RngStreams":
+        """Sub-tree for ``path`` (e.g. one block), with its own draw counters."""
+        return RngStreams(self.seed, _prefix=self.key(*path))
+
+    def seed_sequence(self, *path: Any) -> np.random.SeedSequence:
+        return np.random.SeedSequence(self.seed, spawn_key=self.key(*path))
+
+    def generator(self, *path: Any) -> np.random.Generator:
+        """Philox generator for ``path``; the same path always gives the same stream."""
+        return np.random.Generator(np.random.Philox(self.seed_sequence(*path)))
+
+    def next(self, *path: Any) -> np.random.Generator:
+        """Generator for the next use of ``path``.
+
+        Repeated calls with the same path (e.g. a stage shown twice in one
+        trial) get fresh, still reproducible streams ``path + (0,)``,
+        ``path + (1,)``, ...
+        """
+        n = self._counters.get(path, 0)
+        self._counters[path] = n + 1
+        return self.generator(*path, n)
+
+    def int_seed(self, *path: Any) -> int:
+        """32-bit seed for APIs that take a plain integer."""
+        return int(self.seed_sequence(*path).generate_state(1)[0])
+
+    def python_rng(self, *path: Any) -> random.Random:
+        """``random.Random`` seeded from ``path``, for code written against the stdlib API."""
+        state = self.seed_sequence(*path).generate_state(2, np.uint64)
+        return random.Random((int(state[0]) << 64) | int(state[1]))
+
+
+def active_rng_streams(*, fallback: bool = True) -> Optional[RngStreams]:
+    """Streams for the current scope; ``None`` only if ``fallback`` is False and none is set."""
+    global _FALLBACK
+    streams = _ACTIVE.get()
+    if streams is not None:
+        return streams
+    from .context import get_context
+
+    ctx = get_context()
+    streams = getattr(ctx, "rng_streams", None) if ctx is not None else None
+    if streams is not None or not fallback:
+        return streams
+    if _FALLBACK is None:
+        _FALLBACK = RngStreams()
+    return _FALLBACK
+
+
+@contextmanager
+def rng_streams(streams: RngStreams) -> Iterator[RngStreams]:
+    """Make ``streams`` the result of :func:`active_rng_streams` within the block."""
+    token = _ACTIVE.set(streams)
+    try:
+        yield streams
+    finally:
+        _ACTIVE.reset(token)
@@ -428,5 +428,97 @@ def qa_main() -> None:
     raise SystemExit(run_qa_shortcut())
 
 
+def run_sim_shortcut(argv: Sequence[str] | None = None) -> int:
+    """``psyflow-sim``: one session, or ``--n-subjects N`` sessions in parallel."""
+    parser = _build_parser("sim")
+    # Unknown flags go to main.py; don't let e.g. --seed match --seed-base.
+    parser.allow_abbrev = False
+    parser.add_argument(
+        "--n-subjects",
+        type=int,
+        default=None,
+        help="Run N simulated participants, each in its own process and output directory.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of sessions run concurrently with --n-subjects (default: 1).",
+    )
+    parser.add_argument(
+        "--seed-base",
+        type=int,
+        default=0,
+        help="Seed of the first session; session i uses seed-base + i (default: 0).",
+    )
+    parser.add_argument(
+        "--output-root",
+        default=None,
+        help="Directory for per-session outputs and manifest.json "
+        "(default: <sim.output_dir>/batch_seed<seed-base>_n<N>).",
+    )
+    ns, passthrough = parser.parse_known_args(argv)
+    if ns.n_subjects is None:
+        forwarded = [ns.task, "--python", str(ns.python_exe)]
+        if ns.config:
+            forwarded += ["--config", ns.config]
+        return run_task_shortcut("sim", [*forwarded, *passthrough], defaults=["config/config_scripted_sim.yaml"])
+
+    from psyflow.qa.static import load_yaml
+    from psyflow.sim.batch import plan_sim_sessions, run_sim_sessions, write_manifest
+
+    if ns.n_subjects < 1:
+        parser.error("--n-subjects must be >= 1")
+    if ns.workers < 1:
+        parser.error("--workers must be >= 1")
+    try:
+        task_dir, main_py = _resolve_task_entry(ns.task)
+        cfg_path = _resolve_config_path(task_dir, ns.config, defaults=["config/config_scripted_sim.yaml"])
+    except FileNotFoundError as exc:
+        parser.error(str(exc))
+
+    cfg = load_yaml(cfg_path)
+    if not isinstance(cfg, dict):
+        parser.error(f"Config is not a mapping: {cfg_path}")
+    if ns.output_root:
+        out_root = Path(ns.output_root)
+        out_root = out_root if out_root.is_absolute() else Path.cwd() / out_root
+    else:
+        sim_cfg = cfg.get("sim") if isinstance(cfg.get("sim"), dict) else {}
+        out_root = task_dir / str(sim_cfg.get("output_dir") or "outputs/sim") / f"batch_seed{ns.seed_base}_n{ns.n_subjects}"
+
+    plans = plan_sim_sessions(cfg, n_subjects=ns.n_subjects, seed_base=ns.seed_base, output_root=out_root)
+    n_done = 0
+
+    def _progress(plan: Any) -> None:
+        nonlocal n_done
+        n_done += 1
+        status = "ok" if plan.ok else f"FAIL rc={plan.returncode}"
+        print(f"[psyflow-sim] {n_done}/{len(plans)} {plan.session_id}: {status} ({plan.duration_s:.1f}s)")
+
+    run_sim_sessions(
+        plans,
+        task_dir=task_dir,
+        main_py=main_py,
+        python_exe=str(ns.python_exe),
+        workers=ns.workers,
+        passthrough=passthrough,
+        progress=_progress,
+    )
+    manifest_path = out_root / "manifest.json"
+    manifest = write_manifest(
+        manifest_path,
+        plans,
+        task_dir=str(task_dir),
+        config_path=str(cfg_path),
+        n_subjects=ns.n_subjects,
+        workers=ns.workers,
+        seed_base=ns.seed_base,
+    )
+    print(f"[psyflow-sim] {manifest['n_sessions'] - manifest['n_failed']}/{manifest['n_sessions']} sessions succeeded")
+    print(f"[psyflow-sim] Manifest: {manifest_path}")
+    return 0 if manifest["n_failed"] == 0 else 1
+
+
 def sim_main() -> None:
-    raise SystemExit(run_task_shortcut("sim", defaults=["config/config_scripted_sim.yaml"]))
+    raise SystemExit(run_sim_shortcut())
@@ -13,6 +13,7 @@ DEFAULT_MODES: tuple[str, ...] = ("human", "qa", "sim")
 class TaskRunOptions:
     mode: str
     config_path: Path
+    resume_path: Path | None = None
 
 
 def _fail(parser: argparse.ArgumentParser | None, message: str) -> None:
@@ -78,6 +79,12 @@ def build_task_arg_parser(
     if default_config_by_mode:
         config_help = _default_config_help(default_config_by_mode)
     parser.add_argument("--config", default=None, help=config_help)
+    parser.add_argument(
+        "--resume",
+        default=None,
+        metavar="CHECKPOINT",
+        help="Checkpoint file of an interrupted session to continue.",
+    )
     return parser
 
 
@@ -102,4 +109,7 @@ def parse_task_run_options(
         config_arg=ns.config,
         default_config_by_mode=default_config_by_mode,
     )
-    return TaskRunOptions(mode=mode, config_path=config_path)
+    resume_path = Path(ns.resume) if ns.resume else None
+    if resume_path is not None and not resume_path.exists():
+        _fail(parser, f"Checkpoint file not found: {resume_path}")
+    return TaskRunOptions(mode=mode, config_path=config_path, resume_path=resume_path)
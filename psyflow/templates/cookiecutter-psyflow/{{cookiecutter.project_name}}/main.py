@@ -2,11 +2,12 @@
 from functools import partial
 from pathlib import Path
 
-import pandas as pd
 from psychopy import core
 
 from psyflow import (
     BlockUnit,
+    CheckpointWriter,
+    ResultStore,
     StimBank,
     StimUnit,
     SubInfo,
@@ -16,6 +17,7 @@ from psyflow import (
     count_down,
     initialize_exp,
     initialize_triggers,
+    load_checkpoint,
     load_config,
     parse_task_run_options,
     runtime_context,
@@ -67,15 +69,15 @@ def run(options: TaskRunOptions):
             settings.log_file = str(output_dir / "qa_psychopy.log")
             settings.json_file = str(output_dir / "qa_settings.json")
 
-        settings.triggers = cfg["trigger_config"]
-        trigger_runtime = initialize_triggers(mock=True) if options.mode in ("qa", "sim") else initialize_triggers(cfg)
+        trigger_runtime = initialize_triggers(cfg, mock=True) if options.mode in ("qa", "sim") else initialize_triggers(cfg)
+        settings.triggers = trigger_runtime.table
 
         win, kb = initialize_exp(settings)
 
-        stim_bank = StimBank(win, cfg["stim_config"])
+        stim_bank = StimBank(win, cfg["stim_config"], asset_cache=task_root / ".asset_cache")
         if options.mode not in ("qa", "sim"):
             stim_bank = stim_bank.convert_to_voice("instruction_text")
-        stim_bank = stim_bank.preload_all()
+        stim_bank = stim_bank.preload_all(parallel=True)
 
         settings.controller = cfg.get("controller_config", {})
         settings.save_to_json()
@@ -88,11 +90,21 @@ def run(options: TaskRunOptions):
         )
         if options.mode not in ("qa", "sim"):
             instruction.add_stim(stim_bank.get("instruction_text_voice"))
+            # First draws/plays are slow; do them while the instructions are up.
+            stim_bank.warm_up(show=[stim_bank.get("instruction_text")])
         instruction.wait_and_continue()
 
-        all_data = []
+        all_data = ResultStore()
+        # `--resume <checkpoint>` continues an interrupted session in its own checkpoint file.
+        resume_state = load_checkpoint(options.resume_path) if options.resume_path else None
+        checkpoint_path = options.resume_path or Path(settings.res_file).with_suffix(".checkpoint.jsonl")
+        checkpoint = CheckpointWriter(checkpoint_path)
         condition_weights = settings.resolve_condition_weights()
         for block_i in range(settings.total_blocks):
+            saved = resume_state.blocks.get(f"block_{block_i}") if resume_state else None
+            if saved is not None and saved.complete:
+                all_data.extend(saved.results)
+                continue
             if options.mode not in ("qa", "sim"):
                 count_down(win, 3, color="black")
 
@@ -112,6 +124,8 @@ def run(options: TaskRunOptions):
                     keyboard=kb,
                 )
                 .add_condition(planned_conditions)
+                .set_checkpoint(checkpoint)
+                .resume_from(resume_state)
                 .on_start(lambda b: trigger_runtime.send(settings.triggers.get("block_onset")))
                 .on_end(lambda b: trigger_runtime.send(settings.triggers.get("block_end")))
                 .run_trial(
@@ -125,6 +139,8 @@ def run(options: TaskRunOptions):
                 )
                 .to_dict(all_data)
             )
+            # The block is over: free stimuli the bank evicted or replaced during it.
+            stim_bank.release_retired()
 
             block_trials = block.get_all_data()
             accuracy = (
@@ -160,7 +176,8 @@ def run(options: TaskRunOptions):
 
         trigger_runtime.send(settings.triggers.get("exp_end"))
 
-        pd.DataFrame(all_data).to_csv(settings.res_file, index=False)
+        all_data.to_pandas().to_csv(settings.res_file, index=False)
+        checkpoint.close()
 
         trigger_runtime.close()
         core.quit()
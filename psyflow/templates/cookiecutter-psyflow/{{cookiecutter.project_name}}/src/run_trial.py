@@ -164,6 +164,7 @@ def run_trial(
     iti.show(
         duration=iti_duration,
         onset_trigger=settings.triggers.get("iti_onset"),
+        idle_work=True,
     ).to_dict(trial_data)
 
     return trial_data
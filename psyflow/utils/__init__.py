@@ -11,29 +11,59 @@ import importlib
 from typing import TYPE_CHECKING, Any
 
 _LAZY_ATTRS: dict[str, tuple[str, str]] = {
+    "AssetCache": ("psyflow.utils.assets", "AssetCache"),
+    "CheckpointWriter": ("psyflow.utils.checkpoint", "CheckpointWriter"),
+    "EdgeTTSBackend": ("psyflow.utils.tts", "EdgeTTSBackend"),
+    "FrameTimingRecorder": ("psyflow.utils.frames", "FrameTimingRecorder"),
+    "IdleScheduler": ("psyflow.utils.idle", "IdleScheduler"),
+    "JitterSchedule": ("psyflow.utils.jitter", "JitterSchedule"),
+    "JitterSpec": ("psyflow.utils.jitter", "JitterSpec"),
+    "ResultStore": ("psyflow.utils.results", "ResultStore"),
+    "SequenceConstraints": ("psyflow.utils.sequencing", "SequenceConstraints"),
+    "TTSRequest": ("psyflow.utils.tts", "TTSRequest"),
+    "check_sequence": ("psyflow.utils.sequencing", "check_sequence"),
     "count_down": ("psyflow.utils.display", "count_down"),
+    "generate_sequence": ("psyflow.utils.sequencing", "generate_sequence"),
     "initialize_exp": ("psyflow.utils.experiment", "initialize_exp"),
     "list_supported_voices": ("psyflow.utils.voices", "list_supported_voices"),
+    "load_checkpoint": ("psyflow.utils.checkpoint", "load_checkpoint"),
     "load_config": ("psyflow.utils.config", "load_config"),
     "next_trial_id": ("psyflow.utils.trials", "next_trial_id"),
+    "plan_jitter": ("psyflow.utils.jitter", "plan_jitter"),
     "reset_trial_counter": ("psyflow.utils.trials", "reset_trial_counter"),
     "resolve_deadline": ("psyflow.utils.trials", "resolve_deadline"),
     "resolve_trial_id": ("psyflow.utils.trials", "resolve_trial_id"),
     "show_ports": ("psyflow.utils.ports", "show_ports"),
+    "synthesize_batch": ("psyflow.utils.tts", "synthesize_batch"),
     "taps": ("psyflow.utils.templates", "taps"),
     "validate_config": ("psyflow.utils.config", "validate_config"),
 }
 
 __all__ = [
+    "AssetCache",
+    "CheckpointWriter",
+    "EdgeTTSBackend",
+    "FrameTimingRecorder",
+    "IdleScheduler",
+    "JitterSchedule",
+    "JitterSpec",
+    "ResultStore",
+    "SequenceConstraints",
+    "TTSRequest",
+    "check_sequence",
     "count_down",
+    "generate_sequence",
     "initialize_exp",
     "list_supported_voices",
+    "load_checkpoint",
     "load_config",
     "next_trial_id",
+    "plan_jitter",
     "reset_trial_counter",
     "resolve_deadline",
     "resolve_trial_id",
     "show_ports",
+    "synthesize_batch",
     "taps",
     "validate_config",
 ]
@@ -43,9 +73,24 @@ if TYPE_CHECKING:
     from .config import load_config as load_config
     from .config import validate_config as validate_config
     from .display import count_down as count_down
+    from .assets import AssetCache as AssetCache
+    from .checkpoint import CheckpointWriter as CheckpointWriter
+    from .checkpoint import load_checkpoint as load_checkpoint
     from .experiment import initialize_exp as initialize_exp
+    from .frames import FrameTimingRecorder as FrameTimingRecorder
+    from .idle import IdleScheduler as IdleScheduler
+    from .jitter import JitterSchedule as JitterSchedule
+    from .jitter import JitterSpec as JitterSpec
+    from .jitter import plan_jitter as plan_jitter
     from .ports import show_ports as show_ports
+    from .results import ResultStore as ResultStore
+    from .sequencing import SequenceConstraints as SequenceConstraints
+    from .sequencing import check_sequence as check_sequence
+    from .sequencing import generate_sequence as generate_sequence
     from .templates import taps as taps
+    from .tts import EdgeTTSBackend as EdgeTTSBackend
+    from .tts import TTSRequest as TTSRequest
+    from .tts import synthesize_batch as synthesize_batch
     from .trials import (
         next_trial_id as next_trial_id,
         reset_trial_counter as reset_trial_counter,
@@ -0,0 +1,271 @@
+"""Asset decoding and parallel preloading for :class:`~psyflow.StimBank`.
+
+Building an ``ImageStim`` or ``Sound`` from a file does two things: decode
+the file (disk I/O plus CPU) and upload the result to the GL context or audio
+backend. Only the second part has to happen on the main thread.
+:func:`preload_assets` runs the decode step for file-backed stimuli in a
+thread pool while the main thread builds everything else, then builds each
+decoded stimulus from the in-memory data as soon as it is ready.
+
+Decoders are optional: without Pillow or soundfile the corresponding
+stimuli are simply built the usual way on the main thread.
+
+:class:`AssetCache` keeps decoded pixel arrays and PCM samples on disk as
+``.npy`` files keyed by the source file's content hash, so later sessions
+memory-map them instead of decompressing PNG/JPG/MP3 again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Mapping, Optional
+
+import numpy as np
+
+Decoded = Optional[dict[str, Any]]
+ProgressFn = Callable[[int, int, str], None]
+
+
+def decode_image(path: str) -> Decoded:
+    """Decode an image file into a PIL image (``image=`` override for ImageStim)."""
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    img = Image.open(path)
+    img.load()
+    return {"image": img}
+
+
+def decode_sound(path: str, sample_rate: Optional[int] = None) -> Decoded:
+    """Decode an audio file into a float32 sample array (``file=`` override for Sound).
+
+    Returns ``None`` if soundfile is unavailable or the file's rate differs
+    from an explicitly configured ``sampleRate`` (resampling is left to the
+    audio backend).
+    """
+    try:
+        import soundfile
+    except ImportError:
+        return None
+    data, sr = soundfile.read(path, dtype="float32")
+    if sample_rate is not None and int(sample_rate) != int(sr):
+        return None
+    return {"file": data, "sampleRate": int(sr)}
+
+
+_IMAGE_MODES = ("L", "LA", "RGB", "RGBA")
+
+
+class AssetCache:
+    """On-disk cache of decoded image and audio data.
+
+    Entries are ``<hash>-<kind>-<params>.npy`` files plus a small JSON
+    sidecar, where ``<hash>`` is a BLAKE2 digest of the source file's bytes.
+    An edited asset therefore hashes to a new key and its stale entry is
+    never returned. Content hashes are remembered in ``index.json`` per
+    (path, size, mtime), so unchanged files are not re-read to be hashed.
+
+    Parameters
+    ----------
+    root : str or Path
+        Cache directory (created if missing).
+    """
+
+    VERSION = 1
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._index_path = self.root / "index.json"
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        try:
+            self._index: dict[str, dict[str, Any]] = json.loads(self._index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self._index = {}
+
+    # -- hashing ------------------------------------------------------------
+    def content_hash(self, path: str | Path) -> str:
+        """Hex digest of the file's bytes (reused while size and mtime match)."""
+        path = Path(path).resolve()
+        st = path.stat()
+        key = str(path)
+        with self._lock:
+            entry = self._index.get(key)
+        if entry and entry.get("size") == st.st_size and entry.get("mtime_ns") == st.st_mtime_ns:
+            return entry["hash"]
+        h = hashlib.blake2b(digest_size=16)
+        with path.open("rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+        with self._lock:
+            self._index[key] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "hash": digest}
+            self._dirty = True
+        return digest
+
+    def save(self) -> None:
+        """Persist the content-hash index if it changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps(self._index, indent=0, sort_keys=True)
+            self._dirty = False
+        tmp = self._index_path.with_name(f"index.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(data, encoding="utf-8")
+        os.replace(tmp, self._index_path)
+
+    # -- entries ------------------------------------------------------------
+    def entry_key(self, digest: str, kind: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        blob = json.dumps({"v": self.VERSION, **(params or {})}, sort_keys=True).encode("utf-8")
+        return f"{digest}-{kind}-{hashlib.blake2b(blob, digest_size=6).hexdigest()}"
+
+    def load(self, key: str) -> Optional[tuple[np.ndarray, dict[str, Any]]]:
+        """Memory-map a cached array and its metadata (``None`` on miss)."""
+        npy = self.root / f"{key}.npy"
+        meta_path = self.root / f"{key}.json"
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            array = np.load(npy, mmap_mode="r", allow_pickle=False)
+        except (OSError, ValueError):
+            # Missing or torn entry: treat as a miss and let store() overwrite it.
+            return None
+        return array, meta
+
+    def store(self, key: str, array: np.ndarray, meta: Mapping[str, Any]) -> None:
+        tag = f"{os.getpid()}.{threading.get_ident()}"
+        npy_tmp = self.root / f"{key}.{tag}.npy.tmp"
+        meta_tmp = self.root / f"{key}.{tag}.json.tmp"
+        with npy_tmp.open("wb") as f:
+            np.save(f, np.ascontiguousarray(array), allow_pickle=False)
+        meta_tmp.write_text(json.dumps(dict(meta)), encoding="utf-8")
+        # Array first: a sidecar only ever points at a complete .npy file.
+        os.replace(npy_tmp, self.root / f"{key}.npy")
+        os.replace(meta_tmp, self.root / f"{key}.json")
+
+    # -- decoders -----------------------------------------------------------
+    def image(self, path: str) -> Decoded:
+        """Cached equivalent of :func:`decode_image`."""
+        try:
+            from PIL import Image
+        except ImportError:
+            return None
+        key = self.entry_key(self.content_hash(path), "image")
+        hit = self.load(key)
+        if hit is not None:
+            with self._lock:
+                self.hits += 1
+            return {"image": Image.fromarray(np.asarray(hit[0]))}
+        with self._lock:
+            self.misses += 1
+        img = decode_image(path)["image"]
+        if img.mode not in _IMAGE_MODES:
+            img = img.convert("RGBA")
+        self.store(key, np.asarray(img), {"source": str(path), "mode": img.mode})
+        return {"image": img}
+
+    def sound(self, path: str, sample_rate: Optional[int] = None) -> Decoded:
+        """Cached equivalent of :func:`decode_sound` (hits don't need soundfile)."""
+        key = self.entry_key(self.content_hash(path), "sound", {"dtype": "float32"})
+        hit = self.load(key)
+        if hit is not None:
+            with self._lock:
+                self.hits += 1
+            data, meta = hit
+            sr = int(meta["sampleRate"])
+        else:
+            with self._lock:
+                self.misses += 1
+            decoded = decode_sound(path)
+            if decoded is None:
+                return None
+            data, sr = decoded["file"], decoded["sampleRate"]
+            self.store(key, data, {"source": str(path), "sampleRate": sr})
+        if sample_rate is not None and int(sample_rate) != sr:
+            return None
+        return {"file": data, "sampleRate": sr}
+
+
+def _timed_decode(decode: Callable[[], Decoded]) -> tuple[Decoded, float]:
+    t0 = time.perf_counter()
+    try:
+        out = decode()
+    except Exception:
+        # Unreadable here means "build it the normal way", which reports the real error.
+        out = None
+    return out, time.perf_counter() - t0
+
+
+def preload_assets(
+    builders: Mapping[str, Callable[..., Any]],
+    decoders: Optional[Mapping[str, Callable[[], Decoded]]] = None,
+    *,
+    max_workers: Optional[int] = None,
+    progress: Optional[ProgressFn] = None,
+) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """Build every asset, decoding file-backed ones in a worker pool.
+
+    Parameters
+    ----------
+    builders : Mapping[str, callable]
+        ``name -> build(**overrides)``; always called on the calling thread.
+    decoders : Mapping[str, callable], optional
+        ``name -> decode()`` run in the pool. A dict result is passed to the
+        builder as keyword overrides; ``None`` (or an exception) falls back to
+        calling the builder without overrides.
+    max_workers : int, optional
+        Pool size (``ThreadPoolExecutor`` default if omitted).
+    progress : callable, optional
+        ``progress(done, total, name)`` after each asset is built.
+
+    Returns
+    -------
+    tuple of dict
+        Built objects by name, and per-asset timings
+        (``decode_s``, ``build_s``, ``decoded``).
+    """
+    decoders = {n: d for n, d in (decoders or {}).items() if n in builders}
+    total = len(builders)
+    built: dict[str, Any] = {}
+    timings: dict[str, dict[str, Any]] = {}
+
+    def _build(name: str, overrides: Decoded, decode_s: Optional[float]) -> None:
+        t0 = time.perf_counter()
+        obj = None
+        if overrides:
+            try:
+                obj = builders[name](**overrides)
+            except Exception:
+                obj = None
+        decoded = obj is not None
+        if obj is None:
+            obj = builders[name]()
+        built[name] = obj
+        timings[name] = {"decode_s": decode_s, "build_s": time.perf_counter() - t0, "decoded": decoded}
+        if progress is not None:
+            progress(len(built), total, name)
+
+    if not decoders:
+        for name in builders:
+            _build(name, None, None)
+        return built, timings
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="psyflow-preload") as pool:
+        futures: dict[Future, str] = {pool.submit(_timed_decode, d): n for n, d in decoders.items()}
+        # Main thread builds the non-file stimuli while the pool decodes.
+        for name in builders:
+            if name not in decoders:
+                _build(name, None, None)
+        for fut in as_completed(futures):
+            overrides, decode_s = fut.result()
+            _build(futures[fut], overrides, decode_s)
+    return {n: built[n] for n in builders}, {n: timings[n] for n in builders}
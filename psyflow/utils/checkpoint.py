@@ -0,0 +1,216 @@
+"""Append-only trial checkpoints and session resume.
+
+A :class:`CheckpointWriter` attached to :class:`~psyflow.BlockUnit` (via
+``set_checkpoint``) persists every trial as soon as the trial function
+returns, so a crash late in a session keeps everything recorded so far.
+Records are handed to a :class:`~psyflow.io.JsonlEventSink` writer thread:
+the block loop only pays for a dict copy and a queue put, and the thread
+flushes and fsyncs after each batch, i.e. on trial boundaries.
+
+:func:`load_checkpoint` reads the file back (ignoring a torn last line) and
+:meth:`BlockUnit.resume_from` restores results, the remaining condition
+schedule and the session trial counter from it.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+
+from ..io.sink import JsonlEventSink
+
+CHECKPOINT_VERSION = 1
+
+
+def _jsonable(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, Mapping):
+        return {str(k): _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_jsonable(v) for v in value]
+    return str(value)
+
+
+def _checkpoint_record(rec: dict[str, Any], t_ns: int, clock: Any) -> dict[str, Any]:
+    out = _jsonable(rec)
+    out["t_ns"] = t_ns
+    return out
+
+
+def _end_torn_line(path: Path) -> None:
+    # A crash can leave a partial last record; start appending on a new line.
+    try:
+        with path.open("rb+") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+    except FileNotFoundError:
+        return
+
+
+class CheckpointWriter:
+    """Write block schedules and trial results to an append-only JSONL file.
+
+    Parameters
+    ----------
+    path : str or Path
+        Checkpoint file. Existing content is kept, so a resumed session
+        appends to the checkpoint it was restored from; a torn last line is
+        terminated first so it cannot swallow the next record.
+    fsync : bool
+        ``os.fsync`` after each written batch. Disable only where the
+        checkpoint is a convenience rather than crash protection.
+    background : bool
+        Write from a daemon thread (default). With False every record is
+        written and synced inline.
+    """
+
+    def __init__(self, path: str | Path, *, fsync: bool = True, background: bool = True):
+        self.path = Path(path)
+        _end_torn_line(self.path)
+        self._sink = JsonlEventSink(
+            self.path,
+            transform=_checkpoint_record,
+            background=background,
+            flush_policy="every_n",
+            flush_every=1,
+            fsync=fsync,
+        )
+
+    @property
+    def n_written(self) -> int:
+        return self._sink.n_written
+
+    def block_start(
+        self, block_id: str, *, block_idx: int, seed: Any = None, conditions: Any = None
+    ) -> None:
+        self._sink({
+            "type": "block_start",
+            "version": CHECKPOINT_VERSION,
+            "block_id": block_id,
+            "block_idx": block_idx,
+            "seed": seed,
+            "conditions": list(conditions) if conditions is not None else None,
+        })
+
+    def trial(self, block_id: str, trial_index: int, result: Mapping[str, Any]) -> None:
+        self._sink({
+            "type": "trial",
+            "block_id": block_id,
+            "trial_index": trial_index,
+            "result": dict(result),
+        })
+
+    def block_end(self, block_id: str, *, n_trials: int, duration: Optional[float] = None) -> None:
+        self._sink({
+            "type": "block_end",
+            "block_id": block_id,
+            "n_trials": n_trials,
+            "duration": duration,
+        })
+
+    def flush(self) -> None:
+        """Block until every record written so far is on disk."""
+        self._sink.flush()
+
+    def close(self) -> None:
+        self._sink.close()
+
+    def __enter__(self) -> "CheckpointWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+@dataclass
+class BlockCheckpoint:
+    """Saved state of one block."""
+
+    block_id: str
+    block_idx: Optional[int] = None
+    seed: Any = None
+    conditions: Optional[list[Any]] = None
+    results: list[dict[str, Any]] = field(default_factory=list)
+    complete: bool = False
+
+    @property
+    def remaining_conditions(self) -> list[Any]:
+        if self.conditions is None:
+            return []
+        return list(self.conditions[len(self.results):])
+
+
+@dataclass
+class CheckpointState:
+    """Everything :func:`load_checkpoint` recovered from a checkpoint file."""
+
+    blocks: dict[str, BlockCheckpoint] = field(default_factory=dict)
+    last_trial_id: Optional[int] = None
+    n_corrupt: int = 0
+
+    def is_complete(self, block_id: str) -> bool:
+        block = self.blocks.get(block_id)
+        return block is not None and block.complete
+
+    def all_results(self) -> list[dict[str, Any]]:
+        """Trial results of all blocks in file order."""
+        return [row for block in self.blocks.values() for row in block.results]
+
+
+def load_checkpoint(path: str | Path) -> CheckpointState:
+    """Rebuild session state from a checkpoint file.
+
+    Undecodable lines (typically a record torn by a crash mid-write) are
+    skipped and counted in ``n_corrupt``. A missing file yields an empty state.
+    """
+    state = CheckpointState()
+    path = Path(path)
+    if not path.exists():
+        return state
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rec = json.loads(line)
+            except json.JSONDecodeError:
+                state.n_corrupt += 1
+                continue
+            if not isinstance(rec, dict):
+                state.n_corrupt += 1
+                continue
+            kind = rec.get("type")
+            block_id = str(rec.get("block_id"))
+            block = state.blocks.get(block_id)
+            if block is None:
+                block = state.blocks[block_id] = BlockCheckpoint(block_id=block_id)
+            if kind == "block_start":
+                # A resumed block logs its start again; keep the trials already saved.
+                block.block_idx = rec.get("block_idx")
+                block.seed = rec.get("seed")
+                block.conditions = rec.get("conditions")
+            elif kind == "trial":
+                result = rec.get("result") or {}
+                block.results.append(result)
+                trial_id = result.get("trial_id")
+                if isinstance(trial_id, int) and not isinstance(trial_id, bool):
+                    state.last_trial_id = max(trial_id, state.last_trial_id or 0)
+            elif kind == "block_end":
+                block.complete = True
+    return state
@@ -7,8 +7,28 @@ from psychopy.hardware import keyboard
 from psychopy.visual import Window
 
 
+def _wrap_headless(win: Window, settings) -> Tuple[Window, keyboard.Keyboard]:
+    """Swap in the virtual-clock window/keyboard when the runtime context asks for it."""
+    from ..sim.context import get_context
+    from ..sim.headless import HeadlessKeyboard, HeadlessWindow, VirtualClock
+
+    ctx = get_context()
+    clock = getattr(ctx, "clock", None) if ctx is not None else None
+    if not isinstance(clock, VirtualClock) or not getattr(getattr(ctx, "config", None), "headless", False):
+        return win, keyboard.Keyboard()
+
+    settings.frame_time_seconds = clock.frame_period
+    settings.win_fps = 1.0 / clock.frame_period
+    return HeadlessWindow(clock, inner=win), HeadlessKeyboard(clock)
+
+
 def initialize_exp(settings, screen_id: Optional[int] = None) -> Tuple[Window, keyboard.Keyboard]:
-    """Set up the PsychoPy window, keyboard and logging."""
+    """Set up the PsychoPy window, keyboard and logging.
+
+    When a headless qa/sim runtime context is active, the returned window is a
+    :class:`~psyflow.sim.headless.HeadlessWindow` wrapping the PsychoPy window
+    (used only to build and draw stimuli) and flips advance the virtual clock.
+    """
     mon = monitors.Monitor("tempMonitor")
     mon.setWidth(getattr(settings, "monitor_width_cm", 35.5))
     mon.setDistance(getattr(settings, "monitor_distance_cm", 60))
@@ -26,7 +46,6 @@ def initialize_exp(settings, screen_id: Optional[int] = None) -> Tuple[Window, k
         gammaErrorPolicy="ignore",
     )
 
-    kb = keyboard.Keyboard()
     win.mouseVisible = False
 
     try:
@@ -49,6 +68,8 @@ def initialize_exp(settings, screen_id: Optional[int] = None) -> Tuple[Window, k
         settings.frame_time_seconds = 1 / 60
         settings.win_fps = 60
 
+    win, kb = _wrap_headless(win, settings)
+
     log_path = getattr(settings, "log_file", "experiment.log")
     logging.setDefaultClock(core.Clock())
     logging.LogFile(log_path, level=logging.DATA, filemode="a")
@@ -0,0 +1,120 @@
+"""Per-flip frame timing recorder.
+
+A :class:`FrameTimingRecorder` is handed to :class:`~psyflow.StimUnit` via
+``frame_recorder=``. Every ``win.flip()`` timestamp of a stage is written into
+a preallocated NumPy buffer; at stage end the inter-flip intervals are
+compared against the nominal frame period and summary fields are returned for
+the unit state. Raw timestamps of all stages are kept for per-session export.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+
+class FrameTimingRecorder:
+    """Collect flip timestamps per stage and detect dropped frames.
+
+    Parameters
+    ----------
+    capacity : int
+        Initial number of flips the session buffer can hold. The buffer
+        doubles when full, so this only needs to be a reasonable estimate.
+    drop_threshold : float
+        An interval longer than ``drop_threshold * frame_time`` counts as
+        dropped; the number of missed refreshes is ``round(ifi / frame_time) - 1``.
+    """
+
+    def __init__(self, capacity: int = 65536, *, drop_threshold: float = 1.5):
+        if drop_threshold <= 1.0:
+            raise ValueError(f"drop_threshold must be > 1.0, got {drop_threshold}")
+        capacity = max(16, int(capacity))
+        self.drop_threshold = float(drop_threshold)
+        self._t = np.empty(capacity, dtype=np.float64)
+        self._stage = np.empty(capacity, dtype=np.int32)
+        self._n = 0
+        self._labels: list[str] = []
+        self._frame_times: list[float] = []
+        self._stage_start: int | None = None
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def labels(self) -> list[str]:
+        return list(self._labels)
+
+    def begin(self, label: str, frame_time: float) -> None:
+        """Start a new stage; following :meth:`record` calls belong to it."""
+        self._labels.append(str(label))
+        self._frame_times.append(float(frame_time))
+        self._stage_start = self._n
+
+    def record(self, t_flip: float) -> None:
+        """Store one flip timestamp (seconds) for the current stage."""
+        if self._stage_start is None:
+            return
+        if self._n == self._t.shape[0]:
+            self._grow()
+        self._t[self._n] = t_flip
+        self._stage[self._n] = len(self._labels) - 1
+        self._n += 1
+
+    def end(self) -> dict[str, Any]:
+        """Close the current stage and return its summary fields."""
+        if self._stage_start is None:
+            return {}
+        t = self._t[self._stage_start:self._n]
+        self._stage_start = None
+        return summarize_flips(t, self._frame_times[-1], drop_threshold=self.drop_threshold)
+
+    def stage_times(self, index: int = -1) -> np.ndarray:
+        """Return a copy of the flip timestamps of one recorded stage."""
+        if not self._labels:
+            return np.empty(0, dtype=np.float64)
+        index = range(len(self._labels))[index]
+        return self._t[:self._n][self._stage[:self._n] == index].copy()
+
+    def export(self, path: str | Path) -> Path:
+        """Write all recorded flips to a compressed ``.npz`` file.
+
+        Arrays: ``t_flip`` (float64), ``stage`` (index into ``labels``),
+        ``labels`` and ``frame_time`` (nominal period per stage).
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            path,
+            t_flip=self._t[:self._n],
+            stage=self._stage[:self._n],
+            labels=np.asarray(self._labels, dtype=str),
+            frame_time=np.asarray(self._frame_times, dtype=np.float64),
+        )
+        return path
+
+    def _grow(self) -> None:
+        size = self._t.shape[0] * 2
+        t = np.empty(size, dtype=np.float64)
+        stage = np.empty(size, dtype=np.int32)
+        t[:self._n] = self._t[:self._n]
+        stage[:self._n] = self._stage[:self._n]
+        self._t, self._stage = t, stage
+
+
+def summarize_flips(t_flip: np.ndarray, frame_time: float, *, drop_threshold: float = 1.5) -> dict[str, Any]:
+    """Summarize flip timestamps of one stage against the nominal frame period."""
+    n_flips = int(t_flip.shape[0])
+    if n_flips < 2:
+        return {"n_flips": n_flips, "n_dropped": 0, "max_ifi": None, "ifi_sd": None}
+    ifi = np.diff(t_flip)
+    late = ifi > drop_threshold * frame_time
+    n_dropped = int(np.maximum(np.rint(ifi[late] / frame_time) - 1, 1).sum()) if late.any() else 0
+    return {
+        "n_flips": n_flips,
+        "n_dropped": n_dropped,
+        "max_ifi": float(ifi.max()),
+        "ifi_sd": float(ifi.std()),
+    }
@@ -0,0 +1,162 @@
+"""Deferred work run in the idle time between flips.
+
+An :class:`IdleScheduler` holds tasks that are not needed until later, such
+as preparing the next trial. Display loops that opt in (``StimUnit.show(...,
+idle_work=True)``, e.g. during an ITI) call :func:`run_idle` after each flip,
+which runs queued work for at most a fixed slice of the frame and returns so
+the next frame is drawn on time.
+
+A task is a plain callable, run in one step, or a generator function whose
+``yield`` statements mark where it may be paused until the next frame. A
+generator's ``return`` value is the task's result.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import inspect
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional
+
+_ACTIVE: ContextVar[Optional["IdleScheduler"]] = ContextVar("psyflow_idle_scheduler", default=None)
+
+
+class IdleTask:
+    """Handle to a submitted task; :meth:`result` finishes it if needed.
+
+    The task runs in a copy of the context it was submitted from, so context
+    variables set at submission (e.g. the trial's planned jitter) apply to
+    every step, whichever frame or caller runs it.
+    """
+
+    def __init__(self, fn: Callable[..., Any], args: tuple, kwargs: dict):
+        self._context = contextvars.copy_context()
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+        self._gen: Optional[Iterator[Any]] = None
+        self._result: Any = None
+        self._error: Optional[BaseException] = None
+        self.done = False
+        self.steps = 0
+        self.elapsed_s = 0.0
+
+    def step(self) -> bool:
+        """Run one slice; returns True once the task has finished."""
+        if self.done:
+            return True
+        t0 = time.perf_counter()
+        try:
+            if self._gen is None:
+                out = self._context.run(self._fn, *self._args, **self._kwargs)
+                if inspect.isgenerator(out):
+                    self._gen = out
+                    self._context.run(next, self._gen)
+                else:
+                    self._result = out
+                    self.done = True
+            else:
+                self._context.run(next, self._gen)
+        except StopIteration as stop:
+            self._result = stop.value
+            self.done = True
+        except Exception as e:
+            self._error = e
+            self.done = True
+        self.steps += 1
+        self.elapsed_s += time.perf_counter() - t0
+        return self.done
+
+    def result(self) -> Any:
+        """Return the result, running any remaining steps now; re-raises task errors."""
+        while not self.step():
+            pass
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+
+class IdleScheduler:
+    """FIFO of :class:`IdleTask` objects run within a per-frame time budget.
+
+    Parameters
+    ----------
+    budget_s : float, optional
+        Maximum time per :meth:`run` call. If omitted, :func:`run_idle` uses
+        ``budget_fraction`` of the caller's frame period.
+    budget_fraction : float
+        Share of a frame spent on idle work when ``budget_s`` is not set.
+    """
+
+    def __init__(self, budget_s: Optional[float] = None, *, budget_fraction: float = 0.5):
+        if budget_s is not None and budget_s <= 0:
+            raise ValueError(f"budget_s must be > 0, got {budget_s}")
+        if not 0 < budget_fraction <= 1:
+            raise ValueError(f"budget_fraction must be in (0, 1], got {budget_fraction}")
+        self.budget_s = budget_s
+        self.budget_fraction = float(budget_fraction)
+        self._queue: deque[IdleTask] = deque()
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> IdleTask:
+        task = IdleTask(fn, args, kwargs)
+        self._queue.append(task)
+        return task
+
+    def run(self, budget_s: Optional[float] = None) -> int:
+        """Run queued slices until ``budget_s`` is used up; returns the number run.
+
+        At least one slice runs per call, so a task always makes progress,
+        but a single slice cannot be interrupted: keep generator steps short.
+        """
+        budget = self.budget_s if budget_s is None else budget_s
+        deadline = time.perf_counter() + (budget or 0.0)
+        n = 0
+        while self._queue:
+            task = self._queue[0]
+            if task.step():
+                self._queue.popleft()
+            n += 1
+            if time.perf_counter() >= deadline:
+                break
+        return n
+
+    def drain(self) -> None:
+        """Finish every queued task now (errors stay with their task)."""
+        while self._queue:
+            task = self._queue[0]
+            while not task.step():
+                pass
+            self._queue.popleft()
+
+
+def active_idle_scheduler() -> Optional[IdleScheduler]:
+    """The scheduler installed by :func:`idle_scheduler`, if any."""
+    return _ACTIVE.get()
+
+
+@contextmanager
+def idle_scheduler(scheduler: IdleScheduler) -> Iterator[IdleScheduler]:
+    """Make ``scheduler`` the target of :func:`run_idle` within the block."""
+    token = _ACTIVE.set(scheduler)
+    try:
+        yield scheduler
+    finally:
+        _ACTIVE.reset(token)
+
+
+def run_idle(frame_time: float) -> int:
+    """Run idle work for a slice of one frame (no-op without pending work)."""
+    scheduler = _ACTIVE.get()
+    if scheduler is None or not scheduler._queue:
+        return 0
+    budget = scheduler.budget_s
+    if budget is None:
+        budget = scheduler.budget_fraction * float(frame_time)
+    return scheduler.run(budget)
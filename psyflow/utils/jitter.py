@@ -0,0 +1,250 @@
+"""Block-level jitter schedules planned before the block runs.
+
+Instead of drawing each jittered duration when its stage starts,
+:func:`plan_jitter` samples every duration of a block up front, one NumPy
+array per stage label. Values can be stratified within each condition (so
+every condition gets the same spread of durations) and rounded to whole
+frames, and the finished :class:`JitterSchedule` is known before the first
+trial, e.g. for checking fMRI design efficiency.
+
+``BlockUnit.plan_jitter`` stores a schedule on the block; while a trial runs,
+``StimUnit`` stages whose label is in the schedule and whose ``duration`` is a
+``(min, max)`` range take their planned value for that trial instead of
+sampling one.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Iterator, Mapping, Optional, Sequence
+
+import numpy as np
+
+from ..sim.rng import RngStreams, active_rng_streams
+
+_DISTRIBUTIONS = ("uniform", "exponential", "choice", "fixed")
+_ACTIVE: ContextVar[Optional[tuple["JitterSchedule", int]]] = ContextVar("psyflow_jitter", default=None)
+
+
+@dataclass
+class JitterSpec:
+    """Distribution of one stage's duration (seconds).
+
+    - ``uniform``: between ``low`` and ``high``.
+    - ``exponential``: ``low`` plus an exponential with mean ``mean``,
+      truncated at ``high`` if given.
+    - ``choice``: one of ``values`` (optionally ``weights``).
+    - ``fixed``: always ``low``.
+
+    With ``balance``, draws are stratified within each condition so the
+    conditions get matching duration distributions; otherwise each value is
+    an independent draw.
+    """
+
+    dist: str = "uniform"
+    low: Optional[float] = None
+    high: Optional[float] = None
+    mean: Optional[float] = None
+    values: Optional[Sequence[float]] = None
+    weights: Optional[Sequence[float]] = None
+    balance: bool = True
+
+    def __post_init__(self) -> None:
+        if self.dist not in _DISTRIBUTIONS:
+            raise ValueError(f"Unknown jitter distribution {self.dist!r}; expected one of {_DISTRIBUTIONS}")
+        if self.dist == "uniform" and (self.low is None or self.high is None or self.high < self.low):
+            raise ValueError("uniform jitter needs low <= high")
+        if self.dist == "exponential":
+            if self.mean is None or self.mean <= 0:
+                raise ValueError("exponential jitter needs mean > 0")
+            if self.high is not None and self.high <= (self.low or 0.0):
+                raise ValueError("exponential jitter needs high > low")
+        if self.dist == "choice":
+            if not self.values:
+                raise ValueError("choice jitter needs values")
+            if self.weights is not None and len(self.weights) != len(self.values):
+                raise ValueError("Length of weights must match number of values.")
+        if self.dist == "fixed" and self.low is None:
+            raise ValueError("fixed jitter needs low")
+
+    @classmethod
+    def coerce(cls, spec: Any) -> "JitterSpec":
+        """Build a spec from a spec, a mapping, a ``(min, max)`` pair or a number."""
+        if isinstance(spec, JitterSpec):
+            return spec
+        if isinstance(spec, Mapping):
+            return cls(**spec)
+        if isinstance(spec, (list, tuple)) and len(spec) == 2:
+            return cls("uniform", low=float(spec[0]), high=float(spec[1]))
+        if isinstance(spec, (int, float)):
+            return cls("fixed", low=float(spec))
+        raise TypeError(f"Invalid jitter spec: {spec!r}")
+
+    def bounds(self) -> tuple[Optional[float], Optional[float]]:
+        """Smallest and largest possible duration (``None`` if unbounded)."""
+        if self.dist == "uniform":
+            return self.low, self.high
+        if self.dist == "exponential":
+            return self.low or 0.0, self.high
+        if self.dist == "choice":
+            return float(min(self.values)), float(max(self.values))
+        return self.low, self.low
+
+    def quantile(self, u: np.ndarray) -> np.ndarray:
+        """Map uniform ``u`` in [0, 1) to durations (inverse CDF)."""
+        if self.dist == "uniform":
+            return self.low + u * (self.high - self.low)
+        if self.dist == "exponential":
+            low = self.low or 0.0
+            mass = 1.0 if self.high is None else -np.expm1(-(self.high - low) / self.mean)
+            return low - self.mean * np.log1p(-u * mass)
+        if self.dist == "choice":
+            values = np.asarray(self.values, dtype=float)
+            weights = np.ones(len(values)) if self.weights is None else np.asarray(self.weights, dtype=float)
+            cum = np.cumsum(weights) / weights.sum()
+            return values[np.minimum(np.searchsorted(cum, u, side="right"), len(values) - 1)]
+        return np.full(u.shape, float(self.low))
+
+
+class JitterSchedule:
+    """Planned durations per stage label, indexed by trial index."""
+
+    def __init__(self, durations: Mapping[str, np.ndarray], frame_time: Optional[float] = None):
+        self._durations = {str(k): np.asarray(v, dtype=float) for k, v in durations.items()}
+        self.frame_time = frame_time
+
+    @property
+    def stages(self) -> list[str]:
+        return list(self._durations)
+
+    @property
+    def n_trials(self) -> int:
+        return len(next(iter(self._durations.values()), ()))
+
+    def __contains__(self, stage: str) -> bool:
+        return stage in self._durations
+
+    def durations(self, stage: str) -> np.ndarray:
+        return self._durations[stage]
+
+    def frames(self, stage: str) -> np.ndarray:
+        """Durations of ``stage`` in frames (requires ``frame_time``)."""
+        if not self.frame_time:
+            raise ValueError("Schedule was planned without frame_time")
+        return np.rint(self._durations[stage] / self.frame_time).astype(int)
+
+    def get(self, stage: str, trial_index: int) -> float:
+        return float(self._durations[stage][trial_index])
+
+    def to_dict(self) -> dict[str, list[float]]:
+        return {k: v.tolist() for k, v in self._durations.items()}
+
+
+def _whole_frames(values: np.ndarray, bounds: tuple[Optional[float], Optional[float]], frame_time: float) -> np.ndarray:
+    """Round to whole frames, keeping to the frame counts that lie within ``bounds``."""
+    frames = np.rint(values / frame_time)
+    low, high = bounds
+    f_low = max(1, int(np.ceil(low / frame_time - 1e-9))) if low is not None else 1
+    f_high = int(np.floor(high / frame_time + 1e-9)) if high is not None else None
+    if f_high is None or f_low <= f_high:
+        frames = np.clip(frames, f_low, f_high)
+    else:
+        # No whole frame inside the bounds: nearest frame count it is.
+        frames = np.maximum(1, frames)
+    return frames * frame_time
+
+
+def _group_key(condition: Any) -> Any:
+    try:
+        hash(condition)
+    except TypeError:
+        return repr(condition)
+    return condition
+
+
+def plan_jitter(
+    specs: Mapping[str, Any],
+    n_trials: Optional[int] = None,
+    *,
+    conditions: Optional[Sequence[Any]] = None,
+    frame_time: Optional[float] = None,
+    rng: RngStreams | int | None = None,
+) -> JitterSchedule:
+    """Sample every stage duration of a block.
+
+    Parameters
+    ----------
+    specs : Mapping[str, Any]
+        Stage label to :class:`JitterSpec` (or anything
+        :meth:`JitterSpec.coerce` accepts).
+    n_trials : int, optional
+        Number of trials; defaults to ``len(conditions)``.
+    conditions : Sequence, optional
+        Trial conditions in run order. Balanced specs are stratified within
+        each condition; without conditions the whole block is one stratum.
+    frame_time : float, optional
+        Frame period in seconds. Durations are rounded to whole frames
+        (at least one).
+    rng : RngStreams or int, optional
+        Streams (or seed) to draw from; stage ``label`` uses the stream
+        ``("jitter", label)``. Defaults to the active streams.
+
+    Returns
+    -------
+    JitterSchedule
+    """
+    if n_trials is None:
+        if conditions is None:
+            raise ValueError("plan_jitter needs n_trials or conditions")
+        n_trials = len(conditions)
+    if conditions is not None and len(conditions) != n_trials:
+        raise ValueError(f"Got {len(conditions)} conditions for {n_trials} trials")
+    if rng is None:
+        rng = active_rng_streams()
+    elif not isinstance(rng, RngStreams):
+        rng = RngStreams(int(rng))
+
+    groups: dict[Any, list[int]] = {}
+    for i in range(n_trials):
+        groups.setdefault(_group_key(conditions[i]) if conditions is not None else None, []).append(i)
+
+    durations = {}
+    for label, raw in specs.items():
+        spec = JitterSpec.coerce(raw)
+        gen = rng.generator("jitter", label)
+        u = np.empty(n_trials)
+        if spec.balance:
+            for idx in groups.values():
+                k = len(idx)
+                u[idx] = (gen.permutation(k) + gen.random(k)) / k
+        else:
+            u[:] = gen.random(n_trials)
+        values = spec.quantile(u)
+        if frame_time:
+            values = _whole_frames(values, spec.bounds(), frame_time)
+        durations[label] = values
+    return JitterSchedule(durations, frame_time=frame_time)
+
+
+@contextmanager
+def planned_jitter(schedule: Optional[JitterSchedule], trial_index: int) -> Iterator[None]:
+    """Make ``schedule``'s values for ``trial_index`` visible to :func:`planned_duration`."""
+    if schedule is None:
+        yield
+        return
+    token = _ACTIVE.set((schedule, int(trial_index)))
+    try:
+        yield
+    finally:
+        _ACTIVE.reset(token)
+
+
+def planned_duration(stage: str) -> Optional[float]:
+    """Planned duration of ``stage`` in the current trial, or ``None``."""
+    active = _ACTIVE.get()
+    if active is None or stage not in active[0]:
+        return None
+    schedule, index = active
+    return schedule.get(stage, index)
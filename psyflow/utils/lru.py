@@ -0,0 +1,168 @@
+"""Bounded LRU cache with item and byte limits.
+
+Used by :class:`~psyflow.StimBank` for instantiated stimuli and memoized
+formatted text. Entries carry an estimated size in bytes; when either limit
+is exceeded the least recently used unpinned entries are evicted and handed
+to ``on_evict``.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterator, Optional
+
+
+class LRUCache:
+    """Least-recently-used cache bounded by entry count and/or total bytes.
+
+    Parameters
+    ----------
+    max_items : int, optional
+        Maximum number of entries (``None`` = unbounded).
+    max_bytes : int, optional
+        Maximum sum of entry sizes (``None`` = unbounded).
+    size_of : callable, optional
+        ``size_of(value) -> int`` used when :meth:`put` gets no ``nbytes``.
+    on_evict : callable, optional
+        ``on_evict(key, value)`` called for every entry pushed out by the
+        limits or removed with :meth:`discard`.
+    """
+
+    def __init__(
+        self,
+        max_items: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        *,
+        size_of: Optional[Callable[[Any], int]] = None,
+        on_evict: Optional[Callable[[Hashable, Any], None]] = None,
+    ):
+        if max_items is not None and max_items < 0:
+            raise ValueError(f"max_items must be >= 0, got {max_items}")
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError(f"max_bytes must be >= 0, got {max_bytes}")
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.size_of = size_of
+        self.on_evict = on_evict
+        self._data: "OrderedDict[Hashable, tuple[Any, int]]" = OrderedDict()
+        self._pinned: set[Hashable] = set()
+        self._lock = threading.RLock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self._data))
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value (marking it most recently used) or ``default``."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value without touching recency or counters."""
+        entry = self._data.get(key)
+        return default if entry is None else entry[0]
+
+    def put(self, key: Hashable, value: Any, nbytes: Optional[int] = None) -> list[tuple[Hashable, Any]]:
+        """Insert or replace an entry and enforce the limits.
+
+        Returns the evicted ``(key, value)`` pairs. The inserted entry itself
+        is never evicted, and a replaced value is not reported as evicted.
+        """
+        if nbytes is None:
+            nbytes = int(self.size_of(value)) if self.size_of is not None else 0
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[1]
+            self._data[key] = (value, nbytes)
+            self.nbytes += nbytes
+            return self._enforce()
+
+    def pin(self, key: Hashable) -> None:
+        """Exempt ``key`` from eviction (it may be inserted later)."""
+        with self._lock:
+            self._pinned.add(key)
+
+    def unpin(self, key: Hashable) -> list[tuple[Hashable, Any]]:
+        """Make ``key`` evictable again; returns entries evicted as a result."""
+        with self._lock:
+            self._pinned.discard(key)
+            return self._enforce()
+
+    @property
+    def pinned(self) -> frozenset:
+        return frozenset(self._pinned)
+
+    def discard(self, key: Hashable) -> Any:
+        """Remove an entry (calling ``on_evict``) and return its value."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+            if entry is None:
+                return None
+            self.nbytes -= entry[1]
+        self._evicted(key, entry[0])
+        return entry[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            items = list(self._data.items())
+            self._data.clear()
+            self.nbytes = 0
+        for key, (value, _) in items:
+            self._evicted(key, value)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "items": len(self._data),
+            "bytes": self.nbytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "pinned": len(self._pinned),
+        }
+
+    # -- internals ----------------------------------------------------------
+    def _over(self) -> bool:
+        return (self.max_items is not None and len(self._data) > self.max_items) or (
+            self.max_bytes is not None and self.nbytes > self.max_bytes
+        )
+
+    def _enforce(self) -> list[tuple[Hashable, Any]]:
+        evicted: list[tuple[Hashable, Any]] = []
+        if self._over():
+            # Oldest first. Pinned entries and the newest entry (the one just
+            # inserted or used) stay even if that leaves the cache over budget.
+            newest = next(reversed(self._data))
+            for key in [k for k in self._data if k not in self._pinned and k != newest]:
+                if not self._over():
+                    break
+                value, nbytes = self._data.pop(key)
+                self.nbytes -= nbytes
+                self.evictions += 1
+                evicted.append((key, value))
+        for key, value in evicted:
+            self._evicted(key, value)
+        return evicted
+
+    def _evicted(self, key: Hashable, value: Any) -> None:
+        if self.on_evict is not None:
+            try:
+                self.on_evict(key, value)
+            except Exception:
+                pass
@@ -0,0 +1,318 @@
+"""Columnar accumulator for trial results.
+
+:class:`ResultStore` replaces the list of per-trial dicts kept by
+:class:`~psyflow.BlockUnit`. Each field is stored once as an interned key and
+an append-only, typed NumPy column (bool/int64/float64, falling back to
+object), so long sessions don't carry one dict with ~80 long string keys per
+trial. Rows are still available as dict-like views, and :meth:`to_pandas`
+builds a DataFrame column by column without intermediate dicts.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Mapping, MutableMapping
+from typing import Any, Iterable, Iterator, Optional
+
+import numpy as np
+
+# "null" is a column that has only seen ``None`` so far; it takes the kind of
+# its first real value.
+_DTYPES = {"null": object, "bool": np.bool_, "int": np.int64, "float": np.float64, "object": object}
+_INT64_MIN, _INT64_MAX = -(2 ** 63), 2 ** 63 - 1
+
+
+def _kind_of(value: Any) -> str:
+    if isinstance(value, (bool, np.bool_)):
+        return "bool"
+    if isinstance(value, (int, np.integer)):
+        return "int" if _INT64_MIN <= int(value) <= _INT64_MAX else "object"
+    if isinstance(value, (float, np.floating)):
+        return "float"
+    return "object"
+
+
+def _merge_kind(current: str, incoming: str) -> str:
+    if current == incoming or incoming == "null":
+        return current
+    if current == "null":
+        return incoming
+    if {current, incoming} == {"int", "float"}:
+        return "float"
+    return "object"
+
+
+def _alloc(kind: str, capacity: int) -> np.ndarray:
+    # Zero-filled so missing numeric entries read as 0/False; object slots start as None.
+    return np.empty(capacity, dtype=object) if _DTYPES[kind] is object else np.zeros(capacity, dtype=_DTYPES[kind])
+
+
+def _values_as(data: np.ndarray, mask: np.ndarray, kind: str) -> np.ndarray:
+    """Copy of ``data`` converted to ``kind`` (masked entries become NaN/None)."""
+    if kind == "object":
+        out = np.empty(data.shape[0], dtype=object)
+        out[:] = [None if m else (v.item() if isinstance(v, np.generic) else v) for v, m in zip(data, mask)]
+        return out
+    if data.dtype == object:
+        out = _alloc(kind, data.shape[0])
+        keep = ~mask
+        out[keep] = list(data[keep])
+    else:
+        out = data.astype(_DTYPES[kind])
+    if kind == "float":
+        out[mask] = np.nan
+    return out
+
+
+class _Column:
+    # ``mask`` marks missing values (absent or None); ``present`` marks rows
+    # that have the key at all, so a key set to None still shows up.
+    __slots__ = ("kind", "data", "mask", "present")
+
+    def __init__(self, kind: str, capacity: int, n_missing: int):
+        self.kind = kind
+        self.data = _alloc(kind, capacity)
+        if kind == "float":
+            self.data[:n_missing] = np.nan
+        self.mask = np.zeros(capacity, dtype=bool)
+        self.mask[:n_missing] = True
+        self.present = np.zeros(capacity, dtype=bool)
+
+    def grow(self, capacity: int, n: int) -> None:
+        data = _alloc(self.kind, capacity)
+        data[:n] = self.data[:n]
+        mask = np.zeros(capacity, dtype=bool)
+        mask[:n] = self.mask[:n]
+        present = np.zeros(capacity, dtype=bool)
+        present[:n] = self.present[:n]
+        self.data, self.mask, self.present = data, mask, present
+
+    def clear(self, start: int, end: int) -> None:
+        """Mark rows ``start:end`` as not having this key."""
+        self.mask[start:end] = True
+        self.present[start:end] = False
+        if self.kind == "float":
+            self.data[start:end] = np.nan
+        elif _DTYPES[self.kind] is object:
+            self.data[start:end] = None
+
+    def promote(self, kind: str, n: int) -> None:
+        data = _alloc(kind, self.data.shape[0])
+        data[:n] = _values_as(self.data[:n], self.mask[:n], kind)
+        self.kind = kind
+        self.data = data
+
+    def set(self, i: int, value: Any) -> None:
+        self.present[i] = True
+        if value is None:
+            self.mask[i] = True
+            if self.kind == "float":
+                self.data[i] = np.nan
+            elif _DTYPES[self.kind] is object:
+                self.data[i] = None
+            return
+        self.mask[i] = False
+        self.data[i] = value
+
+    def get(self, i: int) -> Any:
+        if self.mask[i]:
+            return None
+        value = self.data[i]
+        return value.item() if isinstance(value, np.generic) else value
+
+
+class ResultRow(MutableMapping):
+    """Dict-like view of one row of a :class:`ResultStore`.
+
+    Reads return plain Python values; keys set to ``None`` are kept, keys the
+    row never set are absent. Writes go straight to the underlying columns.
+    """
+
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store: "ResultStore", index: int):
+        self._store = store
+        self._index = index
+
+    def __getitem__(self, key: str) -> Any:
+        col = self._store._columns.get(key)
+        if col is None or not col.present[self._index]:
+            raise KeyError(key)
+        return col.get(self._index)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._store._set(self._index, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._store._columns[key].clear(self._index, self._index + 1)
+
+    def __iter__(self) -> Iterator[str]:
+        i = self._index
+        return (k for k, col in self._store._columns.items() if col.present[i])
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: object) -> bool:
+        col = self._store._columns.get(key)  # type: ignore[arg-type]
+        return col is not None and bool(col.present[self._index])
+
+    def __repr__(self) -> str:
+        return f"ResultRow({dict(self)!r})"
+
+
+class ResultStore:
+    """Append-only columnar table of trial results.
+
+    Behaves like the ``list`` of dicts it replaces for the common uses
+    (``append``, ``extend``, ``len``, indexing, iteration over dict-like rows)
+    and adds :meth:`column` and :meth:`to_pandas` for whole-column access.
+
+    Parameters
+    ----------
+    capacity : int
+        Initial row capacity; columns double in size when full.
+    """
+
+    def __init__(self, rows: Optional[Iterable[Mapping[str, Any]]] = None, *, capacity: int = 256):
+        self._capacity = max(1, int(capacity))
+        self._n = 0
+        self._columns: dict[str, _Column] = {}
+        if rows is not None:
+            self.extend(rows)
+
+    # -- list-like API ------------------------------------------------------
+    def __len__(self) -> int:
+        return self._n
+
+    def __bool__(self) -> bool:
+        return self._n > 0
+
+    def __getitem__(self, index: int) -> ResultRow:
+        if isinstance(index, slice):
+            return [ResultRow(self, i) for i in range(self._n)[index]]  # type: ignore[return-value]
+        return ResultRow(self, range(self._n)[index])
+
+    def __iter__(self) -> Iterator[ResultRow]:
+        return (ResultRow(self, i) for i in range(self._n))
+
+    def __repr__(self) -> str:
+        return f"ResultStore(rows={self._n}, columns={len(self._columns)})"
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self._columns)
+
+    def append(self, row: Mapping[str, Any]) -> None:
+        i = self._n
+        if i == self._capacity:
+            self._grow()
+        self._n = i + 1
+        for col in self._columns.values():
+            col.clear(i, i + 1)
+        for key, value in row.items():
+            self._set(i, key, value)
+
+    def extend(self, rows: Iterable[Mapping[str, Any]]) -> None:
+        if isinstance(rows, ResultStore):
+            self._extend_store(rows)
+            return
+        for row in rows:
+            self.append(row)
+
+    # -- column access --------------------------------------------------------
+    def column(self, key: str) -> np.ndarray:
+        """Read-only view of a column (missing entries read as NaN, None, 0 or False)."""
+        col = self._columns[key]
+        view = col.data[:self._n]
+        view.flags.writeable = False
+        return view
+
+    def to_records(self) -> list[dict[str, Any]]:
+        """Materialize rows as plain dicts (legacy list-of-dicts form)."""
+        return [dict(row) for row in self]
+
+    def to_pandas(self, copy: bool = True):
+        """Build a DataFrame from the column buffers.
+
+        Columns with missing ints/bools become pandas nullable arrays.
+
+        Parameters
+        ----------
+        copy : bool
+            Copy the column buffers (default). With False the frame aliases
+            the store: its columns are read-only views, and later appends or
+            row assignments that reuse the same slots show up in it.
+        """
+        import pandas as pd
+
+        n = self._n
+        data: dict[str, Any] = {}
+        for key, col in self._columns.items():
+            values = col.data[:n]
+            mask = col.mask[:n]
+            if copy:
+                values, mask = values.copy(), mask.copy()
+            else:
+                values.flags.writeable = False
+                mask.flags.writeable = False
+            if col.kind == "null":
+                # All missing: pandas reads such a column of Nones as NaN.
+                data[key] = np.full(n, np.nan)
+            elif col.kind in ("int", "bool") and mask.any():
+                if col.kind == "int":
+                    data[key] = pd.arrays.IntegerArray(values, mask)
+                else:
+                    data[key] = pd.arrays.BooleanArray(values, mask)
+            else:
+                data[key] = values
+        return pd.DataFrame(data, copy=False)
+
+    # -- internals ----------------------------------------------------------
+    def _set(self, i: int, key: str, value: Any) -> None:
+        col = self._columns.get(key)
+        # None still creates the column, so keys keep first-seen order.
+        kind = "null" if value is None else _kind_of(value)
+        if col is None:
+            key = sys.intern(str(key))
+            col = _Column(kind, self._capacity, self._n)
+            self._columns[key] = col
+        elif col.kind != kind:
+            merged = _merge_kind(col.kind, kind)
+            if merged != col.kind:
+                col.promote(merged, self._n)
+        col.set(i, value)
+
+    def _grow(self, needed: int = 0) -> None:
+        capacity = max(self._capacity * 2, needed)
+        for col in self._columns.values():
+            col.grow(capacity, self._n)
+        self._capacity = capacity
+
+    def _extend_store(self, other: "ResultStore") -> None:
+        m = other._n
+        if m == 0:
+            return
+        start, end = self._n, self._n + m
+        if end > self._capacity:
+            self._grow(end)
+        for col in self._columns.values():
+            col.clear(start, end)
+        for key, src in other._columns.items():
+            col = self._columns.get(key)
+            if col is None:
+                col = _Column(src.kind, self._capacity, start)
+                self._columns[key] = col
+            elif col.kind != src.kind:
+                merged = _merge_kind(col.kind, src.kind)
+                if merged != col.kind:
+                    col.promote(merged, start)
+            src_data = src.data[:m]
+            if col.kind != src.kind:
+                src_data = _values_as(src_data, src.mask[:m], col.kind)
+            col.data[start:end] = src_data
+            col.mask[start:end] = src.mask[:m]
+            col.present[start:end] = src.present[:m]
+        self._n = end
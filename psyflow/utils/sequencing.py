@@ -0,0 +1,592 @@
+"""Constrained trial sequences.
+
+:func:`generate_sequence` orders a multiset of condition labels under
+sequence constraints without rejection loops over whole shuffles:
+
+- Run-length limits, no immediate repeats and minimum spacing between
+  occurrences of a label are built constructively. Each position is drawn
+  with probability proportional to the labels' remaining counts (a uniform
+  shuffle when nothing binds), restricted to labels that keep the rest of the
+  sequence completable, so dead ends are rare and cost one restart.
+- First-order counterbalancing is a path problem: a sequence whose ordered
+  pairs occur given numbers of times is an Eulerian trail through the
+  multigraph of those transitions. Trails are sampled uniformly with the
+  random-arborescence (BEST / Wilson) method.
+
+:func:`check_sequence` validates a sequence with NumPy, and every generated
+sequence comes with a :class:`SequenceReport` (method, attempts, time).
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Mapping, Optional, Sequence
+
+import numpy as np
+
+from ..sim.rng import RngStreams, active_rng_streams
+
+
+@dataclass
+class SequenceConstraints:
+    """Constraints on the order of condition labels.
+
+    Attributes
+    ----------
+    max_run : int or Mapping, optional
+        Longest allowed run of one label, for all labels or per label.
+    no_repeat : bool
+        Shorthand for ``max_run=1``.
+    min_gap : Mapping, optional
+        Label to the minimum number of other trials between two of its
+        occurrences (e.g. ``{"oddball": 3}``).
+    transitions : "balanced" or Mapping, optional
+        ``"balanced"`` makes each ordered pair of labels occur in proportion
+        to the product of their counts (every pair equally often when counts
+        are equal; with ``no_repeat`` only pairs of different labels).
+        A mapping ``{(prev, next): count}`` or ``{prev: {next: count}}`` fixes
+        the count of each transition; counts must add up to ``n_trials - 1``.
+    max_attempts : int
+        Restarts allowed before giving up.
+    """
+
+    max_run: Optional[int | Mapping[Any, int]] = None
+    no_repeat: bool = False
+    min_gap: Optional[Mapping[Any, int]] = None
+    transitions: Optional[str | Mapping[Any, Any]] = None
+    max_attempts: int = 1000
+
+    def __post_init__(self) -> None:
+        if isinstance(self.transitions, str) and self.transitions != "balanced":
+            raise ValueError(f"transitions must be 'balanced' or a mapping, got {self.transitions!r}")
+        if self.max_attempts < 1:
+            raise ValueError(f"max_attempts must be >= 1, got {self.max_attempts}")
+
+    @classmethod
+    def coerce(cls, value: "SequenceConstraints | Mapping[str, Any] | None") -> "SequenceConstraints":
+        if value is None:
+            return cls()
+        if isinstance(value, SequenceConstraints):
+            return value
+        if isinstance(value, Mapping):
+            return cls(**value)
+        raise TypeError(f"Invalid sequence constraints: {value!r}")
+
+
+@dataclass
+class SequenceReport:
+    """How a sequence was generated and what it contains."""
+
+    method: str
+    attempts: int
+    elapsed_s: float
+    counts: dict[str, int] = field(default_factory=dict)
+    violations: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not any(self.violations.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class _Limits:
+    """Per-label constraint arrays aligned to ``labels``."""
+
+    def __init__(self, labels: Sequence[Any], c: SequenceConstraints, n: int):
+        k = len(labels)
+        index = {lbl: i for i, lbl in enumerate(labels)}
+        self.max_run = np.full(k, n + 1, dtype=np.int64)
+        if c.no_repeat:
+            self.max_run[:] = 1
+        elif isinstance(c.max_run, Mapping):
+            for lbl, v in c.max_run.items():
+                self.max_run[_lookup(index, lbl)] = int(v)
+        elif c.max_run is not None:
+            self.max_run[:] = int(c.max_run)
+        if np.any(self.max_run < 1):
+            raise ValueError("max_run must be >= 1")
+        self.min_gap = np.zeros(k, dtype=np.int64)
+        for lbl, v in (c.min_gap or {}).items():
+            self.min_gap[_lookup(index, lbl)] = int(v)
+        if np.any(self.min_gap < 0):
+            raise ValueError("min_gap must be >= 0")
+
+
+def _lookup(index: Mapping[Any, int], label: Any) -> int:
+    if label not in index:
+        raise ValueError(f"Unknown condition label in constraints: {label!r}")
+    return index[label]
+
+
+def check_sequence(
+    sequence: Sequence[Any],
+    constraints: "SequenceConstraints | Mapping[str, Any] | None",
+    labels: Optional[Sequence[Any]] = None,
+) -> dict[str, int]:
+    """Count constraint violations in ``sequence`` (all zero means valid).
+
+    Keys are ``max_run`` (runs that are too long), ``min_gap`` (occurrences
+    too close to the previous one) and ``transitions`` (total absolute
+    deviation from fixed transition counts, or the spread between the most
+    and least frequent pair for ``"balanced"``).
+    """
+    c = SequenceConstraints.coerce(constraints)
+    labels = list(dict.fromkeys(sequence)) if labels is None else list(labels)
+    index = {lbl: i for i, lbl in enumerate(labels)}
+    codes = np.fromiter((_lookup(index, s) for s in sequence), dtype=np.int64, count=len(sequence))
+    limits = _Limits(labels, c, len(codes))
+    out = {"max_run": 0, "min_gap": 0, "transitions": 0}
+    if len(codes) == 0:
+        return out
+
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    run_len = np.diff(np.r_[starts, len(codes)])
+    out["max_run"] = int(np.sum(run_len > limits.max_run[codes[starts]]))
+
+    for j in np.flatnonzero(limits.min_gap):
+        gaps = np.diff(np.flatnonzero(codes == j)) - 1
+        out["min_gap"] += int(np.sum(gaps < limits.min_gap[j]))
+
+    if c.transitions is not None and len(codes) > 1:
+        k = len(labels)
+        observed = np.bincount(codes[:-1] * k + codes[1:], minlength=k * k).reshape(k, k)
+        if c.transitions == "balanced":
+            counts = np.bincount(codes, minlength=k)
+            allowed = _allowed_edges(k, c.no_repeat)
+            try:
+                target = _balanced_target(counts, int(codes[0]), int(codes[-1]), allowed)
+            except ValueError:
+                out["transitions"] = int(observed[~allowed].sum()) or 1
+            else:
+                # Rounding to whole transitions moves cells by less than 2.
+                out["transitions"] = int(np.sum(np.abs(observed - target) >= 2) + observed[~allowed].sum())
+        else:
+            target = _transition_matrix(c.transitions, labels)
+            out["transitions"] = int(np.abs(observed - target).sum())
+    return out
+
+
+def generate_sequence(
+    labels: Sequence[Any],
+    counts: Sequence[int],
+    constraints: "SequenceConstraints | Mapping[str, Any] | None" = None,
+    *,
+    rng: np.random.Generator | RngStreams | int | None = None,
+) -> tuple[list[Any], SequenceReport]:
+    """Order ``counts[i]`` copies of each ``labels[i]`` under ``constraints``.
+
+    Label counts are always kept. With ``transitions="balanced"`` each
+    transition ``(i, j)`` occurs about ``counts[i] * counts[j] / n`` times;
+    explicit transition counts must imply exactly ``counts``.
+
+    Returns
+    -------
+    tuple[list, SequenceReport]
+
+    Raises
+    ------
+    ValueError
+        If the constraints cannot be met for these counts.
+    RuntimeError
+        If no valid sequence was found within ``max_attempts``.
+    """
+    t0 = time.perf_counter()
+    c = SequenceConstraints.coerce(constraints)
+    labels = list(labels)
+    counts = np.asarray(counts, dtype=np.int64)
+    if len(counts) != len(labels):
+        raise ValueError("Length of counts must match number of labels.")
+    n = int(counts.sum())
+    gen = _generator(rng)
+    limits = _Limits(labels, c, n)
+
+    if c.transitions is not None:
+        method = "eulerian"
+        if c.transitions == "balanced":
+            if c.no_repeat and n and counts.max() > (n + 1) // 2:
+                raise ValueError("Sequence constraints cannot be satisfied with these condition counts.")
+
+            def draw() -> Optional[np.ndarray]:
+                matrix, start, end = _balanced_matrix(counts, c.no_repeat, gen)
+                if matrix is None:
+                    return None
+                # Rounding can leave a label's transitions disconnected; redraw.
+                try:
+                    trail = _euler_trail(matrix, start, end, gen, limits.max_run - 1)
+                except ValueError:
+                    return None
+                return trail if len(trail) == n else None
+        else:
+            matrix = _transition_matrix(c.transitions, labels)
+            if int(matrix.sum()) != n - 1:
+                raise ValueError(f"Transition counts add up to {int(matrix.sum())}, need {n - 1} for {n} trials")
+            start, end = _explicit_ends(matrix, counts)
+
+            def draw() -> Optional[np.ndarray]:
+                trail = _euler_trail(matrix, start, end, gen, limits.max_run - 1)
+                if len(trail) != n:
+                    raise ValueError("Transition counts do not connect all conditions.")
+                return trail
+    else:
+        method = "constructive"
+        if n and not _feasible(counts, n, -1, 0, np.full(len(labels), n + 1), limits):
+            raise ValueError("Sequence constraints cannot be satisfied with these condition counts.")
+
+        def draw() -> Optional[np.ndarray]:
+            return _construct(counts, limits, gen)
+
+    for attempt in range(1, c.max_attempts + 1):
+        codes = draw()
+        if codes is None:
+            continue
+        seq = [labels[i] for i in codes]
+        violations = check_sequence(seq, c, labels)
+        if not any(violations.values()):
+            report = SequenceReport(
+                method=method,
+                attempts=attempt,
+                elapsed_s=time.perf_counter() - t0,
+                counts={str(lbl): int(np.sum(codes == i)) for i, lbl in enumerate(labels)},
+                violations=violations,
+            )
+            return seq, report
+    raise RuntimeError(
+        f"No sequence satisfying the constraints after {c.max_attempts} attempts "
+        f"({time.perf_counter() - t0:.2f} s)"
+    )
+
+
+def _generator(rng: np.random.Generator | RngStreams | int | None) -> np.random.Generator:
+    if isinstance(rng, np.random.Generator):
+        return rng
+    if isinstance(rng, RngStreams):
+        return rng.next("sequence")
+    if rng is None:
+        return active_rng_streams().next("sequence")
+    return RngStreams(int(rng)).generator("sequence")
+
+
+# -- constructive generation --------------------------------------------------
+
+def _feasible(
+    remaining: np.ndarray,
+    m: int,
+    last: int,
+    run: int,
+    since: np.ndarray,
+    limits: _Limits,
+) -> bool:
+    """Whether ``remaining`` can still fill the ``m`` open positions (necessary conditions)."""
+    need = remaining > 0
+    others = m - remaining
+    # Run limits: each label fits at most max_run per gap between other trials.
+    room = limits.max_run * (others + 1)
+    if 0 <= last:
+        room[last] -= run
+    if np.any(remaining[need] > room[need]):
+        return False
+    # Spacing: the next occurrence waits out the gap, then one per (gap + 1).
+    wait = np.maximum(0, limits.min_gap - since)
+    span = wait + (remaining - 1) * (limits.min_gap + 1) + 1
+    return not np.any(span[need] > m)
+
+
+def _construct(counts: np.ndarray, limits: _Limits, gen: np.random.Generator) -> Optional[np.ndarray]:
+    remaining = counts.copy()
+    n = int(remaining.sum())
+    k = len(remaining)
+    seq = np.empty(n, dtype=np.int64)
+    since = np.full(k, n + 1, dtype=np.int64)  # trials since each label's last occurrence
+    last, run = -1, 0
+    for pos in range(n):
+        m = n - pos - 1
+        weights = np.zeros(k)
+        for j in np.flatnonzero(remaining):
+            if (j == last and run >= limits.max_run[j]) or since[j] < limits.min_gap[j]:
+                continue
+            remaining[j] -= 1
+            nxt_since = since + 1
+            nxt_since[j] = 0
+            if _feasible(remaining, m, j, run + 1 if j == last else 1, nxt_since, limits):
+                weights[j] = remaining[j] + 1
+            remaining[j] += 1
+        total = weights.sum()
+        if total == 0:
+            return None
+        j = int(gen.choice(k, p=weights / total))
+        seq[pos] = j
+        remaining[j] -= 1
+        run = run + 1 if j == last else 1
+        last = j
+        since += 1
+        since[j] = 0
+    return seq
+
+
+# -- transition-balanced generation -------------------------------------------
+
+def _allowed_edges(k: int, no_loops: bool) -> np.ndarray:
+    allowed = np.ones((k, k), dtype=bool)
+    if no_loops:
+        np.fill_diagonal(allowed, False)
+    return allowed
+
+
+def _transition_matrix(spec: Mapping[Any, Any], labels: Sequence[Any]) -> np.ndarray:
+    index = {lbl: i for i, lbl in enumerate(labels)}
+    k = len(labels)
+    matrix = np.zeros((k, k), dtype=np.int64)
+    for key, value in spec.items():
+        if isinstance(value, Mapping):
+            for nxt, count in value.items():
+                matrix[_lookup(index, key), _lookup(index, nxt)] = int(count)
+        else:
+            prev, nxt = key
+            matrix[_lookup(index, prev), _lookup(index, nxt)] = int(value)
+    if np.any(matrix < 0):
+        raise ValueError("Transition counts must be >= 0")
+    return matrix
+
+
+def _balanced_target(counts: np.ndarray, start: int, end: int, allowed: np.ndarray) -> np.ndarray:
+    """Real-valued transition counts proportional to ``counts[i] * counts[j]``.
+
+    Rows sum to each label's departures (its count, minus one for the last
+    trial) and columns to its arrivals (minus one for the first trial).
+    Disallowed cells are zero; the margins are then restored by iterative
+    proportional fitting.
+    """
+    k = len(counts)
+    rows = counts - np.eye(k, dtype=np.int64)[end]
+    cols = counts - np.eye(k, dtype=np.int64)[start]
+    total = rows.sum()
+    if total == 0:
+        return np.zeros((k, k))
+    target = np.outer(rows, cols) / total * allowed
+    if allowed.all():
+        return target
+    if np.any(rows + cols * ~allowed.diagonal() > total):
+        raise ValueError("Transition counts cannot be balanced for these condition counts.")
+    for _ in range(200):
+        row_sum = target.sum(axis=1)
+        target *= np.divide(rows, row_sum, out=np.zeros(k), where=row_sum > 0)[:, None]
+        col_sum = target.sum(axis=0)
+        target *= np.divide(cols, col_sum, out=np.zeros(k), where=col_sum > 0)[None, :]
+        if np.allclose(target.sum(axis=1), rows, atol=1e-6):
+            break
+    # Near the feasibility boundary fitting converges slowly; the rounding
+    # step restores exact margins, so an approximate fit is enough.
+    return target
+
+
+def _round_margins(target: np.ndarray, rows: np.ndarray, cols: np.ndarray, allowed: np.ndarray,
+                   gen: np.random.Generator) -> Optional[np.ndarray]:
+    """Integer matrix near ``target`` with exactly the row/column sums ``rows``/``cols``."""
+    x = np.floor(target + 1e-9).astype(np.int64)
+    r = rows - x.sum(axis=1)
+    c = cols - x.sum(axis=0)
+    if np.any(r < 0) or np.any(c < 0):
+        return None
+    frac = (target - x) + gen.random(target.shape) * 1e-6
+    frac[~allowed] = -1.0
+    for cell in np.argsort(-frac, axis=None):
+        i, j = divmod(int(cell), len(rows))
+        if frac[i, j] >= 0 and r[i] > 0 and c[j] > 0:
+            x[i, j] += 1
+            r[i] -= 1
+            c[j] -= 1
+    while r.sum() > 0:
+        i = int(np.flatnonzero(r > 0)[0])
+        open_cols = np.flatnonzero((c > 0) & allowed[i])
+        if len(open_cols):
+            j = int(open_cols[0])
+            x[i, j] += 1
+            r[i] -= 1
+            c[j] -= 1
+            continue
+        # Only the forbidden cell (i, i) is left: move a transition a->b to
+        # a->i and i->b, which adds one to row i and column i only.
+        j = int(np.flatnonzero(c > 0)[0])
+        moved = False
+        for a, b in zip(*np.nonzero(x)):
+            if a != j and b != i and allowed[i, b] and allowed[a, j]:
+                x[a, b] -= 1
+                x[a, j] += 1
+                x[i, b] += 1
+                r[i] -= 1
+                c[j] -= 1
+                moved = True
+                break
+        if not moved:
+            return None
+    return x
+
+
+def _balanced_matrix(
+    counts: np.ndarray, no_loops: bool, gen: np.random.Generator
+) -> tuple[Optional[np.ndarray], int, int]:
+    """Transition counts for a random first/last trial, proportional to ``counts[i] * counts[j]``."""
+    k = len(counts)
+    eye = np.eye(k, dtype=np.int64)
+    allowed = _allowed_edges(k, no_loops)
+    # P(first = s, last = t) as in a shuffle, restricted to feasible ends.
+    pairs = np.outer(counts, counts) - np.diag(counts)
+    if counts.sum() == 1:
+        pairs = np.diag(counts)
+    total = counts.sum() - 1
+    for s_, t_ in zip(*np.nonzero(pairs)):
+        rows, cols = counts - eye[t_], counts - eye[s_]
+        if no_loops and np.any(rows + cols > total):
+            pairs[s_, t_] = 0
+    if pairs.sum() == 0:
+        return None, 0, 0
+    cell = int(gen.choice(k * k, p=(pairs / pairs.sum()).ravel()))
+    start, end = divmod(cell, k)
+    target = _balanced_target(counts, start, end, allowed)
+    rows = counts - np.eye(k, dtype=np.int64)[end]
+    cols = counts - np.eye(k, dtype=np.int64)[start]
+    return _round_margins(target, rows, cols, allowed, gen), start, end
+
+
+def _explicit_ends(matrix: np.ndarray, counts: np.ndarray) -> tuple[int, int]:
+    """First and last trial implied by ``matrix``; checks the implied label counts."""
+    start, end = _trail_ends(matrix)
+    out_deg = matrix.sum(axis=1)
+    if start is None:
+        # A circuit starts and ends on the label with one trial more than departures.
+        candidates = np.flatnonzero(counts == out_deg + 1)
+        if len(candidates) != 1:
+            raise ValueError("Transition counts do not match the condition counts.")
+        start = end = int(candidates[0])
+    implied = out_deg + np.eye(len(counts), dtype=np.int64)[end]
+    if not np.array_equal(implied, counts):
+        raise ValueError(
+            f"Transition counts imply condition counts {implied.tolist()}, expected {counts.tolist()}"
+        )
+    return start, end
+
+
+def _trail_ends(matrix: np.ndarray) -> tuple[Optional[int], Optional[int]]:
+    out_deg, in_deg = matrix.sum(axis=1), matrix.sum(axis=0)
+    diff = out_deg - in_deg
+    if np.all(diff == 0):
+        return None, None
+    starts, ends = np.flatnonzero(diff == 1), np.flatnonzero(diff == -1)
+    if len(starts) != 1 or len(ends) != 1 or np.count_nonzero(diff) != 2:
+        raise ValueError("Transition counts do not form a single sequence (in/out counts unbalanced).")
+    return int(starts[0]), int(ends[0])
+
+
+def _n_patterns(loops: int, others: int, max_loops: int, memo: dict) -> int:
+    """Orderings of ``loops`` L and ``others`` O with at most ``max_loops`` consecutive L."""
+    key = (loops, others)
+    if key not in memo:
+        if others == 0:
+            memo[key] = int(loops <= max_loops)
+        else:
+            memo[key] = sum(
+                _n_patterns(loops - j, others - 1, max_loops, memo) for j in range(min(max_loops, loops) + 1)
+            )
+    return memo[key]
+
+
+def _exit_pattern(loops: int, others: int, max_loops: int, gen: np.random.Generator) -> list[bool]:
+    """Uniform random L/O pattern (True = loop) with loop runs of at most ``max_loops``."""
+    if loops <= max_loops or others >= loops:
+        # Cheap path when the limit cannot or rarely binds: shuffle and check.
+        for _ in range(8):
+            pattern = gen.permutation(np.r_[np.ones(loops, bool), np.zeros(others, bool)])
+            if loops <= max_loops or _longest_true_run(pattern) <= max_loops:
+                return pattern.tolist()
+    memo: dict = {}
+    if _n_patterns(loops, others, max_loops, memo) == 0:
+        raise ValueError("Transition counts need longer runs than max_run allows.")
+    pattern: list[bool] = []
+    while others:
+        # Choose how many loops come before the next other exit.
+        options = range(min(max_loops, loops) + 1)
+        weights = np.array([_n_patterns(loops - j, others - 1, max_loops, memo) for j in options], dtype=float)
+        j = int(gen.choice(len(weights), p=weights / weights.sum()))
+        pattern += [True] * j + [False]
+        loops -= j
+        others -= 1
+    return pattern + [True] * loops
+
+
+def _longest_true_run(pattern: np.ndarray) -> int:
+    padded = np.r_[False, pattern, False].astype(np.int8)
+    edges = np.flatnonzero(np.diff(padded))
+    return int(np.max(edges[1::2] - edges[::2])) if len(edges) else 0
+
+
+def _euler_trail(
+    matrix: np.ndarray,
+    start: Optional[int],
+    end: Optional[int],
+    gen: np.random.Generator,
+    max_loops: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Uniformly random Eulerian trail of the multigraph ``matrix`` as a node sequence.
+
+    ``start``/``end`` are the trail ends (``None`` for a circuit, which then
+    starts at a random node with edges). Every node ``v != end`` leaves for
+    the last time along an edge of a random arborescence into ``end``
+    (Wilson's algorithm); the remaining exits are shuffled before it.
+
+    A run of one label is a block of consecutive self-loop exits of its
+    node, so ``max_loops[v]`` (``max_run - 1``) is enforced while ordering
+    the exits instead of by rejecting trails.
+    """
+    k = len(matrix)
+    active = np.flatnonzero(matrix.sum(axis=1) + matrix.sum(axis=0))
+    if len(active) == 0:
+        return np.array([start if start is not None else 0], dtype=np.int64)
+    if end is None:
+        if start is None:
+            start = int(gen.choice(active[matrix[active].sum(axis=1) > 0]))
+        end = start
+
+    # Random arborescence into `end`, walking edges in proportion to their counts.
+    step = matrix.astype(float)
+    np.fill_diagonal(step, 0.0)
+    in_tree = np.zeros(k, dtype=bool)
+    in_tree[end] = True
+    nxt = np.full(k, -1, dtype=np.int64)
+    for v in active:
+        u = v
+        while not in_tree[u]:
+            row = step[u]
+            total = row.sum()
+            if total == 0:
+                raise ValueError("Transition counts do not connect all conditions.")
+            nxt[u] = int(gen.choice(k, p=row / total))
+            u = nxt[u]
+        u = v
+        while not in_tree[u]:
+            in_tree[u] = True
+            u = nxt[u]
+
+    exits: dict[int, list[int]] = {}
+    for v in active:
+        targets = np.repeat(np.arange(k), matrix[v])
+        if v != end:
+            targets = np.delete(targets, np.flatnonzero(targets == nxt[v])[0])
+        if max_loops is not None and matrix[v, v] > max_loops[v]:
+            away = iter(gen.permutation(targets[targets != v]).tolist())
+            pattern = _exit_pattern(int(matrix[v, v]), len(targets) - int(matrix[v, v]), int(max_loops[v]), gen)
+            order = [int(v) if is_loop else next(away) for is_loop in pattern]
+        else:
+            order = list(gen.permutation(targets))
+        if v != end:
+            order.append(int(nxt[v]))
+        exits[int(v)] = order[::-1]  # popped from the back
+
+    trail = [start]
+    u = start
+    while exits.get(u):
+        u = int(exits[u].pop())
+        trail.append(u)
+    return np.asarray(trail, dtype=np.int64)
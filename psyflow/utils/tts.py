@@ -0,0 +1,145 @@
+"""Batched, content-addressed text-to-speech synthesis.
+
+:func:`synthesize_batch` renders many texts concurrently in one event loop
+(bounded by a semaphore) and names every output file after a hash of
+``(backend, text, voice, rate)``. Editing a text therefore produces a new
+file instead of silently reusing a stale one, and unchanged texts are reused
+without touching the network.
+
+Synthesis goes through a small backend interface (:class:`TTSBackend`);
+:class:`EdgeTTSBackend` is the default, and offline or local synthesizers can
+be plugged in for tests and air-gapped machines.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional, Protocol, runtime_checkable
+
+
+@runtime_checkable
+class TTSBackend(Protocol):
+    """Interface for speech synthesizers used by :func:`synthesize_batch`."""
+
+    name: str
+    suffix: str
+
+    async def synthesize(self, text: str, voice: str, rate: str, path: str) -> None:
+        """Write the spoken ``text`` to ``path``."""
+        ...
+
+
+class EdgeTTSBackend:
+    """Microsoft Edge online TTS via the ``edge-tts`` package (imported lazily)."""
+
+    name = "edge-tts"
+    suffix = ".mp3"
+
+    async def synthesize(self, text: str, voice: str, rate: str, path: str) -> None:
+        import edge_tts
+
+        await edge_tts.Communicate(text=text, voice=voice, rate=rate).save(path)
+
+
+@dataclass(frozen=True)
+class TTSRequest:
+    """One text to synthesize; ``key`` identifies it in the results."""
+
+    key: str
+    text: str
+    voice: str
+    rate: str = "+0%"
+
+
+@dataclass(frozen=True)
+class TTSResult:
+    key: str
+    path: str
+    cached: bool
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def voice_filename(request: TTSRequest, backend: TTSBackend) -> str:
+    """File name for ``request``: readable key prefix plus a content hash."""
+    blob = json.dumps([backend.name, request.text, request.voice, request.rate], ensure_ascii=False)
+    digest = hashlib.sha1(blob.encode("utf-8")).hexdigest()[:16]
+    prefix = re.sub(r"[^A-Za-z0-9_.-]+", "_", request.key).strip("_") or "voice"
+    return f"{prefix}-{digest}{backend.suffix}"
+
+
+def synthesize_batch(
+    requests: Iterable[TTSRequest],
+    *,
+    backend: Optional[TTSBackend] = None,
+    out_dir: str | Path = "assets",
+    overwrite: bool = False,
+    max_concurrency: int = 4,
+) -> dict[str, TTSResult]:
+    """Synthesize all ``requests`` concurrently.
+
+    Parameters
+    ----------
+    requests : iterable of TTSRequest
+        Texts to render; keys must be unique.
+    backend : TTSBackend, optional
+        Synthesizer (default :class:`EdgeTTSBackend`).
+    out_dir : str or Path
+        Output directory (created if missing).
+    overwrite : bool
+        Re-synthesize even if the content-addressed file already exists.
+    max_concurrency : int
+        Maximum number of syntheses in flight.
+
+    Returns
+    -------
+    dict
+        ``key -> TTSResult``. Failures are reported in ``error`` rather than
+        raised, and never leave a partial file behind.
+    """
+    backend = backend or EdgeTTSBackend()
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    reqs = list(requests)
+    keys = [r.key for r in reqs]
+    if len(set(keys)) != len(keys):
+        raise ValueError("TTS request keys must be unique")
+
+    results: dict[str, TTSResult] = {}
+    todo: list[tuple[TTSRequest, Path]] = []
+    for req in reqs:
+        path = out_dir / voice_filename(req, backend)
+        if path.is_file() and not overwrite:
+            results[req.key] = TTSResult(req.key, str(path), cached=True)
+        else:
+            todo.append((req, path))
+
+    async def _one(sem: asyncio.Semaphore, req: TTSRequest, path: Path) -> None:
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.part")
+        async with sem:
+            try:
+                await backend.synthesize(req.text, req.voice, req.rate, str(tmp))
+                os.replace(tmp, path)
+                results[req.key] = TTSResult(req.key, str(path), cached=False)
+            except Exception as e:
+                results[req.key] = TTSResult(req.key, str(path), cached=False, error=f"{type(e).__name__}: {e}")
+            finally:
+                if tmp.exists():
+                    tmp.unlink()
+
+    async def _run() -> None:
+        sem = asyncio.Semaphore(max(1, int(max_concurrency)))
+        await asyncio.gather(*(_one(sem, req, path) for req, path in todo))
+
+    if todo:
+        asyncio.run(_run())
+    return {key: results[key] for key in keys}
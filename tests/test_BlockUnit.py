@@ -40,6 +40,9 @@ def _make_block(**overrides):
         conditions=None,
         results=[],
         meta={},
+        checkpoint=None,
+        jitter=None,
+        _resume_at=0,
         _on_start=[],
         _on_end=[],
     )
@@ -84,6 +87,31 @@ class TestRunTrialGuards(unittest.TestCase):
         self.assertIn("bad_trial_func", str(ctx.exception))
 
 
+@unittest.skipUnless(_HAS_DEPS, "requires numpy and psychopy")
+class TestConstrainedConditions(unittest.TestCase):
+    """generate_conditions() orders trials under sequence constraints."""
+
+    def test_generate_conditions_with_constraints(self):
+        block = _make_block(settings=_make_settings(conditions=["A", "B"]), n_trials=40)
+        block.generate_conditions(constraints={"no_repeat": True})
+        self.assertEqual(len(block.conditions), 40)
+        self.assertTrue(all(a != b for a, b in zip(block.conditions, block.conditions[1:])))
+        self.assertEqual(block.meta["sequence"]["method"], "constructive")
+
+        again = _make_block(settings=_make_settings(conditions=["A", "B"]), n_trials=40)
+        self.assertEqual(again.generate_conditions(constraints={"no_repeat": True}).conditions, block.conditions)
+
+        with self.assertRaises(ValueError):
+            block.generate_conditions(order="sequential", constraints={"no_repeat": True})
+
+    def test_balanced_transitions_keep_weighted_counts(self):
+        from collections import Counter
+
+        block = _make_block(settings=_make_settings(conditions=["A", "B", "C"]), n_trials=30)
+        block.generate_conditions(weights=[2, 1, 0], constraints={"transitions": "balanced"})
+        self.assertEqual(Counter(block.conditions), {"A": 20, "B": 10})
+
+
 @unittest.skipUnless(_HAS_DEPS, "requires numpy and psychopy")
 class TestLoggingBlockInfo(unittest.TestCase):
     """logging_block_info() should handle list-backed conditions."""
@@ -104,5 +132,191 @@ class TestLoggingBlockInfo(unittest.TestCase):
         )
 
 
+
+@unittest.skipUnless(_HAS_DEPS, "requires numpy and psychopy")
+class TestCheckpointResume(unittest.TestCase):
+    """Trials are checkpointed and a resumed block runs only what is left."""
+
+    def test_resume_runs_remaining_trials(self):
+        import tempfile
+        from pathlib import Path
+
+        from psyflow.utils.checkpoint import CheckpointWriter, load_checkpoint
+        from psyflow.utils.results import ResultStore
+        from psyflow.utils.trials import next_trial_id
+
+        def trial(win, kb, settings, cond):
+            return {"trial_id": next_trial_id(), "cond": cond}
+
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "ckpt.jsonl"
+            # A session that crashed after two of three trials.
+            with CheckpointWriter(path, background=False) as writer:
+                writer.block_start("test", block_idx=0, seed=42, conditions=["A", "B", "C"])
+                writer.trial("test", 0, {"trial_id": 10, "cond": "A"})
+                writer.trial("test", 1, {"trial_id": 11, "cond": "B"})
+
+            state = load_checkpoint(path)
+            block = _make_block(conditions=["X"], results=ResultStore()).resume_from(state)
+            self.assertEqual(block.conditions, ["A", "B", "C"])
+            self.assertEqual(len(block.results), 2)
+            block.run_trial(trial)
+            self.assertEqual([r["cond"] for r in block.results], ["A", "B", "C"])
+            self.assertEqual(block.results[2]["trial_id"], 12)
+
+    def test_resume_from_none_is_noop(self):
+        block = _make_block(conditions=["X"], results=[]).resume_from(None)
+        self.assertEqual(block.conditions, ["X"])
+        self.assertEqual(block._resume_at, 0)
+
+
+
+@unittest.skipUnless(_HAS_DEPS, "requires numpy and psychopy")
+class TestPrefetch(unittest.TestCase):
+    """Next-trial preparation runs inside the current trial's idle frames."""
+
+    def test_prefetch_runs_during_idle_work_of_previous_trial(self):
+        from psyflow.utils.idle import run_idle
+
+        events = []
+
+        def prefetch(win, kb, settings, cond):
+            events.append(("prefetch", cond))
+            yield
+            return cond.lower()
+
+        def trial(win, kb, settings, cond, prefetched=None):
+            events.append(("trial", cond, prefetched))
+            run_idle(1 / 60)  # an ITI frame
+            run_idle(1 / 60)
+            return {}
+
+        block = _make_block(conditions=["A", "B", "C"], results=[])
+        block.run_trial(trial, prefetch=prefetch)
+        self.assertEqual(events, [
+            ("prefetch", "A"),
+            ("trial", "A", "a"),
+            ("prefetch", "B"),
+            ("trial", "B", "b"),
+            ("prefetch", "C"),
+            ("trial", "C", "c"),
+        ])
+        self.assertEqual([r["condition"] for r in block.results], ["A", "B", "C"])
+
+    def test_prefetch_sees_its_own_trials_jitter(self):
+        from psyflow.utils.idle import run_idle
+        from psyflow.utils.jitter import planned_duration
+
+        def prefetch(win, kb, settings, cond):
+            yield
+            return planned_duration("iti")
+
+        def trial(win, kb, settings, cond, prefetched=None):
+            run_idle(1 / 60)
+            run_idle(1 / 60)
+            return {"planned": planned_duration("iti"), "prefetched": prefetched}
+
+        block = _make_block(conditions=["A", "B", "C"], results=[], win=SimpleNamespace())
+        block.plan_jitter({"iti": (1.0, 2.0)})
+        block.run_trial(trial, prefetch=prefetch)
+        expected = block.jitter.durations("iti").tolist()
+        self.assertEqual([r["prefetched"] for r in block.results], expected)
+        self.assertEqual([r["planned"] for r in block.results], expected)
+
+
+@unittest.skipUnless(_HAS_DEPS, "requires numpy and psychopy")
+class TestRngStreams(unittest.TestCase):
+    """Trials draw from per-block streams seeded by the block seed."""
+
+    def test_trial_draws_are_reproducible_per_block_seed(self):
+        from psyflow.sim import active_rng_streams
+
+        def trial(win, kb, settings, cond):
+            return {"x": float(active_rng_streams().generator(cond).random())}
+
+        def draws(seed):
+            block = _make_block(conditions=["A", "B"], results=[], seed=seed)
+            block.run_trial(trial)
+            return [r["x"] for r in block.results]
+
+        self.assertEqual(draws(5), draws(5))
+        self.assertNotEqual(draws(5), draws(6))
+
+    def test_plan_jitter_is_seeded_and_scoped_per_trial(self):
+        from psyflow.utils.jitter import planned_duration
+
+        def trial(win, kb, settings, cond):
+            return {"iti": planned_duration("iti")}
+
+        block = _make_block(conditions=["A", "B", "A", "B"], results=[], win=SimpleNamespace())
+        block.plan_jitter({"iti": (1.0, 2.0)})
+        block.run_trial(trial)
+        self.assertEqual([r["iti"] for r in block.results], block.jitter.durations("iti").tolist())
+        again = _make_block(conditions=["A", "B", "A", "B"], win=SimpleNamespace()).plan_jitter({"iti": (1.0, 2.0)})
+        self.assertEqual(again.jitter.to_dict(), block.jitter.to_dict())
+
+
+@unittest.skipUnless(_HAS_DEPS, "requires numpy and psychopy")
+class TestPlanResponses(unittest.TestCase):
+    """A batch responder plans the whole block in one act_batch call."""
+
+    def test_plan_responses_submits_remaining_trials(self):
+        from psyflow.sim import Action, Observation
+        from psyflow.sim.context import RuntimeContext, runtime_context
+
+        class Batch:
+            def act(self, obs):
+                return Action(key=None, rt_s=None)
+
+            def act_batch(self, observations):
+                self.seen = [o.condition_id for o in observations]
+                return [Action(key="space", rt_s=0.2) for _ in observations]
+
+        def observe(cond, i):
+            return Observation(trial_id=None, phase="target", valid_keys=["space"],
+                               deadline_s=1.0, condition_id=cond)
+
+        responder = Batch()
+        ctx = RuntimeContext(mode="sim", responder=responder)
+        block = _make_block(conditions=["A", "B", "C"], _resume_at=1)
+        with runtime_context(ctx):
+            block.plan_responses(observe)
+        self.assertEqual(responder.seen, ["B", "C"])
+        self.assertEqual(ctx.action_plan.pending, 2)
+
+    def test_unused_plan_is_dropped_at_block_end(self):
+        from psyflow.sim import Action, Observation
+        from psyflow.sim.context import RuntimeContext, runtime_context
+
+        class Batch:
+            def act(self, obs):
+                return Action(key=None, rt_s=None)
+
+            def act_batch(self, observations):
+                self.block_ids = {o.block_id for o in observations}
+                return [Action(key="space", rt_s=0.2) for _ in observations]
+
+        def observe(cond, i):
+            return Observation(trial_id=None, phase="target", valid_keys=["space"], deadline_s=1.0)
+
+        responder = Batch()
+        ctx = RuntimeContext(mode="sim", responder=responder)
+        block = _make_block(block_id="block_0", conditions=["A", "B"], results=[])
+        with runtime_context(ctx):
+            block.plan_responses(observe)
+            self.assertEqual(responder.block_ids, {"block_0"})
+            block.run_trial(lambda win, kb, settings, cond: {})
+        self.assertEqual((ctx.action_plan.pending, ctx.action_plan.n_discarded), (0, 2))
+
+    def test_plan_responses_is_noop_in_human_mode(self):
+        from psyflow.sim.context import RuntimeContext, runtime_context
+
+        ctx = RuntimeContext(mode="human")
+        block = _make_block(conditions=["A"])
+        with runtime_context(ctx):
+            block.plan_responses(lambda cond, i: self.fail("observe called"))
+        self.assertIsNone(ctx.action_plan)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,155 @@
+"""Tests for psyflow.StimBank."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+try:
+    from psychopy.visual import MovieStim
+    _HAS_PSYCHOPY = True
+except ImportError:
+    _HAS_PSYCHOPY = False
+
+if _HAS_PSYCHOPY:
+    from psyflow.StimBank import StimBank
+
+
+class _Visual:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.n_draws = 0
+
+    def draw(self, win=None):
+        self.n_draws += 1
+        if self.fail:
+            raise RuntimeError("shader failed")
+
+
+class _Sound:
+    def __init__(self, volume=0.8):
+        self.volume = volume
+        self.events = []
+
+    def setVolume(self, volume):
+        self.events.append(("volume", volume))
+        self.volume = volume
+
+    def play(self):
+        self.events.append(("play", self.volume))
+
+    def stop(self):
+        self.events.append(("stop", self.volume))
+
+
+class _Image:
+    """64x64 RGBA texture: 16 KiB by StimBank's estimate."""
+
+    def __init__(self):
+        self.image = np.zeros((64, 64))
+        self.released = False
+
+    def draw(self, win=None):
+        pass
+
+    def clearTextures(self):
+        self.released = True
+
+
+def _bank(stims):
+    bank = StimBank(MagicMock())
+    for name, stim in stims.items():
+        bank.define(name)(lambda win, stim=stim: stim)
+    return bank.preload_all()
+
+
+@unittest.skipUnless(_HAS_PSYCHOPY, "requires psychopy")
+class TestWarmUp(unittest.TestCase):
+    def test_report_and_progress_cover_every_target(self):
+        movie = MovieStim.__new__(MovieStim)
+        stims = {"fix": _Visual(), "bad": _Visual(fail=True), "beep": _Sound(), "clip": movie}
+        bank = _bank(stims)
+        progress = []
+        report = bank.warm_up(progress=lambda done, total, name: progress.append((done, total, name)))
+
+        self.assertEqual(set(report), {"fix", "bad", "beep"})
+        self.assertEqual(report["fix"]["kind"], "visual")
+        self.assertIsNone(report["fix"]["error"])
+        self.assertEqual(report["beep"]["kind"], "audio")
+        self.assertEqual(report["bad"]["error"], "RuntimeError: shader failed")
+        self.assertTrue(all(r["cost_s"] >= 0 for r in report.values()))
+        self.assertEqual(bank.warmup_report, report)
+        self.assertEqual(stims["fix"].n_draws, 1)
+        self.assertEqual(progress, [(i + 1, 4, name) for i, name in enumerate(["fix", "bad", "beep", "clip"])])
+        bank.win.clearBuffer.assert_called_once()
+
+    def test_sound_is_primed_muted_and_volume_restored(self):
+        beep = _Sound(volume=0.8)
+        _bank({"beep": beep}).warm_up()
+        self.assertEqual(beep.events, [("volume", 0.0), ("play", 0.0), ("stop", 0.0), ("volume", 0.8)])
+        self.assertEqual(beep.volume, 0.8)
+
+    def test_audio_false_skips_sounds(self):
+        beep = _Sound()
+        progress = []
+        report = _bank({"fix": _Visual(), "beep": beep}).warm_up(
+            audio=False, progress=lambda done, total, name: progress.append((done, total))
+        )
+        self.assertEqual(set(report), {"fix"})
+        self.assertEqual(beep.events, [])
+        self.assertEqual(progress[-1], (2, 2))
+
+
+@unittest.skipUnless(_HAS_PSYCHOPY, "requires psychopy")
+class TestMemoryBudget(unittest.TestCase):
+    def setUp(self):
+        self.built = []
+        self.bank = StimBank(MagicMock(), memory_budget=40 * 1024)
+        for name in ("fix", "a", "b"):
+            self.bank.define(name)(self._builder(name))
+
+    def _builder(self, name):
+        def build(win):
+            stim = _Image()
+            self.built.append((name, stim))
+            return stim
+        return build
+
+    def test_evicted_stimulus_is_released_when_rebuilt(self):
+        bank = self.bank.pin("fix")
+        fix = bank.get("fix")
+        a = bank.get("a")
+        b = bank.get("b")
+        # Over budget: "a" is evicted but still usable by the running trial.
+        self.assertNotIn("a", bank._instantiated)
+        self.assertFalse(a.released)
+        self.assertEqual(bank.memory_stats()["retired"], 1)
+
+        a2 = bank.get("a")
+        self.assertIsNot(a2, a)
+        self.assertTrue(a.released)
+        self.assertEqual([name for name, _ in self.built], ["fix", "a", "b", "a"])
+        # Rebuilding "a" pushed out "b", never the pinned "fix".
+        self.assertIs(bank.get("fix"), fix)
+        self.assertFalse(b.released)
+        self.assertEqual(bank.release_retired(), 1)
+        self.assertTrue(b.released)
+        self.assertFalse(fix.released)
+        self.assertEqual(bank.memory_stats()["retired"], 0)
+
+    def test_retired_stimuli_stay_bounded_for_one_shot_names(self):
+        bank = StimBank(MagicMock(), memory_budget=40 * 1024)
+        for i in range(200):
+            bank.define(f"img{i}")(lambda win: _Image())
+        with patch("psyflow.StimBank._release_stim") as release:
+            retired = []
+            for i in range(200):
+                bank.get(f"img{i}")
+                retired.append(bank.memory_stats()["retired"])
+        self.assertLessEqual(max(retired), 3)
+        self.assertLessEqual(bank.memory_stats()["retired_bytes"], 40 * 1024)
+        self.assertGreaterEqual(release.call_count, 200 - 2 - 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+
+
+def _obs(**kw):
+    from psyflow.sim import Observation
+
+    base = dict(trial_id=None, phase="target", valid_keys=["f", "j"], deadline_s=1.0, mode="sim")
+    base.update(kw)
+    return Observation(**base)
+
+
+class BatchResponder:
+    def __init__(self):
+        self.calls = 0
+
+    def act(self, obs):
+        raise AssertionError("act() should not be called for planned windows")
+
+    def act_batch(self, observations):
+        from psyflow.sim import Action
+
+        self.calls += 1
+        return [Action(key="f", rt_s=0.3 + 0.1 * i) for i, _ in enumerate(observations)]
+
+
+class TestActionPlan(unittest.TestCase):
+    def test_batch_responder_protocol(self):
+        from psyflow.sim import BatchResponderProtocol, ScriptedResponder
+
+        self.assertIsInstance(BatchResponder(), BatchResponderProtocol)
+        self.assertNotIsInstance(ScriptedResponder(), BatchResponderProtocol)
+
+    def test_take_in_order_per_phase(self):
+        from psyflow.sim import ActionPlan
+
+        plan = ActionPlan()
+        responder = BatchResponder()
+        n = plan.submit([_obs(condition_id="A"), _obs(condition_id="B")], responder)
+        self.assertEqual((n, responder.calls, plan.pending), (2, 1, 2))
+
+        self.assertEqual(plan.take(_obs(phase="cue")), (False, None))
+        found, action = plan.take(_obs(trial_id=1, condition_id="A"))
+        self.assertTrue(found)
+        self.assertAlmostEqual(action.rt_s, 0.3)
+        found, action = plan.take(_obs(trial_id=2, condition_id="B"))
+        self.assertAlmostEqual(action.rt_s, 0.4)
+        self.assertEqual((plan.pending, plan.n_used), (0, 2))
+
+    def test_mismatch_drops_remaining_plan_for_phase(self):
+        from psyflow.sim import ActionPlan
+
+        plan = ActionPlan()
+        plan.submit([_obs(condition_id="A"), _obs(condition_id="B")], BatchResponder())
+        self.assertEqual(plan.take(_obs(condition_id="B")), (False, None))
+        self.assertEqual((plan.pending, plan.n_discarded), (0, 2))
+
+    def test_discard_drops_only_that_blocks_plan(self):
+        from psyflow.sim import ActionPlan
+
+        plan = ActionPlan()
+        plan.submit(
+            [_obs(block_id="b0"), _obs(block_id="b1"), _obs(phase="cue", block_id="b0")],
+            BatchResponder(),
+        )
+        self.assertEqual(plan.discard("b0"), 2)
+        self.assertEqual((plan.pending, plan.n_discarded), (1, 2))
+        found, _ = plan.take(_obs(block_id="b1"))
+        self.assertTrue(found)
+
+    def test_length_mismatch_raises(self):
+        from psyflow.sim import ActionPlan
+
+        with self.assertRaises(ValueError):
+            ActionPlan().add([_obs(), _obs()], [None])
+
+    def test_handle_action_validates_planned_action(self):
+        from psyflow.sim import Action, ResponderAdapter
+
+        adapter = ResponderAdapter(policy="warn")
+        ok = adapter.handle_action(_obs(trial_id=1), Action(key="j", rt_s=0.4))
+        self.assertEqual(ok.validation.status, "ok")
+        self.assertEqual(ok.used_action.key, "j")
+
+        bad = adapter.handle_action(_obs(trial_id=2), Action(key="x", rt_s=0.4))
+        self.assertEqual(bad.validation.reason_code, "INVALID_KEY")
+        self.assertIsNone(bad.used_action.key)
+
+
+if __name__ == "__main__":
+    unittest.main()
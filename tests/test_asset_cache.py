@@ -0,0 +1,99 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from psyflow.utils.assets import AssetCache
+
+try:
+    import PIL  # noqa: F401
+    _HAS_PIL = True
+except ImportError:
+    _HAS_PIL = False
+
+
+class TestAssetCache(unittest.TestCase):
+    def setUp(self):
+        self._td = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._td.name)
+        self.asset = self.tmp / "beep.wav"
+        self.asset.write_bytes(b"RIFF-not-really-a-wav")
+
+    def tearDown(self):
+        self._td.cleanup()
+
+    def test_content_hash_is_indexed_and_detects_edits(self):
+        cache = AssetCache(self.tmp / "cache")
+        h1 = cache.content_hash(self.asset)
+        cache.save()
+        index = json.loads((self.tmp / "cache" / "index.json").read_text(encoding="utf-8"))
+        self.assertEqual(index[str(self.asset.resolve())]["hash"], h1)
+
+        reopened = AssetCache(self.tmp / "cache")
+        self.assertEqual(reopened.content_hash(self.asset), h1)
+
+        self.asset.write_bytes(b"RIFF-edited")
+        st = self.asset.stat()
+        os.utime(self.asset, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        self.assertNotEqual(reopened.content_hash(self.asset), h1)
+
+    def test_store_and_memory_mapped_load(self):
+        cache = AssetCache(self.tmp / "cache")
+        key = cache.entry_key("abc", "sound", {"dtype": "float32"})
+        self.assertNotEqual(key, cache.entry_key("abc", "sound", {"dtype": "int16"}))
+        self.assertIsNone(cache.load(key))
+
+        samples = np.linspace(-1, 1, 100, dtype=np.float32)
+        cache.store(key, samples, {"sampleRate": 44100})
+        array, meta = cache.load(key)
+        self.assertIsInstance(array, np.memmap)
+        np.testing.assert_array_equal(array, samples)
+        self.assertEqual(meta, {"sampleRate": 44100})
+        self.assertEqual(sorted(p.suffix for p in (self.tmp / "cache").iterdir()), [".json", ".npy"])
+
+    def test_torn_entry_is_a_miss(self):
+        cache = AssetCache(self.tmp / "cache")
+        key = cache.entry_key("abc", "image")
+        (self.tmp / "cache" / f"{key}.npy").write_bytes(b"\x93NUMPY")
+        (self.tmp / "cache" / f"{key}.json").write_text("{}", encoding="utf-8")
+        self.assertIsNone(cache.load(key))
+
+    def test_sound_hit_does_not_need_decoder(self):
+        cache = AssetCache(self.tmp / "cache")
+        key = cache.entry_key(cache.content_hash(self.asset), "sound", {"dtype": "float32"})
+        cache.store(key, np.zeros((10, 2), dtype=np.float32), {"sampleRate": 48000})
+
+        decoded = cache.sound(str(self.asset))
+        self.assertEqual(decoded["sampleRate"], 48000)
+        self.assertEqual(decoded["file"].shape, (10, 2))
+        self.assertIsNone(cache.sound(str(self.asset), sample_rate=44100))
+        self.assertEqual(cache.hits, 2)
+
+        # Edited source -> new key -> stale entry is not used.
+        self.asset.write_bytes(b"RIFF-a-different-sound")
+        st = self.asset.stat()
+        os.utime(self.asset, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        try:
+            import soundfile  # noqa: F401
+        except ImportError:
+            self.assertIsNone(cache.sound(str(self.asset)))
+            self.assertEqual(cache.misses, 1)
+
+    @unittest.skipUnless(_HAS_PIL, "requires Pillow")
+    def test_image_round_trip(self):
+        from PIL import Image
+
+        path = self.tmp / "img.png"
+        Image.fromarray(np.arange(48, dtype=np.uint8).reshape(4, 4, 3)).save(path)
+        cache = AssetCache(self.tmp / "cache")
+        first = cache.image(str(path))["image"]
+        second = cache.image(str(path))["image"]
+        self.assertEqual((cache.misses, cache.hits), (1, 1))
+        np.testing.assert_array_equal(np.asarray(first), np.asarray(second))
+
+
+if __name__ == "__main__":
+    unittest.main()
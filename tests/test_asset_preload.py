@@ -0,0 +1,74 @@
+import threading
+import time
+import unittest
+
+from psyflow.utils.assets import decode_image, decode_sound, preload_assets
+
+
+class TestPreloadAssets(unittest.TestCase):
+    def test_serial_builds_in_order_with_progress(self):
+        seen = []
+        builders = {n: (lambda n=n, **kw: (n, kw)) for n in ("a", "b", "c")}
+        built, timings = preload_assets(builders, progress=lambda done, total, name: seen.append((done, total, name)))
+        self.assertEqual(list(built), ["a", "b", "c"])
+        self.assertEqual(built["b"], ("b", {}))
+        self.assertEqual(seen, [(1, 3, "a"), (2, 3, "b"), (3, 3, "c")])
+        self.assertIsNone(timings["a"]["decode_s"])
+        self.assertFalse(timings["a"]["decoded"])
+
+    def test_decode_runs_off_thread_and_build_on_caller(self):
+        main = threading.get_ident()
+        decode_threads = []
+        build_threads = []
+
+        def decode(n):
+            decode_threads.append(threading.get_ident())
+            time.sleep(0.01)
+            return {"data": n * 2}
+
+        def build(n, **kw):
+            build_threads.append(threading.get_ident())
+            return kw
+
+        builders = {n: (lambda n=n, **kw: build(n, **kw)) for n in ("img1", "img2", "text")}
+        decoders = {"img1": lambda: decode("x"), "img2": lambda: decode("y")}
+        built, timings = preload_assets(builders, decoders, max_workers=2)
+
+        self.assertEqual(list(built), ["img1", "img2", "text"])
+        self.assertEqual(built["img1"], {"data": "xx"})
+        self.assertEqual(built["text"], {})
+        self.assertTrue(all(t != main for t in decode_threads))
+        self.assertTrue(all(t == main for t in build_threads))
+        self.assertTrue(timings["img2"]["decoded"])
+        self.assertGreater(timings["img2"]["decode_s"], 0.0)
+
+    def test_failed_decode_or_build_falls_back(self):
+        calls = []
+
+        def build(**kw):
+            calls.append(kw)
+            if kw:
+                raise ValueError("backend rejected array")
+            return "from-file"
+
+        def bad_decode():
+            raise OSError("truncated")
+
+        built, timings = preload_assets({"a": build, "b": build}, {"a": lambda: {"file": [0.0]}, "b": bad_decode})
+        self.assertEqual(built, {"a": "from-file", "b": "from-file"})
+        self.assertFalse(timings["a"]["decoded"])
+        self.assertEqual(calls.count({}), 2)
+
+    def test_decoders_without_optional_packages_return_none(self):
+        try:
+            import PIL  # noqa: F401
+        except ImportError:
+            self.assertIsNone(decode_image("missing.png"))
+        try:
+            import soundfile  # noqa: F401
+        except ImportError:
+            self.assertIsNone(decode_sound("missing.wav"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import threading
+import time
+import unittest
+
+from psyflow.io.drivers.serial import AsyncSerialDriver
+from psyflow.io.events import TriggerEvent
+
+
+class FakeSerial:
+    def __init__(self, delay_s=0.0):
+        self.is_open = True
+        self.delay_s = delay_s
+        self.writes = []
+        self.writer_threads = set()
+
+    def write(self, payload):
+        if self.delay_s:
+            time.sleep(self.delay_s)
+        self.writes.append((time.perf_counter(), bytes(payload)))
+        self.writer_threads.add(threading.get_ident())
+
+    def close(self):
+        self.is_open = False
+
+
+class TestAsyncSerialDriver(unittest.TestCase):
+    def test_send_returns_before_write_and_writes_off_thread(self):
+        ser = FakeSerial(delay_s=0.05)
+        drv = AsyncSerialDriver(ser)
+        drv.open()
+        t0 = time.perf_counter()
+        drv.send(TriggerEvent(code=7))
+        self.assertLess(time.perf_counter() - t0, 0.04)
+        self.assertTrue(drv.flush(timeout=2))
+        self.assertEqual([p for _, p in ser.writes], [b"\x07"])
+        self.assertNotIn(threading.get_ident(), ser.writer_threads)
+        drv.close()
+        self.assertFalse(ser.is_open)
+
+    def test_pulse_reset_is_written_after_pulse_width(self):
+        ser = FakeSerial()
+        drv = AsyncSerialDriver(ser)
+        drv.open()
+        drv.send_pulse(TriggerEvent(code=5, pulse_width_ms=30, reset_code=0))
+        drv.send(TriggerEvent(code=9))
+        drv.flush(timeout=2)
+        payloads = [p for _, p in ser.writes]
+        self.assertEqual(payloads, [b"\x05", b"\x09", b"\x00"])
+        self.assertGreaterEqual(ser.writes[2][0] - ser.writes[0][0], 0.025)
+        drv.close()
+
+    def test_invalid_code_raises_on_caller_thread(self):
+        drv = AsyncSerialDriver(FakeSerial())
+        with self.assertRaises(ValueError):
+            drv.send(TriggerEvent(code=300))
+        drv.close()
+
+    def test_latency_stats_and_write_errors(self):
+        class Broken(FakeSerial):
+            def write(self, payload):
+                raise OSError("unplugged")
+
+        drv = AsyncSerialDriver(FakeSerial())
+        for code in (1, 2, 3):
+            drv.send(TriggerEvent(name="x", code=code))
+        drv.flush(timeout=2)
+        stats = drv.latency_stats()
+        self.assertEqual(stats["n"], 3)
+        self.assertGreaterEqual(stats["max"], stats["mean"])
+        self.assertEqual([c for _, c, _ in drv.latencies], [1, 2, 3])
+        drv.close()
+
+        broken = AsyncSerialDriver(Broken())
+        broken.send(TriggerEvent(code=1))
+        broken.flush(timeout=2)
+        self.assertEqual(broken.n_errors, 1)
+        self.assertIn("unplugged", broken.last_error)
+        broken.close()
+
+    def test_close_waits_for_pending_reset(self):
+        ser = FakeSerial()
+        drv = AsyncSerialDriver(ser, default_reset_code=0)
+        drv.send_pulse(TriggerEvent(code=4, pulse_width_ms=10))
+        drv.close()
+        self.assertEqual([p for _, p in ser.writes], [b"\x04", b"\x00"])
+
+
+if __name__ == "__main__":
+    unittest.main()
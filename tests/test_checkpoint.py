@@ -0,0 +1,88 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from psyflow.utils.checkpoint import CheckpointWriter, load_checkpoint
+
+
+class TestCheckpoint(unittest.TestCase):
+    def test_round_trip_and_resume_state(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "sub.checkpoint.jsonl"
+            with CheckpointWriter(path) as writer:
+                writer.block_start("block_0", block_idx=0, seed=np.int64(7), conditions=("go", "stop"))
+                writer.trial("block_0", 0, {"trial_id": 1, "rt": np.float64(0.4), "keys": np.array([1, 2])})
+                writer.trial("block_0", 1, {"trial_id": 2, "rt": None})
+                writer.block_end("block_0", n_trials=2, duration=1.5)
+                writer.block_start("block_1", block_idx=1, seed=8, conditions=["go", "go", "stop"])
+                writer.trial("block_1", 0, {"trial_id": 3, "rt": 0.5})
+                writer.flush()
+                self.assertEqual(writer.n_written, 6)
+
+            state = load_checkpoint(path)
+            self.assertTrue(state.is_complete("block_0"))
+            self.assertFalse(state.is_complete("block_1"))
+            self.assertEqual(state.last_trial_id, 3)
+            b0 = state.blocks["block_0"]
+            self.assertEqual((b0.block_idx, b0.seed, b0.conditions), (0, 7, ["go", "stop"]))
+            self.assertEqual(b0.results[0], {"trial_id": 1, "rt": 0.4, "keys": [1, 2]})
+            self.assertEqual(state.blocks["block_1"].remaining_conditions, ["go", "stop"])
+            self.assertEqual([r["trial_id"] for r in state.all_results()], [1, 2, 3])
+
+    def test_torn_last_line_is_skipped(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "ckpt.jsonl"
+            with CheckpointWriter(path, background=False) as writer:
+                writer.block_start("b", block_idx=0, conditions=["A", "B"])
+                writer.trial("b", 0, {"trial_id": 1})
+            with path.open("a", encoding="utf-8") as f:
+                f.write('{"type": "trial", "block_id": "b", "res')
+
+            state = load_checkpoint(path)
+            self.assertEqual(state.n_corrupt, 1)
+            self.assertEqual(state.blocks["b"].remaining_conditions, ["B"])
+
+    def test_reopening_after_torn_line_starts_new_line(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "ckpt.jsonl"
+            with CheckpointWriter(path, background=False) as writer:
+                writer.block_start("b", block_idx=0, conditions=["A", "B"])
+                writer.trial("b", 0, {"trial_id": 1})
+            with path.open("a", encoding="utf-8") as f:
+                f.write('{"type": "trial", "block_id": "b", "res')
+            with CheckpointWriter(path, background=False) as writer:
+                writer.trial("b", 1, {"trial_id": 2})
+
+            state = load_checkpoint(path)
+            self.assertEqual(state.n_corrupt, 1)
+            self.assertEqual([r["trial_id"] for r in state.blocks["b"].results], [1, 2])
+
+    def test_resumed_block_start_keeps_saved_trials(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "ckpt.jsonl"
+            with CheckpointWriter(path, background=False) as writer:
+                writer.block_start("b", block_idx=0, conditions=["A", "B"])
+                writer.trial("b", 0, {"trial_id": 1})
+            # Second process appends to the same file after resuming.
+            with CheckpointWriter(path, background=False) as writer:
+                writer.block_start("b", block_idx=0, conditions=["A", "B"])
+                writer.trial("b", 1, {"trial_id": 2})
+                writer.block_end("b", n_trials=2)
+
+            lines = path.read_text(encoding="utf-8").splitlines()
+            self.assertEqual([json.loads(l)["type"] for l in lines].count("block_start"), 2)
+            state = load_checkpoint(path)
+            self.assertEqual([r["trial_id"] for r in state.blocks["b"].results], [1, 2])
+            self.assertTrue(state.is_complete("b"))
+
+    def test_missing_file_is_empty_state(self):
+        state = load_checkpoint(Path(tempfile.gettempdir()) / "does-not-exist.jsonl")
+        self.assertEqual(state.blocks, {})
+        self.assertIsNone(state.last_trial_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+"""show(composite=True) caches one pre-rendered texture per static display."""
+
+import unittest
+from unittest.mock import patch
+
+try:
+    from psychopy import visual
+    _HAS_PSYCHOPY = True
+except ImportError:
+    _HAS_PSYCHOPY = False
+
+if _HAS_PSYCHOPY:
+    from psyflow.StimUnit import StimUnit
+    from psyflow.sim.headless import HeadlessKeyboard, HeadlessWindow, VirtualClock
+
+    class _Stim(visual.BaseVisualStim):
+        def __init__(self, text, pos=(0, 0), color="white"):
+            self.text = text
+            self.pos = pos
+            self.color = color
+            self.n_draws = 0
+
+        def draw(self, win=None):
+            self.n_draws += 1
+
+    class _Window(HeadlessWindow):
+        def __init__(self, clock):
+            super().__init__(clock)
+            self.n_clears = 0
+
+        def clearBuffer(self):
+            self.n_clears += 1
+
+
+class _Buffer:
+    built = []
+
+    def __init__(self, win, stim=None):
+        self.stims = list(stim)
+        self.n_draws = 0
+        _Buffer.built.append(self)
+
+    def draw(self, win=None):
+        self.n_draws += 1
+
+
+class _BrokenBuffer:
+    def __init__(self, win, stim=None):
+        raise RuntimeError("no framebuffer")
+
+
+@unittest.skipUnless(_HAS_PSYCHOPY, "requires psychopy")
+class TestComposite(unittest.TestCase):
+    def setUp(self):
+        _Buffer.built = []
+        self.win = _Window(VirtualClock(frame_period=0.01))
+        self.kb = HeadlessKeyboard(self.win.clock)
+
+    def _show(self, stims):
+        unit = StimUnit("display", self.win, self.kb)
+        for stim in stims:
+            unit.add_stim(stim)
+        unit.show(duration=0.05, composite=True)
+        return unit
+
+    @patch("psyflow.StimUnit.visual.BufferImageStim", _Buffer)
+    def test_composite_is_drawn_and_reused(self):
+        stims = [_Stim("a"), _Stim("b")]
+        unit = self._show(stims)
+        self.assertTrue(unit.state["display_composite"])
+        self.assertEqual(len(_Buffer.built), 1)
+        self.assertEqual(_Buffer.built[0].stims, stims)
+        self.assertEqual(_Buffer.built[0].n_draws, 5)
+        self.assertEqual([s.n_draws for s in stims], [0, 0])
+        self.assertEqual(self.win.n_clears, 1)
+
+        self._show(stims)
+        self.assertEqual(len(_Buffer.built), 1)
+        self.assertEqual(self.win.n_clears, 1)
+
+    @patch("psyflow.StimUnit.visual.BufferImageStim", _Buffer)
+    def test_changed_attributes_rebuild_composite(self):
+        stims = [_Stim("a"), _Stim("b")]
+        self._show(stims)
+        stims[0].text = "c"
+        self._show(stims)
+        stims[1].pos = (10, 0)
+        self._show(stims)
+        stims[1].color = "red"
+        self._show(stims)
+        self.assertEqual(len(_Buffer.built), 4)
+        self._show(stims)
+        self.assertEqual(len(_Buffer.built), 4)
+
+    @patch("psyflow.StimUnit.visual.BufferImageStim", _BrokenBuffer)
+    def test_falls_back_to_drawing_each_stimulus(self):
+        stims = [_Stim("a"), _Stim("b")]
+        with patch("psyflow.StimUnit.logging.warning") as warn:
+            unit = self._show(stims)
+        self.assertFalse(unit.state["display_composite"])
+        self.assertEqual([s.n_draws for s in stims], [5, 5])
+        self.assertEqual(self.win.n_clears, 0)
+        warn.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
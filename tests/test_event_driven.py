@@ -0,0 +1,104 @@
+"""Event-driven response windows must match the frame loop."""
+
+import unittest
+
+try:
+    from psychopy import visual
+    _HAS_PSYCHOPY = True
+except ImportError:
+    _HAS_PSYCHOPY = False
+
+if _HAS_PSYCHOPY:
+    from psyflow.StimUnit import StimUnit
+    from psyflow.sim.context import RuntimeConfig, RuntimeContext, runtime_context
+    from psyflow.sim.contracts import Action
+    from psyflow.sim.headless import HeadlessKeyboard, HeadlessWindow, VirtualClock
+    from psyflow import MockDriver, TriggerRuntime
+
+    class _Stim(visual.BaseVisualStim):
+        def __init__(self):
+            pass
+
+        def draw(self, win=None):
+            pass
+
+
+class _KeyResponder:
+    def __init__(self, key, rt_s):
+        self.key = key
+        self.rt_s = rt_s
+
+    def act(self, obs):
+        return Action(key=self.key, rt_s=self.rt_s)
+
+
+@unittest.skipUnless(_HAS_PSYCHOPY, "requires psychopy")
+class TestEventDriven(unittest.TestCase):
+    def _capture(self, responder, *, event_driven, terminate=True, window=None, events=None):
+        clock = VirtualClock(frame_period=0.01, wall_anchor=1000.0)
+        ctx = RuntimeContext(
+            mode="sim",
+            responder=responder,
+            clock=clock,
+            config=RuntimeConfig(event_driven=event_driven),
+        )
+        with runtime_context(ctx):
+            win = HeadlessWindow(clock) if window is None else window(clock)
+            runtime = None
+            if events is not None:
+                runtime = TriggerRuntime(MockDriver(print_codes=False), event_logger=events.append)
+            unit = StimUnit("target", win, HeadlessKeyboard(clock), runtime=runtime).add_stim(_Stim())
+            unit.set_state(trial_id=1)
+            unit.capture_response(
+                keys=["f", "j"],
+                duration=0.1,
+                correct_keys=["f"],
+                response_trigger=5,
+                timeout_trigger=9,
+                terminate_on_response=terminate,
+            )
+        return unit.state, clock.n_frames
+
+    def _assert_same(self, responder, **kwargs):
+        loop_state, loop_frames = self._capture(responder, event_driven=False, **kwargs)
+        fast_state, fast_frames = self._capture(responder, event_driven=True, **kwargs)
+        self.assertEqual(sorted(fast_state), sorted(loop_state))
+        for key, value in loop_state.items():
+            if isinstance(value, float):
+                self.assertAlmostEqual(fast_state[key], value, msg=key)
+            else:
+                self.assertEqual(fast_state[key], value, msg=key)
+        self.assertEqual(fast_frames, loop_frames)
+        return loop_state
+
+    def test_hit_matches_frame_loop(self):
+        state = self._assert_same(_KeyResponder("f", 0.025))
+        self.assertTrue(state["target_hit"])
+
+    def test_hit_without_termination_matches_frame_loop(self):
+        self._assert_same(_KeyResponder("f", 0.025), terminate=False)
+
+    def test_timeout_matches_frame_loop(self):
+        state = self._assert_same(_KeyResponder(None, None))
+        self.assertIsNone(state.get("target_response"))
+
+    def test_non_terminating_response_trigger_matches_frame_loop(self):
+        def sent(event_driven):
+            events = []
+            self._capture(_KeyResponder("f", 0.025), event_driven=event_driven, terminate=False, events=events)
+            return [(e["code"], e["t_sent_ns"]) for e in events if e["type"] == "trigger_executed"]
+
+        loop, fast = sent(False), sent(True)
+        self.assertIn((5, 40_000_000), loop)  # onset flip + 3 flips
+        self.assertEqual(fast, loop)
+
+    def test_window_without_frame_skipping_uses_frame_loop(self):
+        class _RealishWindow(HeadlessWindow):
+            advance_frames = None
+
+        _, frames = self._capture(_KeyResponder(None, None), event_driven=True, window=_RealishWindow)
+        self.assertEqual(frames, 10)  # onset flip + 9 loop flips, none skipped
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from psyflow.io.sink import JsonlEventSink
+from psyflow.sim.headless import VirtualClock
+
+
+def _read(path: Path) -> list[dict]:
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+
+class TestJsonlEventSink(unittest.TestCase):
+    def test_inline_sink_is_readable_after_each_call(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "sub" / "events.jsonl"
+            sink = JsonlEventSink(path, background=False)
+            sink({"type": "a"})
+            self.assertEqual(_read(path), [{"type": "a"}])
+            sink({"type": "b"})
+            self.assertEqual([r["type"] for r in _read(path)], ["a", "b"])
+            sink.close()
+
+    def test_background_sink_writes_in_order_on_flush_and_close(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "events.jsonl"
+            with JsonlEventSink(path, background=True, flush_policy="close") as sink:
+                for i in range(500):
+                    sink({"i": i})
+                sink.flush()
+                self.assertEqual([r["i"] for r in _read(path)], list(range(500)))
+                sink({"i": 500})
+            self.assertEqual(len(_read(path)), 501)
+            self.assertEqual(sink.n_written, 501)
+
+    def test_block_end_only_flushes_under_block_policy(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "events.jsonl"
+            sink = JsonlEventSink(path, background=True, flush_policy="block")
+            sink({"type": "trial"})
+            sink.block_end()
+            self.assertEqual(len(_read(path)), 1)
+            sink.close()
+
+    def test_transform_receives_enqueue_time_and_caller_copy(self):
+        seen = []
+
+        def transform(rec, t_ns, clock):
+            seen.append(t_ns)
+            return {**rec, "t": clock.to_wall(t_ns)}
+
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "events.jsonl"
+            ev = {"type": "x"}
+            clock = VirtualClock(0.01, wall_anchor=100.0)
+            clock.advance_frames(5)
+            with JsonlEventSink(path, transform=transform, clock=clock) as sink:
+                sink(ev)
+                ev["type"] = "mutated"
+                clock.advance_frames(5)
+            rows = _read(path)
+        self.assertEqual(rows[0]["type"], "x")
+        self.assertEqual(seen, [50_000_000])
+        self.assertAlmostEqual(rows[0]["t"], 100.05)
+
+    def test_unserializable_event_is_dropped_not_raised(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "events.jsonl"
+            with JsonlEventSink(path, background=False) as sink:
+                sink({"bad": object()})
+                sink({"ok": 1})
+            self.assertEqual(_read(path), [{"ok": 1}])
+            self.assertEqual(sink.n_dropped, 1)
+
+    def test_idle_sink_creates_no_file_and_drops_after_close(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "events.jsonl"
+            sink = JsonlEventSink(path)
+            sink.close()
+            self.assertFalse(path.exists())
+            sink({"late": True})
+            self.assertEqual(sink.n_dropped, 1)
+
+    def test_records_racing_close_are_written_or_counted(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "events.jsonl"
+            sink = JsonlEventSink(path, background=True, clock=VirtualClock())
+            sink({"i": 0})
+            join = sink._thread.join
+
+            def racing_join():
+                # Another thread: one record already past the closed check, one after it.
+                sink._queue.put(({"i": 1}, 0))
+                sink({"i": 2})
+                join()
+
+            sink._thread.join = racing_join
+            sink.close()
+            self.assertEqual([r["i"] for r in _read(path)], [0, 1])
+            self.assertEqual((sink.n_written, sink.n_dropped), (2, 1))
+
+    def test_rejects_unknown_flush_policy(self):
+        with tempfile.TemporaryDirectory() as td:
+            with self.assertRaises(ValueError):
+                JsonlEventSink(Path(td) / "x.jsonl", flush_policy="sometimes")
+
+
+class TestRuntimeContextSinks(unittest.TestCase):
+    def test_runtime_context_closes_buffered_loggers(self):
+        from psyflow.sim import context_from_config, log_event, runtime_context
+
+        cfg = {"qa": {"log_flush": "close"}, "sim": {"responder": {"type": "null"}}}
+        with tempfile.TemporaryDirectory() as td:
+            ctx = context_from_config(task_dir=td, config=cfg, mode="qa")
+            self.assertEqual(ctx.config.log_flush, "close")
+            with runtime_context(ctx):
+                log_event({"type": "probe"})
+            rows = _read(Path(td) / "outputs" / "qa" / "qa_events.jsonl")
+        self.assertEqual(rows[0]["type"], "probe")
+        self.assertIn("t_utc", rows[0])
+
+    def test_invalid_log_flush_is_rejected(self):
+        from psyflow.sim import context_from_config
+
+        with tempfile.TemporaryDirectory() as td:
+            with self.assertRaises(ValueError):
+                context_from_config(task_dir=td, config={"sim": {"log_flush": "never"}}, mode="sim")
+
+
+if __name__ == "__main__":
+    unittest.main()
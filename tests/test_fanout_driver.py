@@ -0,0 +1,66 @@
+import threading
+import time
+import unittest
+
+from psyflow.io.drivers.fanout import FanoutDriver
+from psyflow.io.drivers.mock import MockDriver
+from psyflow.io.events import TriggerEvent
+
+
+class SlowDriver:
+    def __init__(self, name, delay_s):
+        self.name = name
+        self.delay_s = delay_s
+        self.sent = []
+        self.threads = set()
+
+    def send(self, event, *, wait=True):
+        time.sleep(self.delay_s)
+        self.sent.append(event.code)
+        self.threads.add(threading.get_ident())
+
+
+class BrokenDriver:
+    name = "broken"
+
+    def send(self, event, *, wait=True):
+        raise OSError("device gone")
+
+
+class TestFanoutDriver(unittest.TestCase):
+    def test_sequential_counts_errors_and_keeps_delivering(self):
+        mock = MockDriver(print_codes=False)
+        fan = FanoutDriver([BrokenDriver(), mock])
+        fan.send(TriggerEvent(code=1))
+        fan.send(TriggerEvent(code=2))
+        self.assertEqual([r.event.code for r in mock.records], [1, 2])
+        stats = fan.stats()
+        self.assertEqual(stats["errors"], {"broken": 2, "mock": 0})
+        self.assertIn("device gone", stats["last_errors"]["broken"])
+        self.assertEqual(stats["skew"]["n"], 2)
+
+    def test_parallel_dispatch_does_not_serialize_slow_drivers(self):
+        a = SlowDriver("a", 0.05)
+        b = SlowDriver("b", 0.05)
+        fan = FanoutDriver([a, b], parallel=True)
+        fan.open()
+        t0 = time.perf_counter()
+        fan.send(TriggerEvent(code=3))
+        self.assertLess(time.perf_counter() - t0, 0.04)
+        self.assertTrue(fan.flush(timeout=2))
+        self.assertEqual((a.sent, b.sent), ([3], [3]))
+        self.assertNotEqual(a.threads, b.threads)
+        stats = fan.stats()
+        self.assertEqual(stats["skew"]["n"], 1)
+        # Both start together instead of b waiting for a's 50 ms write.
+        self.assertLess(stats["skew"]["max"], 0.04)
+        self.assertEqual(stats["latency"]["a"]["n"], 1)
+        fan.close()
+
+    def test_duplicate_driver_names_are_disambiguated(self):
+        fan = FanoutDriver([MockDriver(print_codes=False), MockDriver(print_codes=False)])
+        self.assertEqual(fan.driver_names, ["mock", "mock#1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from psyflow.utils.frames import FrameTimingRecorder, summarize_flips
+
+
+class TestFrameTimingRecorder(unittest.TestCase):
+    def test_clean_stage_has_no_drops(self):
+        rec = FrameTimingRecorder(capacity=16)
+        rec.begin("fixation", 0.01)
+        for i in range(10):
+            rec.record(i * 0.01)
+        summary = rec.end()
+        self.assertEqual(summary["n_flips"], 10)
+        self.assertEqual(summary["n_dropped"], 0)
+        self.assertAlmostEqual(summary["max_ifi"], 0.01)
+        self.assertAlmostEqual(summary["ifi_sd"], 0.0)
+
+    def test_long_intervals_count_missed_refreshes(self):
+        t = np.array([0.0, 0.01, 0.03, 0.04, 0.08])
+        summary = summarize_flips(t, 0.01)
+        # 0.02 -> 1 missed, 0.04 -> 3 missed
+        self.assertEqual(summary["n_dropped"], 4)
+        self.assertAlmostEqual(summary["max_ifi"], 0.04)
+
+    def test_single_flip_stage(self):
+        rec = FrameTimingRecorder()
+        rec.begin("blank", 1 / 60)
+        rec.record(1.0)
+        self.assertEqual(rec.end(), {"n_flips": 1, "n_dropped": 0, "max_ifi": None, "ifi_sd": None})
+
+    def test_buffer_grows_and_export_keeps_stage_index(self):
+        rec = FrameTimingRecorder(capacity=16)
+        rec.begin("a", 0.01)
+        for i in range(20):
+            rec.record(i * 0.01)
+        rec.end()
+        rec.begin("b", 0.02)
+        for i in range(5):
+            rec.record(1.0 + i * 0.02)
+        rec.end()
+        self.assertEqual(len(rec), 25)
+        np.testing.assert_allclose(rec.stage_times(1), 1.0 + np.arange(5) * 0.02)
+
+        with tempfile.TemporaryDirectory() as td:
+            path = rec.export(Path(td) / "frames.npz")
+            with np.load(path) as data:
+                self.assertEqual(data["t_flip"].shape, (25,))
+                self.assertEqual(list(data["labels"]), ["a", "b"])
+                self.assertEqual(int((data["stage"] == 1).sum()), 5)
+                np.testing.assert_allclose(data["frame_time"], [0.01, 0.02])
+
+    def test_record_outside_stage_is_ignored(self):
+        rec = FrameTimingRecorder()
+        rec.record(0.0)
+        self.assertEqual(len(rec), 0)
+        self.assertEqual(rec.end(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+
+from psyflow.utils.idle import IdleScheduler, active_idle_scheduler, idle_scheduler, run_idle
+
+
+class TestIdleScheduler(unittest.TestCase):
+    def test_generator_task_advances_one_slice_per_run(self):
+        seen = []
+
+        def work(n):
+            for i in range(n):
+                seen.append(i)
+                yield
+            return "done"
+
+        sched = IdleScheduler(budget_s=1e-9)
+        task = sched.submit(work, 3)
+        sched.run()
+        self.assertEqual(seen, [0])
+        sched.run()
+        self.assertEqual(seen, [0, 1])
+        self.assertFalse(task.done)
+        self.assertEqual(task.result(), "done")
+        self.assertEqual(seen, [0, 1, 2])
+        sched.run()
+        self.assertEqual(sched.pending, 0)
+
+    def test_plain_callable_and_fifo_order(self):
+        sched = IdleScheduler(budget_s=10.0)
+        a = sched.submit(lambda: "a")
+        b = sched.submit(dict, x=1)
+        self.assertEqual(sched.run(), 2)
+        self.assertEqual((a.result(), b.result()), ("a", {"x": 1}))
+
+    def test_errors_are_raised_by_result(self):
+        def boom():
+            raise ValueError("bad")
+
+        sched = IdleScheduler()
+        task = sched.submit(boom)
+        sched.drain()
+        self.assertTrue(task.done)
+        with self.assertRaises(ValueError):
+            task.result()
+
+    def test_run_idle_uses_active_scheduler(self):
+        self.assertEqual(run_idle(1 / 60), 0)
+        sched = IdleScheduler(budget_fraction=0.25)
+        task = sched.submit(lambda: 1)
+        with idle_scheduler(sched):
+            self.assertIs(active_idle_scheduler(), sched)
+            self.assertEqual(run_idle(1 / 60), 1)
+        self.assertIsNone(active_idle_scheduler())
+        self.assertTrue(task.done)
+
+    def test_tasks_run_in_their_submission_context(self):
+        import contextvars
+
+        var = contextvars.ContextVar("var", default="outer")
+        seen = []
+
+        def task():
+            seen.append(var.get())
+            yield
+            seen.append(var.get())
+
+        sched = IdleScheduler()
+        token = var.set("submitted")
+        handle = sched.submit(task)
+        var.reset(token)
+        sched.drain()
+        handle.result()
+        self.assertEqual(seen, ["submitted", "submitted"])
+        self.assertEqual(var.get(), "outer")
+
+    def test_rejects_bad_budgets(self):
+        with self.assertRaises(ValueError):
+            IdleScheduler(budget_s=0)
+        with self.assertRaises(ValueError):
+            IdleScheduler(budget_fraction=1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+
+import numpy as np
+
+
+class TestPlanJitter(unittest.TestCase):
+    def test_same_seed_same_schedule(self):
+        from psyflow.utils.jitter import plan_jitter
+
+        specs = {"iti": (1.0, 3.0), "cue": {"dist": "exponential", "low": 0.5, "mean": 1.0, "high": 4.0}}
+        a = plan_jitter(specs, 20, rng=3).to_dict()
+        self.assertEqual(a, plan_jitter(specs, 20, rng=3).to_dict())
+        self.assertNotEqual(a, plan_jitter(specs, 20, rng=4).to_dict())
+
+    def test_distributions_respect_bounds(self):
+        from psyflow.utils.jitter import plan_jitter
+
+        schedule = plan_jitter(
+            {
+                "u": (1.0, 2.0),
+                "e": {"dist": "exponential", "low": 2.0, "mean": 1.5, "high": 8.0},
+                "c": {"dist": "choice", "values": [0.5, 1.0]},
+                "f": 0.75,
+            },
+            200,
+            rng=1,
+        )
+        self.assertTrue(np.all((schedule.durations("u") >= 1.0) & (schedule.durations("u") <= 2.0)))
+        self.assertTrue(np.all((schedule.durations("e") >= 2.0) & (schedule.durations("e") <= 8.0)))
+        self.assertEqual(set(schedule.durations("c").tolist()), {0.5, 1.0})
+        self.assertTrue(np.all(schedule.durations("f") == 0.75))
+
+    def test_balanced_choice_splits_evenly_within_conditions(self):
+        from psyflow.utils.jitter import plan_jitter
+
+        conditions = ["A", "B"] * 6
+        d = plan_jitter({"iti": {"dist": "choice", "values": [1.0, 2.0, 3.0]}}, conditions=conditions, rng=0).durations("iti")
+        for cond in ("A", "B"):
+            values = sorted(d[i] for i, c in enumerate(conditions) if c == cond)
+            self.assertEqual(values, [1.0, 1.0, 2.0, 2.0, 3.0, 3.0])
+
+    def test_values_are_whole_frames(self):
+        from psyflow.utils.jitter import plan_jitter
+
+        schedule = plan_jitter({"iti": (0.001, 0.5)}, 50, frame_time=1 / 60, rng=2)
+        frames = schedule.frames("iti")
+        self.assertTrue(np.all(frames >= 1))
+        np.testing.assert_allclose(schedule.durations("iti"), frames / 60)
+
+    def test_whole_frames_stay_within_bounds(self):
+        from psyflow.utils.jitter import plan_jitter
+
+        schedule = plan_jitter(
+            {
+                "iti": (0.105, 0.2),
+                "isi": {"dist": "exponential", "low": 0.505, "mean": 0.2, "high": 0.62},
+            },
+            500,
+            frame_time=1 / 60,
+            rng=3,
+        )
+        iti, isi = schedule.durations("iti"), schedule.durations("isi")
+        self.assertGreaterEqual(iti.min(), 0.105)
+        self.assertLessEqual(iti.max(), 0.2 + 1e-9)
+        self.assertGreaterEqual(isi.min(), 0.505)
+        self.assertLessEqual(isi.max(), 0.62)
+        np.testing.assert_allclose(iti * 60, np.rint(iti * 60))
+
+    def test_invalid_specs(self):
+        from psyflow.utils.jitter import JitterSpec, plan_jitter
+
+        with self.assertRaises(ValueError):
+            JitterSpec("gamma")
+        with self.assertRaises(ValueError):
+            JitterSpec("exponential", low=1.0)
+        with self.assertRaises(ValueError):
+            plan_jitter({"iti": (1, 2)}, 3, conditions=["A"])
+
+    def test_planned_duration_scope(self):
+        from psyflow.utils.jitter import JitterSchedule, planned_duration, planned_jitter
+
+        schedule = JitterSchedule({"iti": np.array([1.0, 2.0])})
+        self.assertIsNone(planned_duration("iti"))
+        with planned_jitter(schedule, 1):
+            self.assertEqual(planned_duration("iti"), 2.0)
+            self.assertIsNone(planned_duration("cue"))
+        self.assertIsNone(planned_duration("iti"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+
+from psyflow.utils.lru import LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_item_limit_evicts_least_recently_used(self):
+        evicted = []
+        cache = LRUCache(2, on_evict=lambda k, v: evicted.append(k))
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)  # "b" is now the oldest
+        cache.put("c", 3)
+        self.assertEqual(evicted, ["b"])
+        self.assertEqual(list(cache), ["a", "c"])
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(
+            cache.stats(), {"items": 2, "bytes": 0, "hits": 1, "misses": 1, "evictions": 1, "pinned": 0}
+        )
+
+    def test_byte_limit_uses_size_of(self):
+        cache = LRUCache(max_bytes=10, size_of=len)
+        cache.put("x", "12345")
+        cache.put("y", "123456")
+        self.assertNotIn("x", cache)
+        self.assertEqual(cache.nbytes, 6)
+        cache.put("y", "1")  # replacement is not an eviction
+        self.assertEqual((cache.nbytes, cache.evictions), (1, 1))
+
+    def test_new_entry_survives_its_own_insertion(self):
+        cache = LRUCache(max_bytes=4)
+        cache.put("small", 1, nbytes=2)
+        evicted = cache.put("big", 2, nbytes=8)
+        self.assertEqual([k for k, _ in evicted], ["small"])
+        self.assertEqual(list(cache), ["big"])
+        cache.put("next", 3, nbytes=1)
+        self.assertEqual(list(cache), ["next"])
+
+    def test_pinned_entries_are_never_evicted(self):
+        evicted = []
+        cache = LRUCache(2, on_evict=lambda k, v: evicted.append(k))
+        cache.pin("fixation")
+        cache.put("fixation", "+")
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("c", 3)
+        self.assertEqual(evicted, ["a", "b"])
+        self.assertEqual(list(cache), ["fixation", "c"])
+        self.assertEqual(cache.pinned, frozenset({"fixation"}))
+        cache.put("d", 4)
+        self.assertEqual(list(cache), ["fixation", "d"])
+        cache.unpin("fixation")
+        cache.put("e", 5)
+        self.assertEqual(list(cache), ["d", "e"])
+
+    def test_peek_discard_and_clear(self):
+        released = []
+        cache = LRUCache(on_evict=lambda k, v: released.append(k))
+        cache.put("a", 1, nbytes=3)
+        cache.put("b", 2, nbytes=4)
+        self.assertEqual(cache.peek("a"), 1)
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(cache.discard("a"), 1)
+        self.assertIsNone(cache.discard("a"))
+        cache.clear()
+        self.assertEqual(released, ["a", "b"])
+        self.assertEqual((len(cache), cache.nbytes), (0, 0))
+
+    def test_rejects_negative_limits(self):
+        with self.assertRaises(ValueError):
+            LRUCache(-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import unittest
+
+import numpy as np
+
+from psyflow.utils.results import ResultStore
+
+
+class TestResultStore(unittest.TestCase):
+    def test_rows_behave_like_dicts(self):
+        store = ResultStore()
+        store.append({"trial_id": 1, "condition": "go", "target_rt": 0.41, "target_hit": True})
+        store.append({"trial_id": 2, "condition": "stop", "target_hit": False})
+
+        self.assertEqual(len(store), 2)
+        self.assertEqual(dict(store[0]), {"trial_id": 1, "condition": "go", "target_rt": 0.41, "target_hit": True})
+        row = store[-1]
+        self.assertEqual(row["condition"], "stop")
+        self.assertNotIn("target_rt", row)
+        self.assertIsNone(row.get("target_rt"))
+        with self.assertRaises(KeyError):
+            row["target_rt"]
+        self.assertIsInstance(store[0]["trial_id"], int)
+        self.assertIsInstance(store[0]["target_hit"], bool)
+
+    def test_row_writes_go_to_columns(self):
+        store = ResultStore([{"trial_id": 1}])
+        store[0]["score"] = 3
+        store[0]["trial_id"] = 7
+        self.assertEqual(store.to_records(), [{"trial_id": 7, "score": 3}])
+        del store[0]["score"]
+        self.assertEqual(store.to_records(), [{"trial_id": 7}])
+
+    def test_types_are_promoted(self):
+        store = ResultStore()
+        store.append({"x": 1, "y": 1})
+        store.append({"x": 2.5, "y": "late"})
+        self.assertEqual(store.column("x").dtype, np.float64)
+        self.assertEqual(store.column("y").dtype, object)
+        self.assertEqual([r["x"] for r in store], [1.0, 2.5])
+        self.assertEqual([r["y"] for r in store], [1, "late"])
+
+    def test_capacity_grows(self):
+        store = ResultStore(capacity=2)
+        for i in range(10):
+            store.append({"i": i})
+        np.testing.assert_array_equal(store.column("i"), np.arange(10))
+        self.assertFalse(store.column("i").flags.writeable)
+
+    def test_extend_from_store_aligns_columns(self):
+        a = ResultStore([{"block": "b1", "rt": 0.3}])
+        b = ResultStore([{"block": "b2", "rt": 1}, {"block": "b2", "hit": True}])
+        a.extend(b)
+        self.assertEqual(
+            a.to_records(),
+            [
+                {"block": "b1", "rt": 0.3},
+                {"block": "b2", "rt": 1.0},
+                {"block": "b2", "hit": True},
+            ],
+        )
+
+    def test_extend_list_target(self):
+        store = ResultStore([{"a": 1}])
+        target = [{"a": 0}]
+        target.extend(store.to_records())
+        self.assertEqual(target, [{"a": 0}, {"a": 1}])
+
+    def test_to_pandas(self):
+        store = ResultStore()
+        store.append({"trial": 1, "hit": True, "rt": 0.5, "cond": "go"})
+        store.append({"trial": 2, "cond": "stop"})
+        df = store.to_pandas()
+        self.assertEqual(list(df.columns), ["trial", "hit", "rt", "cond"])
+        self.assertEqual(df["trial"].tolist(), [1, 2])
+        self.assertEqual(str(df["hit"].dtype), "boolean")
+        self.assertTrue(df["hit"].isna().iloc[1])
+        self.assertTrue(np.isnan(df["rt"].iloc[1]))
+        self.assertEqual(df["cond"].tolist(), ["go", "stop"])
+
+    def test_to_pandas_copies_unless_asked_not_to(self):
+        store = ResultStore([{"trial": 1, "hit": True}, {"trial": 2}])
+        df = store.to_pandas()
+        view = store.to_pandas(copy=False)
+        store[0]["trial"] = 10
+        store[1]["hit"] = False
+        self.assertEqual(df["trial"].tolist(), [1, 2])
+        self.assertTrue(df["hit"].isna().iloc[1])
+        self.assertEqual(view["trial"].tolist(), [10, 2])
+        with self.assertRaises(ValueError):
+            view["trial"].to_numpy()[0] = 0
+
+    def test_none_values_keep_columns_like_list_of_dicts(self):
+        import io
+
+        import pandas as pd
+
+        rows = [
+            {"trial_id": 1, "target_response": None, "target_rt": None, "timeout_trigger": None, "cond": "go"},
+            {"trial_id": 2, "target_response": "f", "target_rt": 0.42, "timeout_trigger": None, "cond": "go"},
+            {"trial_id": 3, "cond": "stop", "target_rt": None},
+        ]
+        store = ResultStore(rows)
+        self.assertEqual([dict(r) for r in store], rows)
+        self.assertIn("timeout_trigger", store[0])
+        self.assertNotIn("timeout_trigger", store[2])
+
+        expected = pd.DataFrame(rows)
+        df = store.to_pandas()
+        self.assertEqual(list(df.columns), list(expected.columns))
+        pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+        out, ref = io.StringIO(), io.StringIO()
+        df.to_csv(out, index=False)
+        expected.to_csv(ref, index=False)
+        self.assertEqual(out.getvalue(), ref.getvalue())
+
+        merged = ResultStore([{"trial_id": 0, "target_rt": 0.3}])
+        merged.extend(store)
+        self.assertEqual(merged.columns, ["trial_id", "target_rt", "target_response", "timeout_trigger", "cond"])
+        self.assertEqual(merged.to_records()[1:], rows)
+
+
+if __name__ == "__main__":
+    unittest.main()
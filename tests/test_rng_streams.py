@@ -0,0 +1,67 @@
+import tempfile
+import unittest
+
+
+class TestRngStreams(unittest.TestCase):
+    def test_same_path_same_stream(self):
+        from psyflow.sim import RngStreams
+
+        a = RngStreams(7).generator("block_0", 3, "cue").uniform(0, 1, size=4)
+        b = RngStreams(7).generator("block_0", 3, "cue").uniform(0, 1, size=4)
+        self.assertEqual(list(a), list(b))
+
+    def test_paths_and_seeds_are_independent(self):
+        from psyflow.sim import RngStreams
+
+        streams = RngStreams(7)
+        draws = {
+            streams.generator("block_0", 3, "cue").random(),
+            streams.generator("block_0", 4, "cue").random(),
+            streams.generator("block_0", 3, "target").random(),
+            streams.generator("block_0", "3", "cue").random(),
+            RngStreams(8).generator("block_0", 3, "cue").random(),
+        }
+        self.assertEqual(len(draws), 5)
+
+    def test_child_is_prefix_of_path(self):
+        from psyflow.sim import RngStreams
+
+        streams = RngStreams(1)
+        self.assertEqual(
+            streams.child("block", "b1").generator(2, "iti").random(),
+            streams.generator("block", "b1", 2, "iti").random(),
+        )
+
+    def test_next_counts_uses_of_a_path(self):
+        from psyflow.sim import RngStreams
+
+        streams = RngStreams(1)
+        first, second = streams.next("duration", 1, "iti").random(), streams.next("duration", 1, "iti").random()
+        self.assertNotEqual(first, second)
+        self.assertEqual(first, RngStreams(1).generator("duration", 1, "iti", 0).random())
+        self.assertEqual(streams.python_rng("r").random(), RngStreams(1).python_rng("r").random())
+
+    def test_active_streams_resolution(self):
+        from psyflow.sim import RngStreams, RuntimeContext, active_rng_streams, rng_streams, runtime_context
+
+        self.assertIsNone(active_rng_streams(fallback=False))
+        self.assertIsInstance(active_rng_streams(), RngStreams)
+
+        session, scoped = RngStreams(1), RngStreams(2)
+        with runtime_context(RuntimeContext(mode="sim", rng_streams=session)):
+            self.assertIs(active_rng_streams(), session)
+            with rng_streams(scoped):
+                self.assertIs(active_rng_streams(), scoped)
+            self.assertIs(active_rng_streams(), session)
+
+    def test_context_from_config_seeds_streams(self):
+        from psyflow.sim import context_from_config
+
+        cfg = {"sim": {"seed": 11, "responder": {"type": "null"}}}
+        with tempfile.TemporaryDirectory() as td:
+            ctx = context_from_config(task_dir=td, config=cfg, mode="sim")
+        self.assertEqual(ctx.rng_streams.seed, 11)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+from collections import Counter
+
+import numpy as np
+
+
+class TestGenerateSequence(unittest.TestCase):
+    def test_no_repeat_keeps_counts(self):
+        from psyflow.utils.sequencing import generate_sequence
+
+        seq, report = generate_sequence(["A", "B", "C"], [100, 100, 100], {"no_repeat": True}, rng=1)
+        self.assertEqual(Counter(seq), {"A": 100, "B": 100, "C": 100})
+        self.assertTrue(all(a != b for a, b in zip(seq, seq[1:])))
+        self.assertEqual(report.method, "constructive")
+        self.assertTrue(report.ok)
+        self.assertGreaterEqual(report.attempts, 1)
+        self.assertGreater(report.elapsed_s, 0)
+
+    def test_max_run_and_min_gap(self):
+        from psyflow.utils.sequencing import check_sequence, generate_sequence
+
+        constraints = {"max_run": 6, "min_gap": {"odd": 4}}
+        seq, _ = generate_sequence(["std", "odd"], [400, 100], constraints, rng=2)
+        self.assertEqual(check_sequence(seq, constraints), {"max_run": 0, "min_gap": 0, "transitions": 0})
+        odd = np.flatnonzero(np.array(seq) == "odd")
+        self.assertGreaterEqual(int(np.diff(odd).min()), 5)
+
+    def test_same_seed_same_sequence(self):
+        from psyflow.utils.sequencing import generate_sequence
+
+        a, _ = generate_sequence(["A", "B"], [10, 10], {"max_run": 2}, rng=5)
+        b, _ = generate_sequence(["A", "B"], [10, 10], {"max_run": 2}, rng=5)
+        self.assertEqual(a, b)
+
+    def test_infeasible_counts_raise(self):
+        from psyflow.utils.sequencing import generate_sequence
+
+        with self.assertRaises(ValueError):
+            generate_sequence(["A", "B"], [5, 1], {"no_repeat": True}, rng=0)
+
+    def test_balanced_transitions(self):
+        from psyflow.utils.sequencing import generate_sequence
+
+        seq, report = generate_sequence(list("ABCD"), [125] * 4, {"transitions": "balanced", "max_run": 3}, rng=3)
+        self.assertEqual(report.method, "eulerian")
+        self.assertEqual(len(seq), 500)
+        pairs = Counter(zip(seq, seq[1:]))
+        self.assertEqual(len(pairs), 16)
+        self.assertLessEqual(max(pairs.values()) - min(pairs.values()), 1)
+        self.assertTrue(report.ok)
+
+    def test_balanced_transitions_keep_requested_counts(self):
+        from psyflow.utils.sequencing import generate_sequence
+
+        cases = [
+            ((10, 10, 10), {}),
+            ((200, 200, 100), {}),
+            ((1, 1, 0), {}),
+            ((60, 30, 0), {"max_run": 4}),
+            ((50, 30, 20), {"no_repeat": True}),
+        ]
+        for counts, extra in cases:
+            for seed in range(5):
+                seq, _ = generate_sequence(["A", "B", "C"], counts, {"transitions": "balanced", **extra}, rng=seed)
+                expected = {lbl: n for lbl, n in zip("ABC", counts) if n}
+                self.assertEqual(Counter(seq), expected, (counts, extra, seed))
+
+    def test_balanced_transitions_follow_count_products(self):
+        from psyflow.utils.sequencing import generate_sequence
+
+        seq, _ = generate_sequence(["A", "B", "C"], (200, 200, 100), {"transitions": "balanced"}, rng=0)
+        pairs = Counter(zip(seq, seq[1:]))
+        for a, na in zip("ABC", (200, 200, 100)):
+            for b, nb in zip("ABC", (200, 200, 100)):
+                self.assertLess(abs(pairs[(a, b)] - na * nb / 500), 2)
+
+    def test_explicit_transition_counts(self):
+        from psyflow.utils.sequencing import generate_sequence
+
+        transitions = {"A": {"A": 1, "B": 2}, "B": {"A": 2, "B": 0}}
+        seq, _ = generate_sequence(["A", "B"], [4, 2], {"transitions": transitions}, rng=4)
+        self.assertEqual(Counter(zip(seq, seq[1:])), {("A", "A"): 1, ("A", "B"): 2, ("B", "A"): 2})
+        with self.assertRaises(ValueError):
+            generate_sequence(["A", "B"], [5, 2], {"transitions": transitions}, rng=4)
+        with self.assertRaises(ValueError):
+            generate_sequence(["A", "B"], [2, 4], {"transitions": transitions}, rng=4)
+
+    def test_check_sequence_counts_violations(self):
+        from psyflow.utils.sequencing import check_sequence
+
+        out = check_sequence(list("AAABAB"), {"max_run": 2, "min_gap": {"B": 2}})
+        self.assertEqual(out["max_run"], 1)
+        self.assertEqual(out["min_gap"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+
+
+class WinStub:
+    def __init__(self):
+        self._calls = []
+
+    def callOnFlip(self, func, *args, **kwargs):
+        self._calls.append((func, args, kwargs))
+
+    def flip(self):
+        calls, self._calls = self._calls, []
+        for func, args, kwargs in calls:
+            func(*args, **kwargs)
+
+
+class TestSessionClock(unittest.TestCase):
+    def test_monotonic_integer_stamps_and_wall_mapping(self):
+        from psyflow.clock import SessionClock
+
+        clock = SessionClock(wall_anchor=1000.0)
+        a = clock.now_ns()
+        b = clock.now_ns()
+        self.assertIsInstance(a, int)
+        self.assertGreaterEqual(b, a)
+        self.assertAlmostEqual(clock.to_wall(1_500_000_000), 1001.5)
+        self.assertTrue(clock.to_utc_iso(0).startswith("1970-01-01T00:16:40"))
+
+    def test_timer_is_relative_to_reset(self):
+        from psyflow.sim.headless import VirtualClock
+
+        clock = VirtualClock(0.01)
+        timer = clock.make_timer()
+        clock.advance_frames(3)
+        timer.reset()
+        clock.advance_frames(2)
+        self.assertAlmostEqual(timer.getTime(), 0.02)
+        self.assertEqual(clock.now_ns(), 50_000_000)
+
+    def test_get_session_clock_follows_runtime_context(self):
+        from psyflow.clock import default_clock
+        from psyflow.sim.context import RuntimeContext, get_session_clock, runtime_context
+        from psyflow.sim.headless import VirtualClock
+
+        self.assertIs(get_session_clock(), default_clock())
+        clock = VirtualClock(0.01)
+        with runtime_context(RuntimeContext(mode="sim", clock=clock)):
+            self.assertIs(get_session_clock(), clock)
+        self.assertIs(get_session_clock(), default_clock())
+
+    def test_trigger_latency_uses_session_clock(self):
+        from psyflow import MockDriver, TriggerEvent, TriggerRuntime
+        from psyflow.sim.context import RuntimeContext, runtime_context
+        from psyflow.sim.headless import VirtualClock
+
+        clock = VirtualClock(0.01, wall_anchor=50.0)
+        events = []
+        rt = TriggerRuntime(MockDriver(print_codes=False), event_logger=events.append)
+        win = WinStub()
+        with runtime_context(RuntimeContext(mode="sim", clock=clock)):
+            rt.emit(TriggerEvent(code=1), when="flip", win=win)
+            clock.advance_frames(2)
+            win.flip()
+        executed = next(e for e in events if e["type"] == "trigger_executed")
+        self.assertEqual(executed["t_planned_ns"], 0)
+        self.assertEqual(executed["t_sent_ns"], 20_000_000)
+        self.assertEqual(executed["latency_ns"], 20_000_000)
+        self.assertAlmostEqual(executed["t_sent"], 50.02)
+
+    def test_mock_driver_stamps_with_session_clock(self):
+        from psyflow import MockDriver, TriggerEvent
+        from psyflow.sim.context import RuntimeContext, runtime_context
+        from psyflow.sim.headless import VirtualClock
+
+        clock = VirtualClock(0.01, wall_anchor=50.0)
+        driver = MockDriver(print_codes=False)
+        with runtime_context(RuntimeContext(mode="sim", clock=clock)):
+            clock.advance_frames(3)
+            driver.send(TriggerEvent(code=1))
+        self.assertAlmostEqual(driver.records[0].t_sent, 50.03)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,6 +9,7 @@ def _normalize_events(events: list[dict]) -> list[dict]:
         rec = dict(ev)
         rec.pop("t", None)
         rec.pop("t_utc", None)
+        rec.pop("t_ns", None)
         out.append(rec)
     return out
 
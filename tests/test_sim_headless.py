@@ -0,0 +1,104 @@
+import tempfile
+import unittest
+
+
+class TestVirtualClock(unittest.TestCase):
+    def test_flip_advances_one_frame_and_runs_callbacks_in_order(self):
+        from psyflow.sim.headless import HeadlessWindow, VirtualClock
+
+        clock = VirtualClock(frame_period=0.01, wall_anchor=1000.0)
+        win = HeadlessWindow(clock)
+        timer = clock.make_timer()
+        seen = []
+
+        win.callOnFlip(timer.reset)
+        win.callOnFlip(lambda: seen.append(("stamp", timer.getTime(), clock.getAbsTime())))
+        t_flip = win.flip()
+
+        self.assertAlmostEqual(t_flip, 0.01)
+        self.assertEqual(seen, [("stamp", 0.0, 1000.01)])
+        self.assertAlmostEqual(win.monitorFramePeriod, 0.01)
+
+        for _ in range(9):
+            win.flip()
+        self.assertEqual(clock.n_frames, 10)
+        self.assertAlmostEqual(timer.getTime(), 0.09)
+
+    def test_callbacks_only_run_once(self):
+        from psyflow.sim.headless import HeadlessWindow, VirtualClock
+
+        win = HeadlessWindow(VirtualClock())
+        calls = []
+        win.callOnFlip(calls.append, 1)
+        win.flip()
+        win.flip()
+        self.assertEqual(calls, [1])
+
+    def test_advance_rejects_negative(self):
+        from psyflow.sim.headless import VirtualClock
+
+        clock = VirtualClock()
+        with self.assertRaises(ValueError):
+            clock.advance_frames(-1)
+        with self.assertRaises(ValueError):
+            VirtualClock(frame_period=0)
+
+    def test_window_delegates_to_inner(self):
+        from psyflow.sim.headless import HeadlessWindow, VirtualClock
+
+        class Inner:
+            units = "deg"
+
+            def __init__(self):
+                self.closed = False
+
+            def close(self):
+                self.closed = True
+
+        inner = Inner()
+        win = HeadlessWindow(VirtualClock(), inner=inner)
+        self.assertEqual(win.units, "deg")
+        win.close()
+        self.assertTrue(inner.closed)
+
+    def test_keyboard_clock_follows_virtual_clock(self):
+        from psyflow.sim.headless import HeadlessKeyboard, HeadlessWindow, VirtualClock
+
+        clock = VirtualClock(frame_period=0.02)
+        win = HeadlessWindow(clock)
+        kb = HeadlessKeyboard(clock)
+        kb.clock.reset()
+        win.flip()
+        win.flip()
+        self.assertAlmostEqual(kb.clock.getTime(), 0.04)
+        self.assertEqual(kb.getKeys(keyList=["space"]), [])
+
+
+class TestHeadlessContext(unittest.TestCase):
+    def test_context_from_config_builds_virtual_clock_when_headless(self):
+        from psyflow.sim import context_from_config
+        from psyflow.sim.headless import VirtualClock
+
+        cfg = {"sim": {"headless": True, "frame_rate": 120, "event_driven": True, "responder": {"type": "null"}}}
+        with tempfile.TemporaryDirectory() as td:
+            ctx = context_from_config(task_dir=td, config=cfg, mode="sim")
+        self.assertTrue(ctx.config.headless)
+        self.assertIsInstance(ctx.clock, VirtualClock)
+        self.assertAlmostEqual(ctx.clock.frame_period, 1.0 / 120)
+        self.assertTrue(ctx.config.event_driven)
+
+    def test_context_from_config_defaults_to_real_clock(self):
+        from psyflow.clock import SessionClock
+        from psyflow.sim import context_from_config
+        from psyflow.sim.headless import VirtualClock
+
+        with tempfile.TemporaryDirectory() as td:
+            ctx = context_from_config(task_dir=td, config={"sim": {"responder": {"type": "null"}}}, mode="sim")
+        self.assertFalse(ctx.config.headless)
+        self.assertFalse(ctx.config.event_driven)
+        self.assertIsInstance(ctx.clock, SessionClock)
+        self.assertNotIsInstance(ctx.clock, VirtualClock)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -120,6 +120,53 @@ class TestTaskLauncher(unittest.TestCase):
             out = readme.read_text(encoding="cp1252")
             self.assertIn("Maturity: piloted", out)
 
+    def test_run_sim_shortcut_without_n_subjects_runs_one_session(self):
+        from psyflow.task_launcher import run_sim_shortcut
+
+        with tempfile.TemporaryDirectory() as td:
+            task_dir = Path(td)
+            (task_dir / "main.py").write_text("print('ok')\n", encoding="utf-8")
+
+            with patch("psyflow.task_launcher.subprocess.run") as run_mock:
+                run_mock.return_value = SimpleNamespace(returncode=0)
+                code = run_sim_shortcut([str(task_dir), "--seed", "7"])
+
+            self.assertEqual(code, 0)
+            cmd = run_mock.call_args[0][0]
+            self.assertEqual(cmd[2:], ["sim", "--seed", "7"])
+
+    @unittest.skipUnless(_HAS_YAML, "pyyaml is not installed")
+    def test_run_sim_shortcut_fans_out_sessions_with_manifest(self):
+        from psyflow.task_launcher import run_sim_shortcut
+
+        main_src = (
+            "import sys, pathlib, yaml\n"
+            "cfg = yaml.safe_load(open(sys.argv[sys.argv.index('--config') + 1], encoding='utf-8'))\n"
+            "sim = cfg['sim']\n"
+            "out = pathlib.Path(sim['output_dir'])\n"
+            "(out / (sim['session_id'] + '.csv')).write_text(str(sim['seed']), encoding='utf-8')\n"
+            "sys.exit(3 if sim['seed'] == 11 else 0)\n"
+        )
+        with tempfile.TemporaryDirectory() as td:
+            task_dir = Path(td)
+            (task_dir / "main.py").write_text(main_src, encoding="utf-8")
+            cfg = task_dir / "config" / "config_scripted_sim.yaml"
+            cfg.parent.mkdir(parents=True, exist_ok=True)
+            cfg.write_text("task:\n  task_name: Demo Task\nsim:\n  seed: 0\n  session_id: fixed\n", encoding="utf-8")
+
+            code = run_sim_shortcut([str(task_dir), "--n-subjects", "3", "--workers", "2", "--seed-base", "10"])
+
+            self.assertEqual(code, 1)
+            root = task_dir / "outputs" / "sim" / "batch_seed10_n3"
+            manifest = json.loads((root / "manifest.json").read_text(encoding="utf-8"))
+            self.assertEqual((manifest["n_sessions"], manifest["n_failed"]), (3, 1))
+            sessions = manifest["sessions"]
+            self.assertEqual([s["seed"] for s in sessions], [10, 11, 12])
+            self.assertEqual([s["returncode"] for s in sessions], [0, 3, 0])
+            self.assertEqual(sessions[0]["session_id"], "sub-sim001_task-demo_task_seed10")
+            for s in sessions:
+                self.assertEqual(s["files"], [str(Path(s["output_dir"]) / f"{s['session_id']}.csv")])
+
     @unittest.skipUnless(_HAS_YAML, "pyyaml is not installed")
     def test_run_qa_shortcut_requires_acceptance_criteria(self):
         from psyflow.task_launcher import run_qa_shortcut
@@ -0,0 +1,35 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from psyflow.task_options import parse_task_run_options
+
+DEFAULTS = {"human": "config.yaml", "qa": "config.yaml", "sim": "config.yaml"}
+
+
+class TestTaskRunOptions(unittest.TestCase):
+    def test_resume_checkpoint_option(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            (root / "config.yaml").write_text("{}", encoding="utf-8")
+            ckpt = root / "sub-1.checkpoint.jsonl"
+            ckpt.write_text("", encoding="utf-8")
+
+            options = parse_task_run_options(task_root=root, description="x", default_config_by_mode=DEFAULTS, argv=["qa"])
+            self.assertEqual(options.mode, "qa")
+            self.assertIsNone(options.resume_path)
+            options = parse_task_run_options(
+                task_root=root, description="x", default_config_by_mode=DEFAULTS, argv=["--resume", str(ckpt)]
+            )
+            self.assertEqual(options.resume_path, ckpt)
+            with self.assertRaises(SystemExit):
+                parse_task_run_options(
+                    task_root=root,
+                    description="x",
+                    default_config_by_mode=DEFAULTS,
+                    argv=["--resume", str(root / "missing.jsonl")],
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""Tests for psyflow.TrialTimeline."""
+
+import unittest
+
+try:
+    from psychopy import visual
+    _HAS_PSYCHOPY = True
+except ImportError:
+    _HAS_PSYCHOPY = False
+
+if _HAS_PSYCHOPY:
+    from psyflow.TrialTimeline import StageSpec, TrialTimeline
+    from psyflow.sim.context import RuntimeContext, runtime_context
+    from psyflow.sim.contracts import Action
+    from psyflow.sim.headless import HeadlessKeyboard, HeadlessWindow, VirtualClock
+
+    class _Stim(visual.BaseVisualStim):
+        """Visual stimulus stand-in that only counts draws."""
+
+        def __init__(self):
+            self.n_draws = 0
+
+        def draw(self, win=None):
+            self.n_draws += 1
+
+
+class _KeyResponder:
+    def __init__(self, key, rt_s):
+        self.key = key
+        self.rt_s = rt_s
+
+    def act(self, obs):
+        return Action(key=self.key, rt_s=self.rt_s)
+
+
+@unittest.skipUnless(_HAS_PSYCHOPY, "requires psychopy")
+class TestTrialTimeline(unittest.TestCase):
+    def _run(self, timeline_stages, responder=None):
+        clock = VirtualClock(frame_period=0.01, wall_anchor=1000.0)
+        ctx = RuntimeContext(mode="sim" if responder else "human", responder=responder, clock=clock)
+        with runtime_context(ctx):
+            win = HeadlessWindow(clock)
+            timeline = TrialTimeline(win, HeadlessKeyboard(clock), stages=timeline_stages)
+            timeline.run()
+        return timeline, clock
+
+    def test_displays_run_back_to_back(self):
+        fix, blank = _Stim(), _Stim()
+        timeline, clock = self._run([
+            StageSpec("fixation", stimuli=[fix], duration=0.05),
+            StageSpec("iti", stimuli=[blank], duration=0.03),
+        ])
+        state = timeline.state
+        self.assertEqual(clock.n_frames, 8)
+        self.assertEqual((fix.n_draws, blank.n_draws), (5, 3))
+        self.assertAlmostEqual(state["fixation_close_time"], 0.04)
+        # The iti onset is the flip right after the last fixation frame.
+        self.assertAlmostEqual(state["iti_onset_time_global"] - state["fixation_onset_time_global"], 0.05)
+        self.assertAlmostEqual(state["iti_duration"], 0.03)
+
+    def test_response_ends_stage_and_selects_branch(self):
+        target, hit, miss = _Stim(), _Stim(), _Stim()
+        responded = lambda state: state.get("target_response") is not None  # noqa: E731
+        timeline, _ = self._run(
+            [
+                StageSpec("target", stimuli=[target], duration=0.1, keys=["f", "j"], correct_keys=["f"],
+                          context={"trial_id": 1}),
+                StageSpec("feedback", stimuli=[hit], duration=0.02, when=responded),
+                StageSpec("feedback", stimuli=[miss], duration=0.02, when=lambda s: not responded(s)),
+            ],
+            responder=_KeyResponder("f", 0.025),
+        )
+        state = timeline.state
+        self.assertEqual(state["target_response"], "f")
+        self.assertTrue(state["target_hit"])
+        self.assertAlmostEqual(state["target_rt"], 0.025)
+        self.assertEqual(state["target_phase"], "target")
+        self.assertEqual((hit.n_draws, miss.n_draws), (2, 0))
+        self.assertIs(timeline.stage("feedback").stimuli[0], hit)
+        # Response registered on the 3rd flip after onset; feedback onset is the next flip.
+        self.assertAlmostEqual(state["feedback_onset_time_global"] - state["target_onset_time_global"], 0.04)
+
+    def test_timeout_records_no_response(self):
+        timeline, clock = self._run(
+            [StageSpec("target", stimuli=[_Stim()], duration=0.05, keys=["space"])],
+            responder=_KeyResponder(None, None),
+        )
+        self.assertEqual(clock.n_frames, 5)
+        self.assertFalse(timeline.state["target_key_press"])
+        self.assertAlmostEqual(timeline.state["target_close_time"], 0.04)
+
+
+if __name__ == "__main__":
+    unittest.main()
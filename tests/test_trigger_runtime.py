@@ -47,6 +47,52 @@ class TestTriggerRuntime(unittest.TestCase):
         self.assertIsNotNone(executed.get("t_flip"))
         self.assertGreaterEqual(float(executed.get("t_sent")), float(planned.get("t_planned")))
 
+    def test_low_latency_defers_records_until_flush(self):
+        from psyflow import TriggerEvent, TriggerRuntime, MockDriver
+
+        events = []
+        driver = MockDriver(print_codes=False)
+        rt = TriggerRuntime(driver, event_logger=events.append, low_latency=True)
+        win = WinStub()
+
+        rt.emit(TriggerEvent(name="onset", code=3, meta={"kind": "onset"}), when="flip", win=win, wait=False)
+        rt.emit(TriggerEvent(name="resp", code=4), when="now")
+        win.flip()
+        self.assertEqual(events, [])
+        self.assertEqual(len(driver.records), 2)
+
+        self.assertEqual(rt.flush_audit(), 4)
+        types = [(e["type"], e["code"]) for e in events]
+        self.assertEqual(
+            types,
+            [("trigger_planned", 3), ("trigger_planned", 4), ("trigger_executed", 4), ("trigger_executed", 3)],
+        )
+        onset = next(e for e in events if e["type"] == "trigger_executed" and e["code"] == 3)
+        self.assertEqual(onset["event_name"], "onset")
+        self.assertEqual(onset["meta"], {"kind": "onset"})
+        self.assertIsNotNone(onset["t_flip"])
+        self.assertGreaterEqual(onset["t_sent"], onset["t_planned"])
+        self.assertEqual(rt.flush_audit(), 0)
+
+    def test_low_latency_overflow_grows_buffer_and_close_flushes(self):
+        from psyflow import TriggerEvent, TriggerRuntime, MockDriver
+
+        events = []
+        rt = TriggerRuntime(MockDriver(print_codes=False), event_logger=events.append, low_latency=True, audit_capacity=3)
+        for code in range(1, 4):
+            rt.emit(TriggerEvent(code=code), when="now")
+        self.assertEqual(rt.audit_overflows, 1)
+        self.assertEqual(events, [])  # nothing serialized on the emit path
+        rt.close()
+        executed = [e["code"] for e in events if e["type"] == "trigger_executed"]
+        self.assertEqual(executed, [1, 2, 3])
+
+    def test_initialize_triggers_reads_low_latency_policy(self):
+        from psyflow.io import initialize_triggers
+
+        rt = initialize_triggers({"trigger_policy_config": {"low_latency": True}}, mock=True)
+        self.assertTrue(rt.low_latency)
+
 
 if __name__ == "__main__":
     unittest.main()
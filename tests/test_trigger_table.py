@@ -0,0 +1,59 @@
+import json
+import unittest
+
+from psyflow.io.events import TriggerEvent
+from psyflow.io.table import TriggerTable
+
+
+class TestTriggerTable(unittest.TestCase):
+    def test_mapping_behaviour_and_preencoded_payloads(self):
+        table = TriggerTable({"fix": 20, "resp": 31, "unused": None}, prefix=[1, 225, 1, 0])
+        self.assertEqual(table.get("fix"), 20)
+        self.assertIsNone(table.get("unused"))
+        self.assertIsNone(table.get("missing"))
+        self.assertEqual(dict(table), {"fix": 20, "resp": 31, "unused": None})
+        self.assertEqual(table.payload_for("resp"), bytes([1, 225, 1, 0, 31]))
+        self.assertIsNone(table.payload_for("unused"))
+        self.assertEqual(table.name_for(20), "fix")
+        # Same object every time: nothing is allocated per send.
+        self.assertIs(table.encode(TriggerEvent(code=20)), table.encode(TriggerEvent(code=20)))
+        self.assertEqual(table.encode(TriggerEvent(payload="ab")), b"ab")
+        self.assertIsNone(table.encode(TriggerEvent()))
+
+    def test_validation_happens_at_construction(self):
+        with self.assertRaisesRegex(ValueError, "Duplicate trigger code 5"):
+            TriggerTable({"a": 5, "b": 5})
+        with self.assertRaises(ValueError):
+            TriggerTable({"a": 256})
+        with self.assertRaises(ValueError):
+            TriggerTable({"a": True})
+        with self.assertRaises(ValueError):
+            TriggerTable({"a": 1}, prefix=[300])
+        with self.assertRaises(ValueError):
+            TriggerTable({}).payload(-1)
+
+    def test_immutable(self):
+        table = TriggerTable({"a": 1})
+        with self.assertRaises(TypeError):
+            table["a"] = 2
+        with self.assertRaises(AttributeError):
+            table.prefix = (9,)
+
+    def test_initialize_triggers_attaches_table_and_runtime_resolves_names(self):
+        from psyflow.io import TriggerTable, initialize_triggers
+
+        cfg = {"trigger_config": {"exp_onset": 1, "exp_end": 2}, "trigger_driver_config": {"prefix": []}}
+        rt = initialize_triggers(cfg, mock=True)
+        rt.driver.print_codes = False
+        self.assertIsInstance(rt.table, TriggerTable)
+        rt.send("exp_end")
+        rt.send("not_configured")
+        self.assertEqual([r.event.code for r in rt.driver.records], [2])
+        self.assertEqual(json.dumps(dict(rt.table)), '{"exp_onset": 1, "exp_end": 2}')
+
+        with self.assertRaises(ValueError):
+            initialize_triggers({"trigger_config": {"a": 1, "b": 1}}, mock=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+from psyflow.utils.tts import EdgeTTSBackend, TTSBackend, TTSRequest, synthesize_batch, voice_filename
+
+
+class FakeBackend:
+    name = "fake"
+    suffix = ".wav"
+
+    def __init__(self, fail_on=()):
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self.fail_on = set(fail_on)
+
+    async def synthesize(self, text, voice, rate, path):
+        self.calls.append(text)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            Path(path).write_bytes(b"partial")
+            if text in self.fail_on:
+                raise RuntimeError("offline")
+            Path(path).write_bytes(f"{voice}|{rate}|{text}".encode("utf-8"))
+        finally:
+            self.active -= 1
+
+
+class TestSynthesizeBatch(unittest.TestCase):
+    def test_runs_concurrently_within_limit(self):
+        backend = FakeBackend()
+        reqs = [TTSRequest(f"k{i}", f"text {i}", "v") for i in range(8)]
+        with tempfile.TemporaryDirectory() as td:
+            results = synthesize_batch(reqs, backend=backend, out_dir=td, max_concurrency=3)
+            self.assertEqual(list(results), [f"k{i}" for i in range(8)])
+            self.assertEqual(backend.peak, 3)
+            self.assertTrue(all(r.ok and not r.cached for r in results.values()))
+            self.assertEqual(Path(results["k2"].path).read_text(encoding="utf-8"), "v|+0%|text 2")
+
+    def test_files_are_content_addressed(self):
+        backend = FakeBackend()
+        with tempfile.TemporaryDirectory() as td:
+            first = synthesize_batch([TTSRequest("intro", "Hello", "v")], backend=backend, out_dir=td)["intro"]
+            again = synthesize_batch([TTSRequest("intro", "Hello", "v")], backend=backend, out_dir=td)["intro"]
+            edited = synthesize_batch([TTSRequest("intro", "Hello!", "v")], backend=backend, out_dir=td)["intro"]
+            faster = synthesize_batch([TTSRequest("intro", "Hello", "v", "+20%")], backend=backend, out_dir=td)["intro"]
+
+            self.assertTrue(again.cached)
+            self.assertEqual(again.path, first.path)
+            self.assertNotEqual(edited.path, first.path)
+            self.assertNotEqual(faster.path, first.path)
+            self.assertEqual(backend.calls, ["Hello", "Hello!", "Hello"])
+            self.assertTrue(Path(first.path).name.startswith("intro-"))
+
+            synthesize_batch([TTSRequest("intro", "Hello", "v")], backend=backend, out_dir=td, overwrite=True)
+            self.assertEqual(len(backend.calls), 4)
+
+    def test_failures_are_reported_without_partial_files(self):
+        backend = FakeBackend(fail_on={"bad"})
+        reqs = [TTSRequest("a", "good", "v"), TTSRequest("b", "bad", "v")]
+        with tempfile.TemporaryDirectory() as td:
+            results = synthesize_batch(reqs, backend=backend, out_dir=td)
+            self.assertTrue(results["a"].ok)
+            self.assertIn("offline", results["b"].error)
+            self.assertFalse(Path(results["b"].path).exists())
+            self.assertEqual(sorted(p.name for p in Path(td).iterdir()), [Path(results["a"].path).name])
+
+    def test_duplicate_keys_rejected(self):
+        with self.assertRaises(ValueError):
+            synthesize_batch([TTSRequest("a", "x", "v"), TTSRequest("a", "y", "v")], backend=FakeBackend())
+
+    def test_backend_protocol(self):
+        self.assertIsInstance(FakeBackend(), TTSBackend)
+        self.assertIsInstance(EdgeTTSBackend(), TTSBackend)
+        name = voice_filename(TTSRequest("instr/中文 1", "t", "v"), EdgeTTSBackend())
+        self.assertRegex(name, r"^instr_1-[0-9a-f]{16}\.mp3$")
+
+
+if __name__ == "__main__":
+    unittest.main()